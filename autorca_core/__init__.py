@@ -9,13 +9,50 @@ and recommend remediation steps.
 __version__ = "0.2.0"
 __author__ = "Nik Kale"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from autorca_core.model.events import Event, LogEvent, MetricPoint, Span
 from autorca_core.model.graph import Service, Dependency, IncidentNode
-from autorca_core.reasoning.loop import run_rca, RCARunResult
-from autorca_core.reasoning.llm import AnthropicLLM, DummyLLM
-from autorca_core.logging import configure_logging, get_logger
-from autorca_core.config import ThresholdConfig
-from autorca_core.validation import IngestionLimits, ValidationError
+
+# Heavier entry points (the reasoning loop, LLM clients, logging setup) are
+# resolved on first attribute access (PEP 562) so that importing the package,
+# e.g. for `autorca --help`, does not pay for modules it never touches.
+_LAZY = {
+    "run_rca": "autorca_core.reasoning.loop",
+    "RCARunResult": "autorca_core.reasoning.loop",
+    "AnthropicLLM": "autorca_core.reasoning.llm",
+    "AsyncAnthropicLLM": "autorca_core.reasoning.llm",
+    "DummyLLM": "autorca_core.reasoning.llm",
+    "CachedLLM": "autorca_core.reasoning.llm",
+    "configure_logging": "autorca_core.logging",
+    "get_logger": "autorca_core.logging",
+    "ThresholdConfig": "autorca_core.config",
+    "IngestionLimits": "autorca_core.validation",
+    "ValidationError": "autorca_core.validation",
+}
+
+if TYPE_CHECKING:
+    from autorca_core.reasoning.loop import run_rca, RCARunResult
+    from autorca_core.reasoning.llm import AnthropicLLM, AsyncAnthropicLLM, DummyLLM, CachedLLM
+    from autorca_core.logging import configure_logging, get_logger
+    from autorca_core.config import ThresholdConfig
+    from autorca_core.validation import IngestionLimits, ValidationError
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "Event",
@@ -28,7 +65,9 @@ __all__ = [
     "run_rca",
     "RCARunResult",
     "AnthropicLLM",
+    "AsyncAnthropicLLM",
     "DummyLLM",
+    "CachedLLM",
     "configure_logging",
     "get_logger",
     "ThresholdConfig",
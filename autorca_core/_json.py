@@ -0,0 +1,53 @@
+"""
+JSON backend: orjson when installed, the standard library otherwise.
+
+Install the ``fast`` extra (``pip install "autorca-core[fast]"``) to parse
+JSON inputs (and write structured log lines) with orjson. Both backends
+raise JSONDecodeError (orjson's error subclasses the standard library
+one), so callers can catch it either way.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+# Whether loads() accepts any buffer (memoryview, mmap slice) besides str/bytes
+DECODES_BUFFERS = orjson is not None
+
+if orjson is not None:
+
+    def loads(data: Union[str, bytes, memoryview]) -> Any:
+        """Deserialize JSON text or UTF-8 bytes (any buffer, see DECODES_BUFFERS)."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to compact JSON text (non-JSON values via str())."""
+        return orjson.dumps(obj, default=str).decode("utf-8")
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON, indented by two spaces if ``indent``."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+
+else:
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Deserialize JSON text or UTF-8 bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to compact JSON text (non-JSON values via str())."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON, indented by two spaces if ``indent``."""
+        if indent:
+            text = json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+        else:
+            text = dumps(obj)
+        return text.encode("utf-8")
@@ -0,0 +1,21 @@
+"""
+Caching layer: Reuse RCA results and LLM responses across runs.
+"""
+
+from autorca_core.cache.exact import (
+    ExactMatchCache,
+    data_cache_key,
+    run_cache_key,
+    default_cache_dir,
+)
+from autorca_core.cache.responses import DiskResponseCache
+from autorca_core.cache.semantic import SemanticCache
+
+__all__ = [
+    "DiskResponseCache",
+    "ExactMatchCache",
+    "SemanticCache",
+    "data_cache_key",
+    "run_cache_key",
+    "default_cache_dir",
+]
@@ -0,0 +1,173 @@
+"""
+Exact-match result cache: Reuse RCA results for identical runs.
+
+Results are stored in a small SQLite database keyed on a SHA-256 digest of
+everything that determines the outcome of a run: the symptom, the input files
+(path, size and modification time) and the analysis settings.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from autorca_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory (``AUTORCA_CACHE_DIR`` or ``~/.cache/autorca``)."""
+    return Path(os.environ.get("AUTORCA_CACHE_DIR") or Path.home() / ".cache" / "autorca")
+
+
+def fingerprint_paths(paths: Iterable[Optional[str]]) -> List[List[Any]]:
+    """
+    Describe input files by path, size and modification time.
+
+    Directories are expanded to the files they contain, so adding or touching
+    any input file changes the fingerprint.
+
+    Args:
+        paths: Input files or directories (None entries are skipped)
+
+    Returns:
+        Sorted list of ``[path, size, mtime_ns]`` entries
+    """
+    entries = []
+    for path in paths:
+        if not path:
+            continue
+        root = Path(path).resolve()
+        files = sorted(p for p in root.rglob("*") if p.is_file()) if root.is_dir() else [root]
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                entries.append([str(file_path), None, None])
+                continue
+            entries.append([str(file_path), stat.st_size, stat.st_mtime_ns])
+    return sorted(entries)
+
+
+def data_cache_key(paths: Iterable[Optional[str]], **settings: Any) -> str:
+    """
+    Build the key of a run's inputs: the input files and the analysis settings.
+
+    Args:
+        paths: Input files or directories
+        **settings: Anything else that affects the result (window, thresholds, ...).
+            Values must be JSON-serializable; datetimes are stored by isoformat().
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {"files": fingerprint_paths(paths), "settings": settings}
+    return _sha256(payload)
+
+
+def run_cache_key(
+    primary_symptom: str,
+    paths: Iterable[Optional[str]],
+    **settings: Any,
+) -> str:
+    """
+    Build the cache key for an RCA run: its symptom plus data_cache_key().
+
+    Args:
+        primary_symptom: The symptom being investigated
+        paths: Input files or directories
+        **settings: See data_cache_key()
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return _sha256({"symptom": primary_symptom, "data": data_cache_key(paths, **settings)})
+
+
+def _sha256(payload: Dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ExactMatchCache:
+    """
+    SQLite-backed cache of pickled RCA results.
+
+    The database only ever holds results written by this process's user, so
+    unpickling is as trusted as the cache directory itself.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Database file (defaults to ``runs.db`` in default_cache_dir())
+        """
+        self.path = Path(path) if path else default_cache_dir() / "runs.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "key TEXT PRIMARY KEY, pickled_result BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT pickled_result FROM runs WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            # Stale entry from an incompatible version: drop it and treat as a miss
+            logger.warning(f"Discarding unreadable cache entry: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, replacing any previous entry."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO runs (key, pickled_result, created_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), time.time()),
+        )
+        self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        self._conn.execute("DELETE FROM runs WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def clear(self) -> int:
+        """
+        Remove every cached entry.
+
+        Returns:
+            Number of entries removed
+        """
+        count = self._conn.execute("DELETE FROM runs").rowcount
+        self._conn.commit()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of entries and the database path."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+        return {"entries": count, "path": str(self.path)}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ExactMatchCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
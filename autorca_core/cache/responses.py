@@ -0,0 +1,107 @@
+"""
+LLM response cache: Reuse model answers to identical requests across runs.
+
+Each response is stored as a small JSON file named after a SHA-256 digest of
+the complete request (model, token limit, system prompt and messages), so
+rerunning an analysis on the same data while tuning prompts or rules only
+calls the API for requests that actually changed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from autorca_core.cache.exact import default_cache_dir
+from autorca_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MODES = ("readwrite", "read", "write")
+
+
+def response_cache_key(request: Dict[str, Any]) -> str:
+    """Return the hex SHA-256 digest of a canonical encoding of ``request``."""
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class DiskResponseCache:
+    """
+    Directory of cached LLM responses, one JSON file per request.
+
+    Files are grouped by model and written atomically (to a temporary file
+    that is then renamed), so concurrent writers from several threads or
+    processes never leave a partial entry behind.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, mode: str = "readwrite"):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            path: Cache directory (defaults to ``responses`` in default_cache_dir())
+            mode: ``"readwrite"`` to reuse and store responses, ``"read"`` to
+                only reuse them, or ``"write"`` to always call the model and
+                refresh the stored responses
+        """
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {', '.join(_MODES)}, got {mode!r}")
+        self.path = Path(path) if path else default_cache_dir() / "responses"
+        self.mode = mode
+
+    def _entry_path(self, model: str, key: str) -> Path:
+        # Model names may contain characters that are awkward in file names
+        return self.path / model.replace("/", "_").replace(os.sep, "_") / f"{key}.json"
+
+    def get(self, request: Dict[str, Any]) -> Optional[str]:
+        """Return the cached response text for ``request``, or None on a miss."""
+        if self.mode == "write":
+            return None
+        entry_path = self._entry_path(request["model"], response_cache_key(request))
+        try:
+            with open(entry_path, encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable response cache entry {entry_path}: {e}")
+            return None
+
+    def set(self, request: Dict[str, Any], text: str) -> None:
+        """Store the response ``text`` for ``request`` (unless the cache is read-only)."""
+        if self.mode == "read":
+            return
+        entry_path = self._entry_path(request["model"], response_cache_key(request))
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"text": text, "created_at": time.time()}, f, ensure_ascii=False)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # A full or read-only disk only costs the cache, never the run
+            logger.warning(f"Could not store response cache entry {entry_path}: {e}")
+
+    def clear(self) -> int:
+        """
+        Remove every cached response.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for entry_path in self.path.glob("*/*.json"):
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
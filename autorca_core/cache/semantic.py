@@ -0,0 +1,183 @@
+"""
+Semantic result cache: Reuse RCA results for paraphrased symptoms.
+
+The exact-match cache misses when the same incident is re-run with a reworded
+symptom ("API 500s" vs "checkout returning HTTP 500"). This cache stores an
+embedding of each symptom next to the result and serves a hit when a new
+symptom is similar enough *and* the input data and settings are identical.
+
+Embeddings come from sentence-transformers (optional dependency, loaded on
+first use), or from any ``embed`` callable passed in.
+"""
+
+import math
+import os
+import pickle
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from autorca_core.cache.exact import default_cache_dir
+from autorca_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.9
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _load_embedder(model_name: str) -> Embedder:
+    """Create a sentence-transformers embedder."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "Semantic caching requires sentence-transformers. "
+            "Install with: pip install 'autorca-core[semantic]'"
+        )
+    model = SentenceTransformer(model_name)
+    return lambda text: model.encode(text).tolist()
+
+
+def _threshold_from_env() -> float:
+    """Read AUTORCA_SEMANTIC_THRESHOLD, falling back to the default if it is invalid."""
+    value = os.getenv("AUTORCA_SEMANTIC_THRESHOLD")
+    if value is None:
+        return DEFAULT_THRESHOLD
+    try:
+        threshold = float(value)
+    except ValueError:
+        threshold = math.nan
+    if not 0.0 <= threshold <= 1.0:
+        logger.warning(
+            f"Ignoring AUTORCA_SEMANTIC_THRESHOLD={value!r} (expected a number between 0 and 1); "
+            f"using {DEFAULT_THRESHOLD}"
+        )
+        return DEFAULT_THRESHOLD
+    return threshold
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else list(vector)
+
+
+class SemanticCache:
+    """
+    SQLite-backed cache of RCA results keyed by symptom similarity.
+
+    Only entries whose data key matches exactly are compared, so each lookup
+    scores a handful of vectors (the runs over one dataset) with plain dot
+    products on L2-normalized embeddings.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        threshold: Optional[float] = None,
+        embed: Optional[Embedder] = None,
+        model_name: str = DEFAULT_MODEL,
+    ):
+        """
+        Open (or create) the semantic cache.
+
+        Args:
+            path: Database file (defaults to ``semantic.db`` in default_cache_dir())
+            threshold: Minimum cosine similarity for a hit (defaults to the
+                AUTORCA_SEMANTIC_THRESHOLD environment variable, or 0.9)
+            embed: Optional embedding function; defaults to sentence-transformers
+            model_name: sentence-transformers model used when ``embed`` is not given
+        """
+        if threshold is None:
+            threshold = _threshold_from_env()
+        self.threshold = threshold
+        self.model_name = model_name
+        self._embed = embed
+
+        self.path = Path(path) if path else default_cache_dir() / "semantic.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "id INTEGER PRIMARY KEY, data_key TEXT NOT NULL, symptom TEXT NOT NULL, "
+            "embedding BLOB NOT NULL, pickled_result BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS runs_data_key ON runs (data_key)")
+        self._conn.commit()
+
+    def _embedding(self, symptom: str) -> List[float]:
+        if self._embed is None:
+            self._embed = _load_embedder(self.model_name)
+        return _normalize(self._embed(symptom))
+
+    def get(self, symptom: str, data_key: str) -> Optional[Any]:
+        """
+        Return the result of the most similar cached run over the same data.
+
+        Args:
+            symptom: Symptom of the new run
+            data_key: Exact key of the inputs and settings (see data_cache_key())
+
+        Returns:
+            Cached value, or None if no run over this data is similar enough
+        """
+        rows = self._conn.execute(
+            "SELECT embedding, pickled_result FROM runs WHERE data_key = ?", (data_key,)
+        ).fetchall()
+        if not rows:
+            return None
+
+        query = self._embedding(symptom)
+        best_score, best_blob = -1.0, None
+        for embedding_blob, result_blob in rows:
+            score = sum(a * b for a, b in zip(query, array("f", embedding_blob)))
+            if score > best_score:
+                best_score, best_blob = score, result_blob
+
+        if best_score < self.threshold:
+            return None
+        try:
+            return pickle.loads(best_blob)
+        except Exception:
+            return None
+
+    def set(self, symptom: str, data_key: str, value: Any) -> None:
+        """Store ``value`` for ``symptom`` over the data identified by ``data_key``."""
+        embedding = array("f", self._embedding(symptom)).tobytes()
+        self._conn.execute(
+            "INSERT INTO runs (data_key, symptom, embedding, pickled_result, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                data_key,
+                symptom,
+                embedding,
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def clear(self) -> int:
+        """
+        Remove every cached entry.
+
+        Returns:
+            Number of entries removed
+        """
+        count = self._conn.execute("DELETE FROM runs").rowcount
+        self._conn.commit()
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "SemanticCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
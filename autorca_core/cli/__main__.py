@@ -7,13 +7,19 @@ Usage:
 """
 
 import sys
-import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from autorca_core.reasoning.loop import run_rca, run_rca_from_files, DataSourcesConfig
-from autorca_core.outputs.reports import generate_markdown_report, save_report
-from autorca_core.logging import configure_logging
+from autorca_core.logging import configure_logging, get_logger
+
+# The analysis, report and cache modules (and argparse itself) are imported by
+# the commands that use them, so `autorca quickstart` and `autorca mcp-server`
+# start without building the full parser or importing the whole package.
+if TYPE_CHECKING:
+    from autorca_core.reasoning.loop import RCARunResult
+
+logger = get_logger(__name__)
 
 
 def run_mcp_server():
@@ -27,8 +33,50 @@ def run_mcp_server():
         sys.exit(1)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main CLI entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Fast path for the commands that take no options
+    if argv == ["quickstart"]:
+        configure_logging(level="INFO")
+        run_quickstart()
+        return
+    if argv == ["mcp-server"]:
+        configure_logging(level="INFO")
+        run_mcp_server()
+        return
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Configure logging
+    if hasattr(args, 'quiet') and args.quiet:
+        configure_logging(level="CRITICAL")
+    elif hasattr(args, 'log_level'):
+        configure_logging(level=args.log_level)
+    else:
+        configure_logging(level="INFO")
+
+    if args.command == "quickstart":
+        run_quickstart(use_cache=not args.no_cache)
+    elif args.command == "run":
+        run_custom_rca(args)
+    elif args.command == "mcp-server":
+        run_mcp_server()
+    elif args.command == "cache" and args.cache_command:
+        run_cache_command(args)
+    elif args.command == "cache":
+        parser.parse_args(["cache", "--help"])
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+def _build_parser():
+    """Build the argparse command tree."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="autorca",
         description="AutoRCA-Core: Agentic Root Cause Analysis for Autonomous Reliability & Ops",
@@ -42,7 +90,7 @@ def main():
         "quickstart",
         help="Run quickstart example with synthetic data",
     )
-    
+
     # MCP server command
     mcp_parser = subparsers.add_parser(
         "mcp-server",
@@ -60,6 +108,11 @@ def main():
         action="store_true",
         help="Suppress all logging output",
     )
+    quickstart_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and re-run the analysis",
+    )
 
     # Run command
     run_parser = subparsers.add_parser(
@@ -129,30 +182,124 @@ def main():
         action="store_true",
         help="Suppress all logging output",
     )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and re-run the analysis",
+    )
+    run_parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Also reuse cached results for similarly worded symptoms "
+             "(requires autorca-core[semantic])",
+    )
 
-    args = parser.parse_args()
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Manage the local RCA result cache",
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command")
+    cache_subparsers.add_parser(
+        "clear", help="Remove all cached RCA results and LLM responses"
+    )
 
-    # Configure logging
-    if hasattr(args, 'quiet') and args.quiet:
-        configure_logging(level="CRITICAL")
-    elif hasattr(args, 'log_level'):
-        configure_logging(level=args.log_level)
-    else:
-        configure_logging(level="INFO")
+    return parser
 
-    if args.command == "quickstart":
-        run_quickstart()
-    elif args.command == "run":
-        run_custom_rca(args)
-    elif args.command == "mcp-server":
-        run_mcp_server()
-    else:
-        parser.print_help()
-        sys.exit(1)
 
+def run_cache_command(args):
+    """Run a cache management subcommand."""
+    from autorca_core.cache import DiskResponseCache, ExactMatchCache, SemanticCache
 
-def run_quickstart():
+    if args.cache_command == "clear":
+        with ExactMatchCache() as cache:
+            removed = cache.clear()
+        with SemanticCache() as semantic_cache:
+            removed += semantic_cache.clear()
+        responses = DiskResponseCache().clear()
+        print(
+            f"Removed {removed} cached RCA result(s) and {responses} LLM response(s) "
+            f"from {cache.path.parent}"
+        )
+
+
+def _run_cached(
+    use_cache: bool,
+    symptom: str,
+    paths: List[Optional[str]],
+    settings: Dict[str, Any],
+    compute: Callable[[], "RCARunResult"],
+    semantic: bool = False,
+) -> "RCARunResult":
+    """
+    Return the cached result for an RCA run, computing and storing it on a miss.
+
+    The exact-match cache is consulted first. With ``semantic`` enabled, a run
+    over identical data whose symptom is worded similarly is also reused.
+    Cache failures (unwritable directory, corrupt database, missing optional
+    packages) never fail the run; the analysis simply runs uncached.
+    """
+    if not use_cache:
+        return compute()
+
+    import sqlite3
+    from autorca_core import __version__
+    from autorca_core.config import ThresholdConfig
+    from autorca_core.cache import ExactMatchCache, SemanticCache, data_cache_key, run_cache_key
+
+    settings = dict(settings, version=__version__, thresholds=ThresholdConfig().to_dict())
+    try:
+        cache = ExactMatchCache()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Result cache unavailable, running uncached: {e}")
+        return compute()
+
+    with cache:
+        key = run_cache_key(symptom, paths, **settings)
+        try:
+            result = cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache lookup failed: {e}")
+            result = None
+        if result is not None:
+            logger.info("Using cached RCA result (pass --no-cache to re-run)")
+            return result
+
+        semantic_cache = None
+        data_key = data_cache_key(paths, **settings)
+        if semantic:
+            try:
+                semantic_cache = SemanticCache()
+                result = semantic_cache.get(symptom, data_key)
+            except (ImportError, OSError, sqlite3.Error) as e:
+                logger.warning(f"Semantic cache unavailable: {e}")
+                if semantic_cache is not None:
+                    semantic_cache.close()
+                semantic_cache = None
+            if result is not None:
+                logger.info("Using cached RCA result for a similar symptom")
+                semantic_cache.close()
+                return result
+
+        result = compute()
+        try:
+            cache.set(key, result)
+            if semantic_cache is not None:
+                semantic_cache.set(symptom, data_key, result)
+        except (ImportError, sqlite3.Error) as e:
+            logger.warning(f"Failed to cache RCA result: {e}")
+        finally:
+            if semantic_cache is not None:
+                semantic_cache.close()
+        return result
+
+
+def run_quickstart(use_cache: bool = True):
     """Run the quickstart example with bundled synthetic data."""
+    import asyncio
+    from autorca_core.reasoning.loop import arun_rca_from_files
+    from autorca_core.outputs.reports import generate_markdown_report
+
     print("=" * 80)
     print("AutoRCA-Core Quickstart Example")
     print("=" * 80)
@@ -178,11 +325,19 @@ def run_quickstart():
 
     try:
         # Run RCA on the example data
-        result = run_rca_from_files(
-            logs_path=str(logs_file),
-            metrics_path=str(metrics_file) if metrics_file.exists() else None,
-            primary_symptom="Database connection exhaustion causing API errors",
-            window_minutes=10,
+        metrics_path = str(metrics_file) if metrics_file.exists() else None
+        symptom = "Database connection exhaustion causing API errors"
+        result = _run_cached(
+            use_cache,
+            symptom,
+            [str(logs_file), metrics_path],
+            {"window_minutes": 10},
+            lambda: asyncio.run(arun_rca_from_files(
+                logs_path=str(logs_file),
+                metrics_path=metrics_path,
+                primary_symptom=symptom,
+                window_minutes=10,
+            )),
         )
 
         # Generate and print report
@@ -211,6 +366,10 @@ def run_quickstart():
 
 def run_custom_rca(args):
     """Run RCA on custom data."""
+    import asyncio
+    from autorca_core.reasoning.loop import arun_rca, arun_rca_from_files, DataSourcesConfig
+    from autorca_core.outputs.reports import generate_markdown_report, save_report
+
     print("=" * 80)
     print("AutoRCA-Core: Running RCA")
     print("=" * 80)
@@ -248,15 +407,27 @@ def run_custom_rca(args):
                 traces_dir=args.traces,
                 configs_dir=args.configs,
             )
-            result = run_rca((time_from, time_to), args.symptom, sources)
+
+            def compute():
+                return asyncio.run(arun_rca((time_from, time_to), args.symptom, sources))
         else:
-            result = run_rca_from_files(
-                logs_path=args.logs,
-                metrics_path=args.metrics,
-                traces_path=args.traces,
-                configs_path=args.configs,
-                primary_symptom=args.symptom,
-            )
+            def compute():
+                return asyncio.run(arun_rca_from_files(
+                    logs_path=args.logs,
+                    metrics_path=args.metrics,
+                    traces_path=args.traces,
+                    configs_path=args.configs,
+                    primary_symptom=args.symptom,
+                ))
+
+        result = _run_cached(
+            not args.no_cache,
+            args.symptom,
+            [args.logs, args.metrics, args.traces, args.configs],
+            {"time_from": time_from, "time_to": time_to},
+            compute,
+            semantic=args.semantic_cache,
+        )
 
         # Generate report
         if args.output:
@@ -5,17 +5,19 @@ Provides configurable thresholds and settings for anomaly detection and RCA anal
 """
 
 import os
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThresholdConfig:
     """
     Configurable thresholds for anomaly detection.
 
     These thresholds control when incidents are detected from observability data.
     Different environments have different baselines, so these can be tuned accordingly.
+    Instances are immutable; use dataclasses.replace() to derive a variant.
 
     Attributes:
         # Error detection
@@ -63,9 +65,27 @@ class ThresholdConfig:
             AUTORCA_RESOURCE_EXHAUSTION_COUNT: Resource exhaustion count threshold
             AUTORCA_CHANGE_CORRELATION_SECONDS: Change correlation window in seconds
 
+        The environment is read once and the (immutable) result reused; call
+        reload_env() after changing the variables.
+
         Returns:
             ThresholdConfig instance with values from environment
         """
+        return _thresholds_from_env(cls)
+
+    @classmethod
+    def reload_env(cls) -> "ThresholdConfig":
+        """
+        Re-read the environment variables used by from_env().
+
+        Returns:
+            ThresholdConfig instance with the current environment values
+        """
+        _thresholds_from_env.cache_clear()
+        return cls.from_env()
+
+    @classmethod
+    def _read_env(cls) -> "ThresholdConfig":
         return cls(
             error_spike_count=int(os.getenv("AUTORCA_ERROR_SPIKE_COUNT", 3)),
             error_spike_window_seconds=int(os.getenv("AUTORCA_ERROR_SPIKE_WINDOW", 300)),
@@ -124,3 +144,7 @@ class ThresholdConfig:
             "change_correlation_seconds": self.change_correlation_seconds,
         }
 
+
+@lru_cache(maxsize=None)
+def _thresholds_from_env(cls: type) -> ThresholdConfig:
+    return cls._read_env()
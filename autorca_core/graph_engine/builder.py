@@ -4,11 +4,25 @@ Graph builder: Construct service topology and dependency graphs from observabili
 Builds a ServiceGraph from logs, metrics, traces, and config changes.
 """
 
-from typing import List, Dict, Set, Tuple, Optional
+from typing import (
+    Any, Callable, Deque, Iterable, List, Dict, Mapping, Sequence, Set, Tuple, Optional,
+)
 from datetime import datetime, timedelta
-from collections import defaultdict
-
-from autorca_core.model.events import LogEvent, MetricPoint, Span, ConfigChange
+from collections import defaultdict, deque
+from bisect import bisect_right
+from heapq import nsmallest
+from itertools import groupby
+from operator import attrgetter
+
+from autorca_core.model.events import (
+    LogEvent,
+    MetricPoint,
+    Span,
+    ConfigChange,
+    ERROR_LEVELS,
+    timestamp_ns,
+)
+from autorca_core.model.metric_series import MetricSeries
 from autorca_core.model.graph import (
     ServiceGraph,
     Service,
@@ -35,6 +49,14 @@ class GraphBuilder:
         self._service_metadata: Dict[str, Dict] = defaultdict(dict)
         self.thresholds = thresholds or ThresholdConfig()
 
+        # ThresholdConfig is frozen, so the detector thresholds can be bound once
+        self._err_k = self.thresholds.error_spike_count
+        self._err_w_ns = round(self.thresholds.error_spike_window_seconds * 1_000_000_000)
+        self._lat_ms = self.thresholds.latency_spike_ms
+        self._lat_k = self.thresholds.latency_spike_count
+        self._res_pct = self.thresholds.resource_exhaustion_percent
+        self._res_k = self.thresholds.resource_exhaustion_count
+
     def add_logs(self, logs: List[LogEvent]) -> None:
         """
         Add log events to the graph.
@@ -42,16 +64,79 @@ class GraphBuilder:
         - Discovers services from log events
         - Detects error spikes and creates incident nodes
         """
-        # Discover services
-        for log in logs:
-            if log.service not in self.graph.services:
-                self.graph.add_service(Service(name=log.service, service_type="unknown"))
+        # Discover services (de-duplicated first, keeping first-seen order)
+        self.graph.add_services_bulk({log.service: None for log in logs}, "unknown")
+
+        # The flag is set at construction; reading it skips a method call per event
+        error_logs = [log for log in logs if log._is_error]
 
         # Detect error spikes
-        error_logs = [log for log in logs if log.is_error()]
         if error_logs:
             self._detect_error_spikes(error_logs)
 
+    def add_log_stream(self, logs: Iterable[LogEvent]) -> None:
+        """
+        Add log events from a stream, detecting error spikes online.
+
+        Unlike add_logs(), the events are never collected into a list. Only the
+        last ``error_spike_count`` errors per service are kept while looking for a
+        spike, so memory stays bounded by the window instead of the input size.
+        Incidents are the same as add_logs() would produce, provided each
+        service's events arrive in timestamp order (as load_logs() returns them).
+
+        Args:
+            logs: Log events, ordered by timestamp per service
+        """
+        services = self.graph.services
+        tracker = _ErrorSpikeTracker(self._err_k, self._err_w_ns)
+
+        for log in logs:
+            if log.service not in services:
+                self.graph.add_service(Service(name=log.service, service_type="unknown"))
+            if log._is_error:
+                incident = tracker.add(log.service, log.timestamp, log._ts_ns, log.message)
+                if incident is not None:
+                    self.graph.add_incident(incident)
+
+        for incident in tracker.flush():
+            self.graph.add_incident(incident)
+
+    def add_log_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """
+        Add log events given in columnar form.
+
+        Equivalent to add_logs(), but works directly on parallel columns so large
+        batches never have to be materialized as LogEvent objects. Only the few
+        incident nodes that are detected get built.
+
+        Args:
+            columns: Mapping of equal-length columns: ``service``, ``timestamp``
+                (datetime), ``level`` (Severity or level string) and ``message``,
+                plus an optional ``ts_ns`` column of epoch nanoseconds.
+                ``pyarrow.Table.to_pydict()`` output can be passed as-is.
+        """
+        services = columns["service"]
+        timestamps = columns["timestamp"]
+        levels = columns["level"]
+        messages = columns["message"]
+        ts_ns = columns.get("ts_ns")
+
+        # Discover services
+        self.graph.add_services_bulk(dict.fromkeys(services), "unknown")
+
+        # Detect error spikes on the error rows only
+        error_rows = [
+            row for row, level in enumerate(levels)
+            if str(getattr(level, "value", level)).upper() in ERROR_LEVELS
+        ]
+        if error_rows:
+            self._detect_error_spike_columns(
+                [services[r] for r in error_rows],
+                [timestamps[r] for r in error_rows],
+                [messages[r] for r in error_rows],
+                [ts_ns[r] for r in error_rows] if ts_ns is not None else None,
+            )
+
     def add_metrics(self, metrics: List[MetricPoint]) -> None:
         """
         Add metric data points to the graph.
@@ -60,17 +145,34 @@ class GraphBuilder:
         - Detects latency spikes, throughput drops, resource exhaustion
         """
         # Discover services
-        for metric in metrics:
-            if metric.service not in self.graph.services:
-                self.graph.add_service(Service(name=metric.service, service_type="unknown"))
+        self.graph.add_services_bulk({metric.service: None for metric in metrics}, "unknown")
 
-        # Detect anomalies by service
-        by_service: Dict[str, List[MetricPoint]] = defaultdict(list)
-        for metric in metrics:
-            by_service[metric.service].append(metric)
+        # Detect anomalies by service: sort once, then walk contiguous groups
+        ordered = sorted(metrics, key=attrgetter("service", "metric_name", "_ts_ns"))
+        for service, service_metrics in groupby(ordered, key=attrgetter("service")):
+            self._detect_metric_anomalies(service, list(service_metrics))
 
-        for service, service_metrics in by_service.items():
-            self._detect_metric_anomalies(service, service_metrics)
+    def add_metric_series(self, series: MetricSeries) -> None:
+        """
+        Add metric data points given as a MetricSeries.
+
+        Equivalent to add_metrics() on the same points, but thresholds are
+        checked against the value column directly; MetricPoint objects are
+        only built for the few breaching points cited as evidence.
+        """
+        # Discover services
+        self.graph.add_services_bulk(dict.fromkeys(series.services), "unknown")
+
+        values = series.values
+        for service, metric_name, rows in series.groups():
+            if len(rows) < 2:
+                continue
+            self._detect_metric_breaches(
+                service,
+                metric_name,
+                map(values.__getitem__, rows),
+                lambda i, rows=rows: series.to_point(rows[i]),
+            )
 
     def add_traces(self, spans: List[Span]) -> None:
         """
@@ -81,41 +183,48 @@ class GraphBuilder:
         - Detects error spans
         """
         # Discover services
-        for span in spans:
-            if span.service not in self.graph.services:
-                self.graph.add_service(Service(name=span.service, service_type="api"))
-
-        # Build dependency map from parent-child span relationships
-        dependencies_found: Set[Tuple[str, str]] = set()
+        self.graph.add_services_bulk({span.service: None for span in spans}, "api")
 
-        # Group spans by trace_id
-        traces: Dict[str, List[Span]] = defaultdict(list)
-        for span in spans:
-            traces[span.trace_id].append(span)
-
-        # For each trace, infer dependencies
-        for trace_id, trace_spans in traces.items():
-            span_map = {s.span_id: s for s in trace_spans}
-
-            for span in trace_spans:
-                if span.parent_span_id and span.parent_span_id in span_map:
-                    parent_span = span_map[span.parent_span_id]
-                    if parent_span.service != span.service:
-                        # Parent service depends on child service
-                        dep_key = (parent_span.service, span.service)
-                        if dep_key not in dependencies_found:
-                            self.graph.add_dependency(Dependency(
-                                from_service=parent_span.service,
-                                to_service=span.service,
-                                dependency_type=DependencyType.HTTP,
-                            ))
-                            dependencies_found.add(dep_key)
+        self._add_trace_dependencies(spans)
 
         # Detect error spans
-        error_spans = [s for s in spans if s.is_error()]
+        error_spans = [s for s in spans if s._is_error]
         if error_spans:
             self._detect_error_spans(error_spans)
 
+    def _add_trace_dependencies(self, spans: List[Span]) -> None:
+        """Infer service dependencies from parent -> child span relationships."""
+        # Infer dependencies from parent-child span relationships in one pass.
+        # Span IDs are only guaranteed unique within a trace, so key by both.
+        # Services are numbered so edges dedupe on a packed int, not a string pair.
+        service_ids: Dict[str, int] = {}
+        span_service: Dict[Tuple[str, str], int] = {}
+        for s in spans:
+            span_service[(s.trace_id, s.span_id)] = service_ids.setdefault(
+                s.service, len(service_ids)
+            )
+        service_names = list(service_ids)
+
+        dependencies_found: Dict[int, None] = {}
+        for span in spans:
+            if not span.parent_span_id:
+                continue
+            parent_id = span_service.get((span.trace_id, span.parent_span_id))
+            child_id = service_ids[span.service]
+            if parent_id is not None and parent_id != child_id:
+                # Parent service depends on child service
+                dependencies_found[parent_id << 32 | child_id] = None
+
+        for key in dependencies_found:
+            parent_service = service_names[key >> 32]
+            if not parent_service:
+                continue
+            self.graph.add_dependency(Dependency(
+                from_service=parent_service,
+                to_service=service_names[key & 0xFFFFFFFF],
+                dependency_type=DependencyType.HTTP,
+            ))
+
     def add_config_changes(self, changes: List[ConfigChange]) -> None:
         """
         Add config/deployment changes to the graph.
@@ -145,37 +254,68 @@ class GraphBuilder:
         return self.graph
 
     def _detect_error_spikes(self, error_logs: List[LogEvent]) -> None:
+        """Detect error spikes in error-level log events."""
+        self._detect_error_spike_columns(
+            [e.service for e in error_logs],
+            [e.timestamp for e in error_logs],
+            [e.message for e in error_logs],
+            [e._ts_ns for e in error_logs],
+        )
+
+    def _detect_error_spike_columns(
+        self,
+        services: Sequence[str],
+        timestamps: Sequence[datetime],
+        messages: Sequence[str],
+        ts_ns: Optional[Sequence[int]] = None,
+    ) -> None:
         """
         Detect error spikes by service and create incident nodes.
 
-        Simple heuristic: if a service has multiple errors in a short time window,
-        create an error_spike incident.
+        A service has an error spike when at least ``error_spike_count`` errors fall
+        inside any ``error_spike_window_seconds`` window. Sorted timestamps are swept
+        once per service, so a short burst is found even inside a long error tail.
+
+        Args:
+            services: Service of each error event
+            timestamps: Timestamp of each error event
+            messages: Message of each error event
+            ts_ns: Epoch nanoseconds of each timestamp, if already known
         """
-        # Group errors by service
-        by_service: Dict[str, List[LogEvent]] = defaultdict(list)
-        for log in error_logs:
-            by_service[log.service].append(log)
+        # Group error rows by service
+        by_service: Dict[str, List[int]] = defaultdict(list)
+        for row, service in enumerate(services):
+            by_service[service].append(row)
+
+        if ts_ns is None:
+            ts_ns = [timestamp_ns(t) for t in timestamps]
+        min_count = self._err_k
+        window = self._err_w_ns
+
+        for service, rows in by_service.items():
+            if len(rows) < min_count:
+                continue
 
-        # Detect spikes using configurable thresholds
-        for service, service_errors in by_service.items():
-            if len(service_errors) >= self.thresholds.error_spike_count:
-                # Sort by timestamp
-                service_errors.sort(key=lambda e: e.timestamp)
-                first_error = service_errors[0]
-                last_error = service_errors[-1]
-
-                # If errors span less than threshold window, it's a spike
-                time_span = (last_error.timestamp - first_error.timestamp).total_seconds()
-                if time_span <= self.thresholds.error_spike_window_seconds:
-                    evidence = [f"Error: {e.message}" for e in service_errors[:5]]  # Show first 5
-                    self.graph.add_incident(IncidentNode(
-                        service=service,
-                        incident_type=IncidentType.ERROR_SPIKE,
-                        timestamp=first_error.timestamp,
-                        severity=0.8,
-                        description=f"{len(service_errors)} errors in {time_span:.0f}s",
-                        evidence=evidence,
-                    ))
+            # Timsort is linear on the common, already time-ordered input
+            rows.sort(key=ts_ns.__getitem__)
+            times = [ts_ns[r] for r in rows]
+
+            start = _first_dense_window(times, min_count, window)
+            if start < 0:
+                continue
+
+            # Extend the window to every error within range of its first event
+            end = bisect_right(times, times[start] + window, lo=start)
+            burst = rows[start:end]
+            time_span = (times[end - 1] - times[start]) / 1e9
+
+            self.graph.add_incident(_error_spike_incident(
+                service,
+                timestamps[burst[0]],
+                len(burst),
+                time_span,
+                [messages[r] for r in burst[:5]],  # Show first 5
+            ))
 
     def _detect_metric_anomalies(self, service: str, metrics: List[MetricPoint]) -> None:
         """
@@ -183,44 +323,66 @@ class GraphBuilder:
 
         Simple heuristic: look for sudden changes or threshold breaches.
         """
-        # Group by metric name
-        by_metric: Dict[str, List[MetricPoint]] = defaultdict(list)
-        for metric in metrics:
-            by_metric[metric.metric_name].append(metric)
-
-        for metric_name, metric_points in by_metric.items():
+        # Group by metric name, each group in timestamp order. add_metrics() passes
+        # points that are already in this order, which makes the sort linear.
+        ordered = sorted(metrics, key=attrgetter("metric_name", "_ts_ns"))
+        for metric_name, group in groupby(ordered, key=attrgetter("metric_name")):
+            metric_points = list(group)
             if len(metric_points) < 2:
                 continue
 
-            # Sort by timestamp
-            metric_points.sort(key=lambda m: m.timestamp)
-
-            # Simple threshold-based detection using configurable thresholds
-            if 'latency' in metric_name.lower() or 'duration' in metric_name.lower():
-                # Detect latency spike using configured threshold
-                high_latency = [m for m in metric_points if m.value > self.thresholds.latency_spike_ms]
-                if len(high_latency) >= self.thresholds.latency_spike_count:
-                    self.graph.add_incident(IncidentNode(
-                        service=service,
-                        incident_type=IncidentType.LATENCY_SPIKE,
-                        timestamp=high_latency[0].timestamp,
-                        severity=0.7,
-                        description=f"High latency detected: {metric_name}",
-                        evidence=[f"{m.metric_name}={m.value:.2f}{m.unit or ''}" for m in high_latency[:3]],
-                    ))
-
-            elif 'cpu' in metric_name.lower() or 'memory' in metric_name.lower():
-                # Detect resource exhaustion using configured threshold
-                high_usage = [m for m in metric_points if m.value > self.thresholds.resource_exhaustion_percent]
-                if len(high_usage) >= self.thresholds.resource_exhaustion_count:
-                    self.graph.add_incident(IncidentNode(
-                        service=service,
-                        incident_type=IncidentType.RESOURCE_EXHAUSTION,
-                        timestamp=high_usage[0].timestamp,
-                        severity=0.9,
-                        description=f"High resource usage: {metric_name}",
-                        evidence=[f"{m.metric_name}={m.value:.2f}%" for m in high_usage[:3]],
-                    ))
+            self._detect_metric_breaches(
+                service,
+                metric_name,
+                map(attrgetter("value"), metric_points),
+                metric_points.__getitem__,
+            )
+
+    def _detect_metric_breaches(
+        self,
+        service: str,
+        metric_name: str,
+        values: Iterable[float],
+        point: Callable[[int], MetricPoint],
+    ) -> None:
+        """
+        Create an incident if one metric's values breach their threshold often enough.
+
+        Args:
+            service: Service the metric belongs to
+            metric_name: Name of the metric
+            values: The metric's values in timestamp order
+            point: Function returning the point at a position of ``values``
+        """
+        # Simple threshold-based detection using configurable thresholds
+        name = metric_name.lower()
+        if 'latency' in name or 'duration' in name:
+            # Detect latency spike using configured threshold
+            hits = _first_breaches(values, self._lat_ms, self._lat_k, keep=3)
+            if hits:
+                high_latency = [point(i) for i in hits[:3]]
+                self.graph.add_incident(IncidentNode(
+                    service=service,
+                    incident_type=IncidentType.LATENCY_SPIKE,
+                    timestamp=high_latency[0].timestamp,
+                    severity=0.7,
+                    description=f"High latency detected: {metric_name}",
+                    evidence=[f"{m.metric_name}={m.value:.2f}{m.unit or ''}" for m in high_latency],
+                ))
+
+        elif 'cpu' in name or 'memory' in name:
+            # Detect resource exhaustion using configured threshold
+            hits = _first_breaches(values, self._res_pct, self._res_k, keep=3)
+            if hits:
+                high_usage = [point(i) for i in hits[:3]]
+                self.graph.add_incident(IncidentNode(
+                    service=service,
+                    incident_type=IncidentType.RESOURCE_EXHAUSTION,
+                    timestamp=high_usage[0].timestamp,
+                    severity=0.9,
+                    description=f"High resource usage: {metric_name}",
+                    evidence=[f"{m.metric_name}={m.value:.2f}%" for m in high_usage],
+                ))
 
     def _detect_error_spans(self, error_spans: List[Span]) -> None:
         """Detect error patterns in trace spans."""
@@ -231,17 +393,169 @@ class GraphBuilder:
 
         # Detect error spikes (3+ error spans)
         for service, service_errors in by_service.items():
-            if len(service_errors) >= 3:
-                service_errors.sort(key=lambda s: s.timestamp)
-                evidence = [f"Span error: {s.operation_name} (status={s.status_code})" for s in service_errors[:5]]
-                self.graph.add_incident(IncidentNode(
-                    service=service,
-                    incident_type=IncidentType.ERROR_SPIKE,
-                    timestamp=service_errors[0].timestamp,
-                    severity=0.8,
-                    description=f"{len(service_errors)} failed spans",
-                    evidence=evidence,
-                ))
+            if len(service_errors) < 3:
+                continue
+            # Only the earliest five spans are shown, so skip the full sort
+            earliest = nsmallest(5, service_errors, key=attrgetter("_ts_ns"))
+            evidence = [f"Span error: {s.operation_name} (status={s.status_code})" for s in earliest]
+            self.graph.add_incident(IncidentNode(
+                service=service,
+                incident_type=IncidentType.ERROR_SPIKE,
+                timestamp=earliest[0].timestamp,
+                severity=0.8,
+                description=f"{len(service_errors)} failed spans",
+                evidence=evidence,
+            ))
+
+
+class _ErrorSpikeTracker:
+    """
+    Online counterpart of GraphBuilder._detect_error_spike_columns().
+
+    Errors must be fed in timestamp order per service. A spike opens once the
+    last ``count`` errors of a service fit in the window, and it is emitted when
+    an error arrives past the end of the window (or on flush()). As in batch
+    detection, at most one spike is reported per service.
+    """
+
+    def __init__(self, count: int, window_ns: int):
+        self.count = max(count, 1)
+        self.window = window_ns
+        self._recent: Dict[str, Deque[Tuple[int, datetime, str]]] = {}
+        # service -> [start ns, start timestamp, last ns, error count, messages]
+        self._open: Dict[str, list] = {}
+        self._done: Set[str] = set()
+
+    def add(
+        self, service: str, timestamp: datetime, ts_ns: int, message: str
+    ) -> Optional[IncidentNode]:
+        """Feed one error event; returns an incident when a spike closes."""
+        if service in self._done:
+            return None
+
+        burst = self._open.get(service)
+        if burst is not None:
+            if ts_ns <= burst[0] + self.window:
+                burst[2] = ts_ns
+                burst[3] += 1
+                if len(burst[4]) < 5:
+                    burst[4].append(message)
+                return None
+            return self._close(service)
+
+        recent = self._recent.get(service)
+        if recent is None:
+            recent = self._recent[service] = deque(maxlen=self.count)
+        recent.append((ts_ns, timestamp, message))
+        if len(recent) == self.count and ts_ns - recent[0][0] <= self.window:
+            del self._recent[service]
+            first_ns, first_timestamp, _ = recent[0]
+            messages = [m for _, _, m in recent][:5]
+            self._open[service] = [first_ns, first_timestamp, ts_ns, self.count, messages]
+        return None
+
+    def flush(self) -> List[IncidentNode]:
+        """Emit every spike that is still open at the end of the stream."""
+        return [self._close(service) for service in list(self._open)]
+
+    def _close(self, service: str) -> IncidentNode:
+        start_ns, start, last_ns, count, messages = self._open.pop(service)
+        self._done.add(service)
+        return _error_spike_incident(service, start, count, (last_ns - start_ns) / 1e9, messages)
+
+
+def _error_spike_incident(
+    service: str, timestamp: datetime, count: int, time_span: float, messages: List[str]
+) -> IncidentNode:
+    """Build the incident node for an error spike."""
+    return IncidentNode(
+        service=service,
+        incident_type=IncidentType.ERROR_SPIKE,
+        timestamp=timestamp,
+        severity=0.8,
+        description=f"{count} errors in {time_span:.0f}s",
+        evidence=[f"Error: {message}" for message in messages],
+    )
+
+
+def _first_dense_window(timestamps: Sequence[int], count: int, window: int) -> int:
+    """
+    Find the first window of width ``window`` holding at least ``count`` events.
+
+    A qualifying window exists iff some ``count`` consecutive sorted timestamps
+    span at most ``window``, so a single linear pass is enough.
+
+    Args:
+        timestamps: Event timestamps, sorted ascending
+        count: Minimum number of events in the window
+        window: Window width, in the same unit as the timestamps
+
+    Returns:
+        Index of the first event of the window, or -1 if none qualifies
+    """
+    count = max(count, 1)
+    for end in range(count - 1, len(timestamps)):
+        if timestamps[end] - timestamps[end - count + 1] <= window:
+            return end - count + 1
+    return -1
+
+
+def _first_breaches(
+    values: Iterable[float], threshold: float, count: int, keep: int = 0
+) -> List[int]:
+    """
+    Find the first values that exceed ``threshold``.
+
+    The scan stops as soon as ``max(count, keep)`` breaches have been seen, so a
+    long series that breaches early is not walked to the end.
+
+    Args:
+        values: Metric values, in timestamp order
+        threshold: Value a point must exceed to count as a breach
+        count: Minimum number of breaches for a hit
+        keep: Minimum number of breaching positions to return on a hit (for evidence)
+
+    Returns:
+        Positions of the first breaching values, or an empty list if fewer
+        than ``count`` exist
+    """
+    need = max(count, keep, 1)
+    hits: List[int] = []
+    for i, value in enumerate(values):
+        if value > threshold:
+            hits.append(i)
+            if len(hits) == need:
+                break
+    return hits if len(hits) >= count else []
+
+
+def detect_log_incidents(
+    logs: List[LogEvent], thresholds: Optional[ThresholdConfig] = None
+) -> List[IncidentNode]:
+    """Detect incidents in log events without touching any shared graph."""
+    builder = GraphBuilder(thresholds=thresholds)
+    builder.add_logs(logs)
+    return builder.graph.incidents
+
+
+def detect_metric_incidents(
+    metrics: List[MetricPoint], thresholds: Optional[ThresholdConfig] = None
+) -> List[IncidentNode]:
+    """Detect incidents in metric points without touching any shared graph."""
+    builder = GraphBuilder(thresholds=thresholds)
+    builder.add_metrics(metrics)
+    return builder.graph.incidents
+
+
+def detect_trace_incidents(
+    spans: List[Span], thresholds: Optional[ThresholdConfig] = None
+) -> List[IncidentNode]:
+    """Detect incidents in trace spans without touching any shared graph."""
+    builder = GraphBuilder(thresholds=thresholds)
+    error_spans = [s for s in spans if s._is_error]
+    if error_spans:
+        builder._detect_error_spans(error_spans)
+    return builder.graph.incidents
 
 
 def build_service_graph(
@@ -250,6 +564,7 @@ def build_service_graph(
     traces: List[Span] = None,
     configs: List[ConfigChange] = None,
     thresholds: Optional[ThresholdConfig] = None,
+    max_workers: Optional[int] = None,
 ) -> ServiceGraph:
     """
     Convenience function to build a ServiceGraph from observability data.
@@ -260,19 +575,67 @@ def build_service_graph(
         traces: Trace spans
         configs: Config/deployment changes
         thresholds: Optional threshold configuration for anomaly detection
+        max_workers: If greater than 1, run the log, metric and trace detectors
+            in that many worker processes. Worth it only for large inputs, since
+            the events are pickled to the workers. The graph is the same as
+            with serial detection.
 
     Returns:
         Constructed ServiceGraph
     """
     builder = GraphBuilder(thresholds=thresholds)
 
-    if logs:
-        builder.add_logs(logs)
-    if metrics:
-        builder.add_metrics(metrics)
-    if traces:
-        builder.add_traces(traces)
+    if max_workers is not None and max_workers > 1:
+        _build_parallel(builder, logs, metrics, traces, max_workers)
+    else:
+        if logs:
+            builder.add_logs(logs)
+        if metrics:
+            builder.add_metrics(metrics)
+        if traces:
+            builder.add_traces(traces)
     if configs:
         builder.add_config_changes(configs)
 
     return builder.build()
+
+
+def _build_parallel(
+    builder: GraphBuilder,
+    logs: Optional[List[LogEvent]],
+    metrics: Optional[List[MetricPoint]],
+    traces: Optional[List[Span]],
+    max_workers: int,
+) -> None:
+    """Run the detectors in worker processes while the topology is built here."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [
+        (detector, events)
+        for detector, events in (
+            (detect_log_incidents, logs),
+            (detect_metric_incidents, metrics),
+            (detect_trace_incidents, traces),
+        )
+        if events
+    ]
+    graph = builder.graph
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs) or 1)) as executor:
+        futures = [
+            executor.submit(detector, events, builder.thresholds) for detector, events in jobs
+        ]
+
+        # Topology only depends on this process; build it while the workers run
+        if logs:
+            graph.add_services_bulk({log.service: None for log in logs}, "unknown")
+        if metrics:
+            graph.add_services_bulk({metric.service: None for metric in metrics}, "unknown")
+        if traces:
+            graph.add_services_bulk({span.service: None for span in traces}, "api")
+            builder._add_trace_dependencies(traces)
+
+        # Single writer: merge in submission order to match serial incident order
+        for future in futures:
+            for incident in future.result():
+                graph.add_incident(incident)
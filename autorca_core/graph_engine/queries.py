@@ -4,13 +4,17 @@ Graph queries: Helper methods to analyze and traverse the service graph.
 Provides utilities to find causal chains, hotspots, and correlation patterns.
 """
 
-from typing import List, Set, Dict, Tuple
-from dataclasses import dataclass
+from functools import wraps
+from heapq import heappush, heapreplace, nlargest
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, List, Dict, Optional, Sequence, Tuple, TypeVar
+from dataclasses import dataclass, replace
+from datetime import datetime
 
 from autorca_core.model.graph import ServiceGraph, IncidentNode, Dependency
 
 
-@dataclass
+@dataclass(slots=True)
 class CausalChain:
     """
     Represents a potential causal chain of incidents.
@@ -27,15 +31,98 @@ class CausalChain:
         return f"{chain} (score={self.score:.2f})"
 
 
+F = TypeVar("F", bound=Callable[..., List[Any]])
+
+
+def _copy(result: List[Any]) -> List[Any]:
+    """Copy a cached result (and its chains' lists), so callers cannot edit the cache."""
+    return [
+        replace(item, incidents=list(item.incidents), services=list(item.services))
+        if isinstance(item, CausalChain) else item
+        for item in result
+    ]
+
+
+def _versioned_cache(method: F) -> F:
+    """
+    Cache a GraphQueries method's result per arguments until the graph changes.
+
+    Each call first brings the indexes up to date (see GraphQueries._refresh),
+    which also drops every cached result if the graph has changed. Callers get
+    a copy of the cached list, with copies of any CausalChain in it.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: "GraphQueries", *args: Any, **kwargs: Any) -> List[Any]:
+        self._refresh()
+        key = (name, args, tuple(sorted(kwargs.items())))
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = method(self, *args, **kwargs)
+        return _copy(result)
+
+    return wrapper  # type: ignore[return-value]
+
+
 class GraphQueries:
     """
     Query and analysis utilities for ServiceGraph.
 
     Provides methods to find root causes, propagation paths, and correlations.
+
+    Per-service incident and dependency indexes are built on construction and
+    rebuilt when the graph has changed since (per ServiceGraph.version). The
+    results of the costlier queries are cached until then too.
     """
 
     def __init__(self, graph: ServiceGraph):
         self.graph = graph
+        self._results: Dict[Tuple[Any, ...], List[Any]] = {}
+        self._index()
+
+    def _fingerprint(self) -> Tuple[int, int, int]:
+        # The lengths also catch incidents or edges added without the add_* methods
+        graph = self.graph
+        return (graph.version, len(graph.incidents), len(graph.dependencies))
+
+    def _refresh(self) -> None:
+        """Rebuild the indexes and drop cached results if the graph has changed."""
+        if self._fingerprint() != self._indexed:
+            self._results.clear()
+            self._index()
+
+    def _index(self) -> None:
+        """Build the per-service indexes the queries read."""
+        graph = self.graph
+        self._indexed = self._fingerprint()
+
+        self._incidents_by_service: Dict[str, List[IncidentNode]] = {}
+        self._severity_by_service: Dict[str, float] = {}
+        for incident in graph.incidents:
+            service = incident.service
+            if service in self._incidents_by_service:
+                self._incidents_by_service[service].append(incident)
+                self._severity_by_service[service] += incident.severity
+            else:
+                self._incidents_by_service[service] = [incident]
+                self._severity_by_service[service] = incident.severity
+        self._incident_services = frozenset(self._incidents_by_service)
+
+        # upstream: services calling a service; downstream: services it calls.
+        # Also count, per service, the edges whose other end has incidents.
+        self._upstream_by_service: Dict[str, List[Dependency]] = {}
+        self._downstream_by_service: Dict[str, List[Dependency]] = {}
+        self._failing_callers: Dict[str, int] = {}
+        self._failing_callees: Dict[str, int] = {}
+        for dep in graph.dependencies:
+            caller, callee = dep.from_service, dep.to_service
+            self._upstream_by_service.setdefault(callee, []).append(dep)
+            self._downstream_by_service.setdefault(caller, []).append(dep)
+            if caller in self._incident_services:
+                self._failing_callers[callee] = self._failing_callers.get(callee, 0) + 1
+            if callee in self._incident_services:
+                self._failing_callees[caller] = self._failing_callees.get(caller, 0) + 1
 
     def find_hotspot_services(self, top_n: int = 5) -> List[Tuple[str, float]]:
         """
@@ -47,12 +134,8 @@ class GraphQueries:
         Returns:
             List of (service_name, total_severity) tuples, sorted by severity
         """
-        severity_map: Dict[str, float] = {}
-        for incident in self.graph.incidents:
-            severity_map[incident.service] = severity_map.get(incident.service, 0.0) + incident.severity
-
-        sorted_services = sorted(severity_map.items(), key=lambda x: x[1], reverse=True)
-        return sorted_services[:top_n]
+        self._refresh()
+        return nlargest(top_n, self._severity_by_service.items(), key=itemgetter(1))
 
     def find_root_cause_candidates(self) -> List[str]:
         """
@@ -66,38 +149,27 @@ class GraphQueries:
         Returns:
             List of service names sorted by root cause likelihood
         """
-        incident_services = {i.service for i in self.graph.incidents}
-
+        self._refresh()
         candidates: Dict[str, float] = {}
 
-        for service in incident_services:
-            score = 0.0
-
-            # Get incidents for this service
-            service_incidents = self.graph.get_incidents_for_service(service)
-            total_severity = sum(i.severity for i in service_incidents)
-            score += total_severity
-
-            # Boost score if downstream services have incidents
-            upstream_deps = self.graph.get_upstream_dependencies(service)
-            for dep in upstream_deps:
-                if dep.from_service in incident_services:
-                    score += 0.5  # Bonus for causing downstream issues
-
-            # Penalize if this service depends on services with incidents
-            # (likely a consequence, not a root cause)
-            downstream_deps = self.graph.get_dependencies_for_service(service)
-            for dep in downstream_deps:
-                if dep.to_service in incident_services:
-                    score -= 0.3  # Penalty for depending on failing services
-
-            candidates[service] = score
+        for service, total_severity in self._severity_by_service.items():
+            # Bonus for each caller with incidents (causing downstream issues),
+            # penalty for each failing dependency (likely a consequence, not a
+            # root cause)
+            candidates[service] = (
+                total_severity
+                + 0.5 * self._failing_callers.get(service, 0)
+                - 0.3 * self._failing_callees.get(service, 0)
+            )
 
         # Sort by score (highest first)
-        sorted_candidates = sorted(candidates.items(), key=lambda x: x[1], reverse=True)
+        sorted_candidates = sorted(candidates.items(), key=itemgetter(1), reverse=True)
         return [service for service, score in sorted_candidates if score > 0]
 
-    def find_causal_chains(self, max_length: int = 5) -> List[CausalChain]:
+    @_versioned_cache
+    def find_causal_chains(
+        self, max_length: int = 5, top_k: Optional[int] = None
+    ) -> List[CausalChain]:
         """
         Find potential causal chains of incidents.
 
@@ -108,27 +180,51 @@ class GraphQueries:
 
         Args:
             max_length: Maximum chain length
+            top_k: Only return the top K chains. Paths that cannot beat the
+                current K-th best score are not explored any further, so this
+                is much cheaper than slicing the full result.
 
         Returns:
             List of CausalChain objects, sorted by score
         """
-        incident_services = {i.service for i in self.graph.incidents}
+        if top_k is not None and top_k <= 0:
+            return []
+
+        incident_services = list(self._incidents_by_service)
+        index = {service: n for n, service in enumerate(incident_services)}
+
+        # Project the graph onto incident-bearing services once: an edge points
+        # from a service to the services that depend on it (its upstream callers)
+        adjacency: List[List[int]] = [[] for _ in incident_services]
+        for callee, service in enumerate(incident_services):
+            for dep in self._upstream_by_service.get(service, ()):
+                caller = index.get(dep.from_service)
+                if caller is not None:
+                    adjacency[callee].append(caller)
+        incidents = [self._incidents_by_service[s] for s in incident_services]
+        # The incident _score_chain() compares for each service: its last one
+        last_seen = [service_incidents[-1].timestamp for service_incidents in incidents]
+
+        # Upper bound on what adding n more services can contribute to a score:
+        # the n largest per-service severities, each less its length penalty
+        max_gain = [0.0]
+        for severity in sorted(self._severity_by_service.values(), reverse=True)[:max_length]:
+            max_gain.append(max_gain[-1] + max(0.0, severity - 0.1))
+
         chains: List[CausalChain] = []
+        best: Optional[List[float]] = [] if top_k is not None else None
 
-        # For each service with incidents, try to build chains
-        for root_service in incident_services:
+        # For each service with incidents, try to build (and score) chains
+        for root in range(len(incident_services)):
             self._explore_chains(
-                current_path=[root_service],
-                visited=set([root_service]),
-                chains=chains,
-                max_length=max_length,
+                root, incident_services, adjacency, incidents, last_seen, chains, max_length,
+                best=best, top_k=top_k, max_gain=max_gain,
             )
 
-        # Score and sort chains
-        for chain in chains:
-            chain.score = self._score_chain(chain)
-
-        return sorted(chains, key=lambda c: c.score, reverse=True)
+        if top_k is not None:
+            # Same as the first top_k of the stable sort below
+            return nlargest(top_k, chains, key=attrgetter('score'))
+        return sorted(chains, key=attrgetter('score'), reverse=True)
 
     def get_incident_timeline(self) -> List[IncidentNode]:
         """
@@ -136,8 +232,9 @@ class GraphQueries:
 
         Useful for understanding the temporal sequence of events.
         """
-        return sorted(self.graph.incidents, key=lambda i: i.timestamp)
+        return sorted(self.graph.incidents, key=attrgetter('timestamp'))
 
+    @_versioned_cache
     def get_services_with_recent_changes(self) -> List[str]:
         """
         Get services that have recent config/deployment changes.
@@ -147,66 +244,108 @@ class GraphQueries:
         from autorca_core.model.graph import IncidentType
 
         change_types = {IncidentType.CONFIG_CHANGE, IncidentType.DEPLOYMENT}
-        services_with_changes = set()
-
-        for incident in self.graph.incidents:
-            if incident.incident_type in change_types:
-                services_with_changes.add(incident.service)
-
-        return list(services_with_changes)
+        return [
+            service
+            for service, incidents in self._incidents_by_service.items()
+            if any(i.incident_type in change_types for i in incidents)
+        ]
 
     def _explore_chains(
         self,
-        current_path: List[str],
-        visited: Set[str],
+        root: int,
+        services: List[str],
+        adjacency: List[List[int]],
+        incidents: List[List[IncidentNode]],
+        last_seen: Sequence[datetime],
         chains: List[CausalChain],
         max_length: int,
+        best: Optional[List[float]] = None,
+        top_k: Optional[int] = None,
+        max_gain: Sequence[float] = (),
     ) -> None:
         """
-        Recursively explore dependency graph to find causal chains.
-
-        Uses DFS to traverse from a root service to downstream dependent services.
+        Enumerate the simple paths starting at ``root`` and record each as a chain.
+
+        Iterative DFS over the incident subgraph built by find_causal_chains().
+        The current path, its visited bitmask, its incident list and the running
+        inputs of _score_chain() (severity total, temporal ordering) are extended
+        on each step and rolled back when the walk returns, so no path is rebuilt
+        or rescanned and no graph lookups happen during the walk.
+
+        With ``top_k``, ``best`` is a min-heap of the K best scores seen so far.
+        Chains that do not beat its minimum are not recorded and paths whose
+        extensions cannot beat it (bounded with ``max_gain``) are not extended.
+        Earlier chains win ties in the final stable sort, so the top K chains
+        are exactly those of a full enumeration.
         """
-        if len(current_path) >= max_length:
+        if max_length < 2:
             return
 
-        current_service = current_path[-1]
-
-        # Find services that depend on current_service (upstream dependencies)
-        upstream_deps = self.graph.get_upstream_dependencies(current_service)
-
-        for dep in upstream_deps:
-            next_service = dep.from_service
-
-            # Skip if already visited or no incidents
-            if next_service in visited:
-                continue
-
-            incidents_for_next = self.graph.get_incidents_for_service(next_service)
-            if not incidents_for_next:
-                continue
-
-            # Add to path
-            new_path = current_path + [next_service]
-            new_visited = visited | {next_service}
-
-            # Create a chain if path length >= 2
-            if len(new_path) >= 2:
-                # Collect incidents for all services in the chain
-                chain_incidents = []
-                for service in new_path:
-                    chain_incidents.extend(self.graph.get_incidents_for_service(service))
-
-                explanation = self._generate_chain_explanation(new_path)
-                chains.append(CausalChain(
-                    incidents=chain_incidents,
-                    services=new_path,
-                    score=0.0,  # Will be scored later
-                    explanation=explanation,
-                ))
-
-            # Continue exploration
-            self._explore_chains(new_path, new_visited, chains, max_length)
+        path = [root]
+        visited = 1 << root
+        chain_incidents = list(incidents[root])
+        # Per path position: (incidents so far, severity total, properly ordered)
+        steps = [(len(chain_incidents), sum(i.severity for i in chain_incidents), True)]
+        stack = [iter(adjacency[root])]
+
+        while stack:
+            for nxt in stack[-1]:
+                if visited >> nxt & 1:
+                    continue
+
+                _, total_severity, properly_ordered = steps[-1]
+                for incident in incidents[nxt]:
+                    total_severity += incident.severity
+                properly_ordered = properly_ordered and last_seen[path[-1]] <= last_seen[nxt]
+
+                path.append(nxt)
+                visited |= 1 << nxt
+                chain_incidents.extend(incidents[nxt])
+                steps.append((len(chain_incidents), total_severity, properly_ordered))
+
+                score = self._chain_score(total_severity, properly_ordered, len(path))
+                if best is None or len(best) < top_k or score > best[0]:
+                    names = [services[n] for n in path]
+                    chains.append(CausalChain(
+                        incidents=list(chain_incidents),
+                        services=names,
+                        score=score,
+                        explanation=self._generate_chain_explanation(names),
+                    ))
+                    if best is not None:
+                        if len(best) < top_k:
+                            heappush(best, score)
+                        else:
+                            heapreplace(best, score)
+
+                if len(path) < max_length and (
+                    best is None
+                    or len(best) < top_k
+                    or self._extension_bound(
+                        total_severity, properly_ordered, len(path),
+                        max_gain[min(max_length - len(path), len(max_gain) - 1)],
+                    ) > best[0]
+                ):
+                    stack.append(iter(adjacency[nxt]))
+                    break
+                self._backtrack(path, chain_incidents, steps)
+                visited &= ~(1 << nxt)
+            else:
+                stack.pop()
+                if len(path) > 1:
+                    visited &= ~(1 << path[-1])
+                    self._backtrack(path, chain_incidents, steps)
+
+    @staticmethod
+    def _backtrack(
+        path: List[int],
+        chain_incidents: List[IncidentNode],
+        steps: List[Tuple[int, float, bool]],
+    ) -> None:
+        """Drop the last service of a path and the incidents it contributed."""
+        path.pop()
+        steps.pop()
+        del chain_incidents[steps[-1][0]:]
 
     def _score_chain(self, chain: CausalChain) -> float:
         """
@@ -215,11 +354,8 @@ class GraphQueries:
         - Temporal ordering (earlier incidents likely cause later ones)
         - Chain length (longer chains are less likely)
         """
-        score = 0.0
-
         # Base score: sum of incident severities
         total_severity = sum(i.severity for i in chain.incidents)
-        score += total_severity
 
         # Bonus for temporal ordering
         incidents_by_service = {i.service: i for i in chain.incidents}
@@ -237,11 +373,30 @@ class GraphQueries:
                     properly_ordered = False
                     break
 
+        return self._chain_score(total_severity, properly_ordered, len(chain.services))
+
+    @staticmethod
+    def _extension_bound(
+        total_severity: float, properly_ordered: bool, length: int, gain: float
+    ) -> float:
+        """Upper bound on the score of any chain extending the current path."""
+        bound = total_severity + gain - (length - 2) * 0.1
+        if properly_ordered:
+            bound += 0.5
+        # Slack for the different summation order of the bound
+        return bound + 1e-9
+
+    @staticmethod
+    def _chain_score(total_severity: float, properly_ordered: bool, length: int) -> float:
+        """Combine the inputs of _score_chain() into a score."""
+        score = 0.0
+        score += total_severity
+
         if properly_ordered:
             score += 0.5
 
         # Penalty for long chains (less likely)
-        chain_length_penalty = (len(chain.services) - 2) * 0.1
+        chain_length_penalty = (length - 2) * 0.1
         score -= chain_length_penalty
 
         return max(0.0, score)
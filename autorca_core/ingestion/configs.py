@@ -4,23 +4,41 @@ Config/deployment change ingestion: Load config and deployment change events.
 Used to correlate incidents with recent changes that may have caused issues.
 """
 
-import json
 import yaml
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from autorca_core.model.events import ConfigChange
+from autorca_core.model.events import ConfigChange, parse_timestamp, timestamp_ns
 from autorca_core.logging import get_logger
+from autorca_core.ingestion.fields import FieldAliases
+from autorca_core.ingestion.files import file_loader, iter_source_files
+from autorca_core.ingestion.records import iter_json_records
 
 logger = get_logger(__name__)
 
+_CONFIG_SUFFIXES = frozenset({'.jsonl', '.json', '.yaml', '.yml'})
+
+_CONFIG_FIELDS = FieldAliases(
+    ('timestamp', 'time', 'deployed_at'),
+    ('service', 'service_name'),
+    ('change_type', 'type'),
+    ('description', 'message'),
+    ('version_before', 'old_version'),
+    ('version_after', 'new_version', 'version'),
+    ('changed_by', 'deployed_by', 'user'),
+)
+
 
 def load_configs(
     source: str,
     time_from: Optional[datetime] = None,
     time_to: Optional[datetime] = None,
     service_filter: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    keep_raw: bool = False,
 ) -> List[ConfigChange]:
     """
     Load config/deployment change events from a file or directory.
@@ -30,6 +48,10 @@ def load_configs(
         time_from: Start of time window (inclusive)
         time_to: End of time window (inclusive)
         service_filter: Only include changes for this service
+        max_workers: If greater than 1, parse the files of a directory in that
+            many worker processes
+        keep_raw: Keep each change's decoded record in ``raw_data`` (off by
+            default to save memory)
 
     Returns:
         List of ConfigChange objects
@@ -42,70 +64,51 @@ def load_configs(
     changes = []
 
     if source_path.is_file():
-        changes.extend(_load_config_file(source_path))
+        changes.extend(_load_config_file(source_path, keep_raw))
     else:
         # Load all .jsonl, .json, .yaml, .yml files in directory
-        for file_path in source_path.glob("**/*.{jsonl,json,yaml,yml}"):
-            changes.extend(_load_config_file(file_path))
+        files = list(iter_source_files(source_path, _CONFIG_SUFFIXES))
+        load_file = partial(_load_config_file, keep_raw=keep_raw)
+        with file_loader(load_file, files, max_workers) as load:
+            for file_path in files:
+                changes.extend(load(file_path))
 
     # Apply filters
     if time_from:
-        changes = [c for c in changes if c.timestamp >= time_from]
+        from_ns = timestamp_ns(time_from)
+        changes = [c for c in changes if c._ts_ns >= from_ns]
     if time_to:
-        changes = [c for c in changes if c.timestamp <= time_to]
+        to_ns = timestamp_ns(time_to)
+        changes = [c for c in changes if c._ts_ns <= to_ns]
     if service_filter:
         changes = [c for c in changes if c.service == service_filter]
 
-    return sorted(changes, key=lambda c: c.timestamp)
+    changes.sort(key=attrgetter('_ts_ns'))
+    return changes
 
 
-def _load_config_file(file_path: Path) -> List[ConfigChange]:
+def _load_config_file(file_path: Path, keep_raw: bool = False) -> List[ConfigChange]:
     """Load a single config change file."""
     if file_path.suffix in ('.yaml', '.yml'):
-        return _parse_yaml_configs(file_path)
+        return _parse_yaml_configs(file_path, keep_raw)
     elif file_path.suffix in ('.jsonl', '.json'):
-        return _parse_json_configs(file_path)
+        return _parse_json_configs(file_path, keep_raw)
     else:
         logger.warning(f"Unsupported config file format: {file_path}")
         return []
 
 
-def _parse_json_configs(file_path: Path) -> List[ConfigChange]:
+def _parse_json_configs(file_path: Path, keep_raw: bool = False) -> List[ConfigChange]:
     """Parse JSON or JSON Lines config change file."""
     changes = []
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        # Try to parse as JSON array first
-        try:
-            data = json.load(f)
-            if isinstance(data, list):
-                for item in data:
-                    change = _parse_config_item(item)
-                    if change:
-                        changes.append(change)
-                return changes
-        except json.JSONDecodeError:
-            # Fall back to JSON Lines
-            f.seek(0)
-
-        # Parse as JSON Lines
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                item = json.loads(line)
-                change = _parse_config_item(item)
-                if change:
-                    changes.append(change)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON line {line_num} in {file_path}: {e}")
-
+    for item in iter_json_records(file_path):
+        change = _parse_config_item(item, keep_raw)
+        if change:
+            changes.append(change)
     return changes
 
 
-def _parse_yaml_configs(file_path: Path) -> List[ConfigChange]:
+def _parse_yaml_configs(file_path: Path, keep_raw: bool = False) -> List[ConfigChange]:
     """Parse YAML config change file."""
     changes = []
 
@@ -115,11 +118,11 @@ def _parse_yaml_configs(file_path: Path) -> List[ConfigChange]:
 
             if isinstance(data, list):
                 for item in data:
-                    change = _parse_config_item(item)
+                    change = _parse_config_item(item, keep_raw)
                     if change:
                         changes.append(change)
             elif isinstance(data, dict):
-                change = _parse_config_item(data)
+                change = _parse_config_item(data, keep_raw)
                 if change:
                     changes.append(change)
     except yaml.YAMLError as e:
@@ -128,18 +131,22 @@ def _parse_yaml_configs(file_path: Path) -> List[ConfigChange]:
     return changes
 
 
-def _parse_config_item(item: Dict[str, Any]) -> Optional[ConfigChange]:
+def _parse_config_item(item: Dict[str, Any], keep_raw: bool = False) -> Optional[ConfigChange]:
     """Parse a single config change item."""
     try:
-        timestamp_str = item.get('timestamp') or item.get('time') or item.get('deployed_at')
+        (
+            timestamp_str, service, change_type_val, description,
+            version_before, version_after, changed_by,
+        ) = _CONFIG_FIELDS.extract(item)
         if not timestamp_str:
             return None
 
-        timestamp = datetime.fromisoformat(str(timestamp_str).replace('Z', '+00:00'))
-        service = item.get('service') or item.get('service_name', 'unknown')
+        timestamp = parse_timestamp(str(timestamp_str))
+        service = service or 'unknown'
 
         # Determine change type
-        change_type_val = item.get('change_type') or item.get('type', 'config')
+        if change_type_val is None:
+            change_type_val = 'config'
         if change_type_val.lower() in ('deploy', 'deployment', 'release'):
             change_type = 'deployment'
         elif change_type_val.lower() in ('scale', 'scaling', 'autoscale'):
@@ -149,10 +156,8 @@ def _parse_config_item(item: Dict[str, Any]) -> Optional[ConfigChange]:
         else:
             change_type = 'other'
 
-        description = item.get('description') or item.get('message') or ''
-        version_before = item.get('version_before') or item.get('old_version')
-        version_after = item.get('version_after') or item.get('new_version') or item.get('version')
-        changed_by = item.get('changed_by') or item.get('deployed_by') or item.get('user')
+        if description is None:
+            description = ''
 
         # Extract tags
         tags = item.get('tags', {})
@@ -170,7 +175,7 @@ def _parse_config_item(item: Dict[str, Any]) -> Optional[ConfigChange]:
             version_after=version_after,
             changed_by=changed_by,
             tags=tags,
-            raw_data=item,
+            raw_data=item if keep_raw else None,
         )
     except (ValueError, KeyError):
         return None
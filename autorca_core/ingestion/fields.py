@@ -0,0 +1,97 @@
+"""
+Field extraction: Read values that sources store under different key names.
+"""
+
+import sys
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+
+class FieldAliases:
+    """
+    The candidate key names of several fields, resolved in one pass.
+
+    For each field, extract() returns the value of its most preferred key
+    that holds something other than None. It walks the record's keys a
+    single time with one dict lookup each, instead of probing every alias
+    of every field. Records only carry a few keys, so this is several times
+    cheaper per record.
+    """
+
+    __slots__ = ('_fields', '_slots')
+
+    def __init__(self, *fields: Sequence[str]):
+        """
+        Args:
+            *fields: One sequence of candidate key names per field, most
+                preferred first
+
+        Raises:
+            ValueError: If a key name is listed for more than one field
+        """
+        self._fields = len(fields)
+        self._slots: Dict[str, Tuple[int, int]] = {}
+        for index, keys in enumerate(fields):
+            for rank, key in enumerate(keys):
+                if key in self._slots:
+                    raise ValueError(f"Key {key!r} is listed for more than one field")
+                self._slots[key] = (index, rank)
+
+    def extract(self, data: Mapping[str, Any]) -> List[Any]:
+        """
+        Return the first present value of each field, in field order.
+
+        Args:
+            data: Parsed record
+
+        Returns:
+            One value per field; None for fields with no present key
+        """
+        values: List[Any] = [None] * self._fields
+        ranks = [len(self._slots)] * self._fields
+        slots = self._slots
+        for key, value in data.items():
+            slot = slots.get(key)
+            if slot is not None and value is not None:
+                index, rank = slot
+                if rank < ranks[index]:
+                    values[index] = value
+                    ranks[index] = rank
+        return values
+
+
+class SharedTags:
+    """
+    Hand out one dict per distinct tag set.
+
+    Metric and span exports repeat a handful of tag sets across many rows.
+    Giving every row with equal tags the same dict keeps one dict per
+    distinct set alive instead of one per row. Shared dicts are read-only
+    by convention, like the rest of a loaded event.
+    """
+
+    __slots__ = ('_sets',)
+
+    def __init__(self):
+        self._sets: Dict[Tuple[Tuple[Any, ...], Tuple[type, ...]], Dict[str, str]] = {}
+
+    def from_record(self, raw: Any) -> Dict[str, str]:
+        """
+        Return the shared string-to-string tags for a record's decoded ``tags`` value.
+
+        A set seen before is found by its decoded items, so the str()
+        conversion runs once per distinct set rather than once per record.
+        Anything but a dict gives empty tags.
+        """
+        if not isinstance(raw, dict):
+            raw = {}
+        try:
+            # Value types are part of the key: True == 1 == 1.0, but their str() differ
+            key = (tuple(raw.items()), tuple(map(type, raw.values())))
+            tags = self._sets.get(key)
+        except TypeError:
+            # Unhashable values (nested lists or objects): convert uncached
+            return {str(k): str(v) for k, v in raw.items()}
+        if tags is None:
+            # Tag keys repeat across sets, so they are interned
+            tags = self._sets[key] = {sys.intern(str(k)): str(v) for k, v in raw.items()}
+        return tags
@@ -0,0 +1,101 @@
+"""
+File discovery: Find the input files of a directory source.
+
+All loaders walk their source directory once with os.scandir and keep the
+entries whose extension they support, instead of running one recursive glob
+per extension. file_loader() optionally parses the discovered files in worker
+processes.
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from operator import attrgetter
+from pathlib import Path
+from typing import AbstractSet, Callable, Iterator, Optional, Sequence, TypeVar
+
+from autorca_core.logging import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def iter_source_files(root: Path, suffixes: AbstractSet[str]) -> Iterator[Path]:
+    """
+    Yield the files under ``root`` whose suffix is one of ``suffixes``.
+
+    The tree is walked depth-first in name order, so the result is stable
+    across runs. Symlinked directories are not followed; unreadable
+    directories are skipped with a warning.
+
+    Args:
+        root: Directory to walk
+        suffixes: Accepted suffixes including the dot (e.g. ``{".log", ".txt"}``)
+
+    Yields:
+        Matching file paths
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=attrgetter('name'))
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif os.path.splitext(entry.name)[1] in suffixes and entry.is_file():
+                yield Path(entry.path)
+
+        # Reversed so the stack pops subdirectories in name order
+        pending.extend(reversed(subdirectories))
+
+
+@contextmanager
+def file_loader(
+    load: Callable[[Path], T],
+    files: Sequence[Path],
+    max_workers: Optional[int] = None,
+) -> Iterator[Callable[[Path], T]]:
+    """
+    Provide a function returning ``load(path)`` for each of ``files``.
+
+    With ``max_workers`` greater than 1 (and more than one file), every file
+    is submitted to a process pool up front and the returned function waits
+    for that file's result, re-raising its exception if parsing failed.
+    Otherwise files are loaded inline when asked for. Either way callers see
+    results in the order they ask for them.
+
+    Args:
+        load: Picklable (module-level) function parsing one file
+        files: Files that will be asked for
+        max_workers: Number of worker processes
+
+    Yields:
+        Function mapping a path from ``files`` to its loaded result
+    """
+    if max_workers is None or max_workers <= 1 or len(files) < 2:
+        yield load
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    level = logging.getLogger("autorca_core").getEffectiveLevel()
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(files)),
+        initializer=_init_worker_logging,
+        initargs=(level,),
+    ) as executor:
+        futures = {file_path: executor.submit(load, file_path) for file_path in files}
+        yield lambda file_path: futures[file_path].result()
+
+
+def _init_worker_logging(level: int) -> None:
+    """Give a worker its own log listener; a forked one inherits a dead listener thread."""
+    configure_logging(logging.getLevelName(level))
@@ -4,17 +4,28 @@ Metrics ingestion: Load and parse metric time-series data.
 Supports CSV, JSON, and Prometheus-style formats.
 """
 
-import json
 import csv
+from functools import partial
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from autorca_core.model.events import MetricPoint
+from autorca_core.model.events import MetricPoint, intern_name, parse_timestamp, timestamp_ns
 from autorca_core.logging import get_logger
+from autorca_core.ingestion.fields import SharedTags
+from autorca_core.ingestion.files import file_loader, iter_source_files
+from autorca_core.ingestion.records import iter_json_records
 
 logger = get_logger(__name__)
 
+_METRICS_SUFFIXES = frozenset({'.csv', '.jsonl', '.json'})
+
+# CSV columns with a meaning of their own; every other column is a tag
+_CSV_FIELD_COLUMNS = frozenset(
+    {'timestamp', 'time', 'service', 'metric_name', 'metric', 'value', 'unit'}
+)
+
 
 def load_metrics(
     source: str,
@@ -22,6 +33,8 @@ def load_metrics(
     time_to: Optional[datetime] = None,
     service_filter: Optional[str] = None,
     metric_filter: Optional[str] = None,
+    keep_raw: bool = False,
+    max_workers: Optional[int] = None,
 ) -> List[MetricPoint]:
     """
     Load metrics from a file or directory.
@@ -32,6 +45,10 @@ def load_metrics(
         time_to: End of time window (inclusive)
         service_filter: Only include metrics from this service
         metric_filter: Only include metrics with this name
+        keep_raw: Keep each point's source row or record in ``raw_data`` (off
+            by default to save memory)
+        max_workers: If greater than 1, parse the files of a directory in that
+            many worker processes
 
     Returns:
         List of MetricPoint objects
@@ -44,39 +61,43 @@ def load_metrics(
     metrics = []
 
     if source_path.is_file():
-        metrics.extend(_load_metrics_file(source_path))
+        metrics.extend(_load_metrics_file(source_path, keep_raw))
     else:
         # Load all .csv, .jsonl, .json files in directory
-        extensions = ['*.csv', '*.jsonl', '*.json']
-        for ext in extensions:
-            for file_path in source_path.glob(f"**/{ext}"):
-                metrics.extend(_load_metrics_file(file_path))
-
-    # Apply filters
-    if time_from:
-        metrics = [m for m in metrics if m.timestamp >= time_from]
-    if time_to:
-        metrics = [m for m in metrics if m.timestamp <= time_to]
-    if service_filter:
-        metrics = [m for m in metrics if m.service == service_filter]
-    if metric_filter:
-        metrics = [m for m in metrics if m.metric_name == metric_filter]
-
-    return sorted(metrics, key=lambda m: m.timestamp)
+        files = list(iter_source_files(source_path, _METRICS_SUFFIXES))
+        load_file = partial(_load_metrics_file, keep_raw=keep_raw)
+        with file_loader(load_file, files, max_workers) as load:
+            for file_path in files:
+                metrics.extend(load(file_path))
+
+    # Apply all filters in one pass, on the precomputed epoch nanoseconds
+    if time_from or time_to or service_filter or metric_filter:
+        from_ns = timestamp_ns(time_from) if time_from else None
+        to_ns = timestamp_ns(time_to) if time_to else None
+        metrics = [
+            m for m in metrics
+            if (from_ns is None or m._ts_ns >= from_ns)
+            and (to_ns is None or m._ts_ns <= to_ns)
+            and (not service_filter or m.service == service_filter)
+            and (not metric_filter or m.metric_name == metric_filter)
+        ]
+
+    metrics.sort(key=attrgetter('_ts_ns'))
+    return metrics
 
 
-def _load_metrics_file(file_path: Path) -> List[MetricPoint]:
+def _load_metrics_file(file_path: Path, keep_raw: bool = False) -> List[MetricPoint]:
     """Load a single metrics file."""
     if file_path.suffix == '.csv':
-        return _parse_csv_metrics(file_path)
+        return _parse_csv_metrics(file_path, keep_raw)
     elif file_path.suffix in ('.jsonl', '.json'):
-        return _parse_json_metrics(file_path)
+        return _parse_json_metrics(file_path, keep_raw)
     else:
         logger.warning(f"Unsupported metrics file format: {file_path}")
         return []
 
 
-def _parse_csv_metrics(file_path: Path) -> List[MetricPoint]:
+def _parse_csv_metrics(file_path: Path, keep_raw: bool = False) -> List[MetricPoint]:
     """
     Parse CSV metrics file.
 
@@ -84,32 +105,67 @@ def _parse_csv_metrics(file_path: Path) -> List[MetricPoint]:
     """
     metrics = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return metrics
+
+        # Resolve column positions once. Every row gets a None appended after
+        # its own fields, which is what a missing optional column reads.
+        width = len(header)
+        column = {name: i for i, name in enumerate(header)}
+        timestamp_i = column.get('timestamp', width)
+        time_i = column.get('time', width)
+        service_i = column.get('service')
+        metric_name_i = column.get('metric_name', width)
+        metric_i = column.get('metric')
+        value_i = column.get('value')
+        unit_i = column.get('unit', width)
+
+        # Remaining columns are tags. Tag columns are dictionary-encoded: rows
+        # with the same tag values share one dict, built the first time the
+        # combination is seen and found again by a C-level itemgetter key.
+        tag_columns = [
+            (i, name) for name, i in column.items() if name not in _CSV_FIELD_COLUMNS
+        ]
+        tag_key = itemgetter(*(i for i, _ in tag_columns)) if tag_columns else None
+        tag_sets: Dict[Any, Dict[str, Any]] = {}
+
         for row in reader:
+            if not row:
+                continue
+            if len(row) != width:
+                # Short rows read None for their missing fields; extra fields are dropped
+                row = (row + [None] * width)[:width]
+            row.append(None)
+
             try:
-                timestamp_str = row.get('timestamp') or row.get('time')
+                timestamp_str = row[timestamp_i] or row[time_i]
                 if not timestamp_str:
                     continue
 
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                service = row.get('service', 'unknown')
-                metric_name = row.get('metric_name') or row.get('metric', 'unknown')
-                value = float(row.get('value', 0.0))
-                unit = row.get('unit')
+                timestamp = parse_timestamp(timestamp_str)
+                service = row[service_i] if service_i is not None else 'unknown'
+                metric_name = row[metric_name_i] or (
+                    row[metric_i] if metric_i is not None else 'unknown'
+                )
+                value = float(row[value_i]) if value_i is not None else 0.0
+                unit = row[unit_i]
 
-                # Remaining columns are tags
-                tags = {k: v for k, v in row.items()
-                       if k not in ('timestamp', 'time', 'service', 'metric_name', 'metric', 'value', 'unit')}
+                key = tag_key(row) if tag_key is not None else None
+                tags = tag_sets.get(key)
+                if tags is None:
+                    tags = tag_sets[key] = {name: row[i] for i, name in tag_columns}
 
                 metrics.append(MetricPoint(
                     timestamp=timestamp,
                     service=service,
                     metric_name=metric_name,
                     value=value,
-                    unit=unit,
+                    unit=intern_name(unit),
                     tags=tags,
-                    raw_data=row,
+                    raw_data=dict(zip(header, row)) if keep_raw else None,
                 ))
             except (ValueError, KeyError) as e:
                 logger.warning(f"Failed to parse CSV row in {file_path}: {e}")
@@ -117,73 +173,49 @@ def _parse_csv_metrics(file_path: Path) -> List[MetricPoint]:
     return metrics
 
 
-def _parse_json_metrics(file_path: Path) -> List[MetricPoint]:
+def _parse_json_metrics(file_path: Path, keep_raw: bool = False) -> List[MetricPoint]:
     """
     Parse JSON or JSON Lines metrics file.
 
     Each line/object should contain: timestamp, service, metric_name, value
     """
     metrics = []
+    tag_sets = SharedTags()
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        # Try to parse as JSON array first
-        try:
-            data = json.load(f)
-            if isinstance(data, list):
-                for item in data:
-                    metric = _parse_json_metric_item(item)
-                    if metric:
-                        metrics.append(metric)
-                return metrics
-        except json.JSONDecodeError:
-            # Fall back to JSON Lines
-            f.seek(0)
-
-        # Parse as JSON Lines
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                item = json.loads(line)
-                metric = _parse_json_metric_item(item)
-                if metric:
-                    metrics.append(metric)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON line {line_num} in {file_path}: {e}")
+    for item in iter_json_records(file_path):
+        metric = _parse_json_metric_item(item, keep_raw, tag_sets)
+        if metric:
+            metrics.append(metric)
 
     return metrics
 
 
-def _parse_json_metric_item(item: Dict[str, Any]) -> Optional[MetricPoint]:
-    """Parse a single JSON metric object."""
+def _parse_json_metric_item(
+    item: Dict[str, Any], keep_raw: bool = False, tag_sets: Optional[SharedTags] = None
+) -> Optional[MetricPoint]:
+    """Parse a single JSON metric object (``tag_sets`` shares tags across a file)."""
     try:
         timestamp_str = item.get('timestamp') or item.get('time')
         if not timestamp_str:
             return None
 
-        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        timestamp = parse_timestamp(timestamp_str)
         service = item.get('service') or item.get('service_name', 'unknown')
         metric_name = item.get('metric_name') or item.get('metric') or item.get('name', 'unknown')
         value = float(item.get('value', 0.0))
         unit = item.get('unit')
 
         # Extract tags
-        tags = item.get('tags', {})
-        if isinstance(tags, dict):
-            tags = {str(k): str(v) for k, v in tags.items()}
-        else:
-            tags = {}
+        tags = (tag_sets or SharedTags()).from_record(item.get('tags'))
 
         return MetricPoint(
             timestamp=timestamp,
             service=service,
             metric_name=metric_name,
             value=value,
-            unit=unit,
+            unit=intern_name(unit),
             tags=tags,
-            raw_data=item,
+            raw_data=item if keep_raw else None,
         )
     except (ValueError, KeyError):
         return None
@@ -0,0 +1,116 @@
+"""
+JSON record reading: Yield the records of a JSON or JSON Lines file.
+
+Metric, trace and config change files may hold a JSON array, one JSON object
+per line, or a single object. The format is decided from the file's first
+non-whitespace byte, so JSON Lines files are streamed line by line and never
+decoded (or held in memory) as a whole. Whole documents are decoded straight
+from a memory map of the file where the JSON backend allows it, instead of
+from a full-size copy.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, List, Optional, Union
+
+from autorca_core import _json
+from autorca_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def iter_json_records(file_path: Path) -> Iterator[Any]:
+    """
+    Yield the decoded records of a JSON array, JSON Lines or single-object file.
+
+    A file starting with ``[`` is decoded as one array. Anything else is read
+    as JSON Lines, skipping (with a warning) lines that are not valid JSON;
+    if the very first line is not valid JSON, the file is tried as a single
+    pretty-printed document first.
+
+    Args:
+        file_path: File to read
+
+    Yields:
+        Decoded records (usually dicts; callers validate the type)
+    """
+    with open(file_path, 'rb') as f:
+        is_array = _first_byte(f) == b'['
+        f.seek(0)
+        if is_array:
+            records = _decode_file(f)
+            if records is not None:
+                yield from records
+                return
+            f.seek(0)
+
+        first_line = not is_array
+        for line_num, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = _json.loads(line)
+            except _json.JSONDecodeError as e:
+                if first_line:
+                    # Not JSON Lines after all: maybe one pretty-printed object
+                    records = _decode_file(f)
+                    if records is not None:
+                        yield from records
+                        return
+                    f.seek(0)
+                    for _ in range(line_num):
+                        f.readline()
+                first_line = False
+                logger.warning(f"Failed to parse JSON line {line_num} in {file_path}: {e}")
+                continue
+            first_line = False
+            yield record
+
+
+def _first_byte(f: BinaryIO) -> bytes:
+    """Return the first non-whitespace byte of ``f`` (empty at end of file)."""
+    while True:
+        chunk = f.read(4096)
+        if not chunk:
+            return b''
+        stripped = chunk.lstrip()
+        if stripped:
+            return stripped[:1]
+
+
+def _decode_file(f: BinaryIO) -> Optional[List[Any]]:
+    """Decode the whole of ``f`` with _decode_document(), memory-mapped if possible."""
+    if _json.DECODES_BUFFERS:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and non-regular files cannot be mapped
+            pass
+        else:
+            with mapped, memoryview(mapped) as view:
+                return _decode_document(view)
+
+    f.seek(0)
+    return _decode_document(f.read())
+
+
+def _decode_document(content: Union[bytes, memoryview]) -> Optional[List[Any]]:
+    """
+    Decode a whole-file JSON document into its records.
+
+    Returns:
+        The items of an array, a one-item list for an object, an empty list
+        for any other value, or None if ``content`` is not one JSON document
+    """
+    try:
+        data = _json.loads(content)
+    except _json.JSONDecodeError:
+        return None
+
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return [data]
+    return []
@@ -4,16 +4,22 @@ Trace ingestion: Load and parse distributed trace spans.
 Supports OpenTelemetry and Jaeger JSON formats.
 """
 
-import json
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from autorca_core.model.events import Span
+from autorca_core.model.events import Span, intern_name, parse_timestamp, timestamp_ns
 from autorca_core.logging import get_logger
+from autorca_core.ingestion.fields import SharedTags
+from autorca_core.ingestion.files import file_loader, iter_source_files
+from autorca_core.ingestion.records import iter_json_records
 
 logger = get_logger(__name__)
 
+_TRACE_SUFFIXES = frozenset({'.jsonl', '.json'})
+
 
 def load_traces(
     source: str,
@@ -21,6 +27,8 @@ def load_traces(
     time_to: Optional[datetime] = None,
     service_filter: Optional[str] = None,
     trace_id_filter: Optional[str] = None,
+    keep_raw: bool = False,
+    max_workers: Optional[int] = None,
 ) -> List[Span]:
     """
     Load trace spans from a file or directory.
@@ -31,6 +39,10 @@ def load_traces(
         time_to: End of time window (inclusive)
         service_filter: Only include spans from this service
         trace_id_filter: Only include spans from this trace
+        keep_raw: Keep each span's decoded record in ``raw_data`` (off by
+            default to save memory)
+        max_workers: If greater than 1, parse the files of a directory in that
+            many worker processes
 
     Returns:
         List of Span objects
@@ -43,67 +55,52 @@ def load_traces(
     spans = []
 
     if source_path.is_file():
-        spans.extend(_load_trace_file(source_path))
+        spans.extend(_load_trace_file(source_path, keep_raw))
     else:
         # Load all .jsonl, .json files in directory
-        extensions = ['*.jsonl', '*.json']
-        for ext in extensions:
-            for file_path in source_path.glob(f"**/{ext}"):
-                spans.extend(_load_trace_file(file_path))
-
-    # Apply filters
-    if time_from:
-        spans = [s for s in spans if s.timestamp >= time_from]
-    if time_to:
-        spans = [s for s in spans if s.timestamp <= time_to]
-    if service_filter:
-        spans = [s for s in spans if s.service == service_filter]
-    if trace_id_filter:
-        spans = [s for s in spans if s.trace_id == trace_id_filter]
-
-    return sorted(spans, key=lambda s: s.timestamp)
+        files = list(iter_source_files(source_path, _TRACE_SUFFIXES))
+        load_file = partial(_load_trace_file, keep_raw=keep_raw)
+        with file_loader(load_file, files, max_workers) as load:
+            for file_path in files:
+                spans.extend(load(file_path))
+
+    # Apply all filters in one pass, on the precomputed epoch nanoseconds
+    if time_from or time_to or service_filter or trace_id_filter:
+        from_ns = timestamp_ns(time_from) if time_from else None
+        to_ns = timestamp_ns(time_to) if time_to else None
+        spans = [
+            s for s in spans
+            if (from_ns is None or s._ts_ns >= from_ns)
+            and (to_ns is None or s._ts_ns <= to_ns)
+            and (not service_filter or s.service == service_filter)
+            and (not trace_id_filter or s.trace_id == trace_id_filter)
+        ]
+
+    spans.sort(key=attrgetter('_ts_ns'))
+    return spans
 
 
-def _load_trace_file(file_path: Path) -> List[Span]:
+def _load_trace_file(file_path: Path, keep_raw: bool = False) -> List[Span]:
     """Load a single trace file."""
     spans = []
+    tag_sets = SharedTags()
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        # Try to parse as JSON array first
-        try:
-            data = json.load(f)
-            if isinstance(data, list):
-                for item in data:
-                    span = _parse_span(item)
-                    if span:
-                        spans.append(span)
-                return spans
-        except json.JSONDecodeError:
-            # Fall back to JSON Lines
-            f.seek(0)
-
-        # Parse as JSON Lines
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                item = json.loads(line)
-                span = _parse_span(item)
-                if span:
-                    spans.append(span)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON line {line_num} in {file_path}: {e}")
+    for item in iter_json_records(file_path):
+        span = _parse_span(item, keep_raw, tag_sets)
+        if span:
+            spans.append(span)
 
     return spans
 
 
-def _parse_span(item: Dict[str, Any]) -> Optional[Span]:
+def _parse_span(
+    item: Dict[str, Any], keep_raw: bool = False, tag_sets: Optional[SharedTags] = None
+) -> Optional[Span]:
     """
     Parse a span from JSON.
 
-    Supports OpenTelemetry and Jaeger-style span formats.
+    Supports OpenTelemetry and Jaeger-style span formats. ``tag_sets`` shares
+    equal tags across the spans of a file.
     """
     try:
         # Extract timestamp (may be in nanoseconds or ISO format)
@@ -112,15 +109,18 @@ def _parse_span(item: Dict[str, Any]) -> Optional[Span]:
             return None
 
         if isinstance(timestamp_val, (int, float)):
-            # Assume nanoseconds or microseconds
-            if timestamp_val > 1e15:  # Likely nanoseconds
+            # Epoch unit by magnitude: present-day dates are ~1.7e9 seconds,
+            # so each unit's range is three orders of magnitude above the last
+            if timestamp_val > 1e17:  # Likely nanoseconds
                 timestamp = datetime.fromtimestamp(timestamp_val / 1e9)
-            elif timestamp_val > 1e12:  # Likely microseconds
+            elif timestamp_val > 1e14:  # Likely microseconds
                 timestamp = datetime.fromtimestamp(timestamp_val / 1e6)
+            elif timestamp_val > 1e11:  # Likely milliseconds
+                timestamp = datetime.fromtimestamp(timestamp_val / 1e3)
             else:  # Likely seconds
                 timestamp = datetime.fromtimestamp(timestamp_val)
         else:
-            timestamp = datetime.fromisoformat(str(timestamp_val).replace('Z', '+00:00'))
+            timestamp = parse_timestamp(str(timestamp_val))
 
         # Extract required fields
         span_id = item.get('span_id') or item.get('spanId') or item.get('id', 'unknown')
@@ -148,24 +148,20 @@ def _parse_span(item: Dict[str, Any]) -> Optional[Span]:
         error = item.get('error', False) or item.get('has_error', False)
 
         # Extract tags
-        tags = item.get('tags', {})
-        if isinstance(tags, dict):
-            tags = {str(k): str(v) for k, v in tags.items()}
-        else:
-            tags = {}
+        tags = (tag_sets or SharedTags()).from_record(item.get('tags'))
 
         return Span(
             timestamp=timestamp,
             service=service,
             span_id=str(span_id),
-            trace_id=str(trace_id),
+            trace_id=intern_name(str(trace_id)),
             parent_span_id=str(parent_span_id) if parent_span_id else None,
-            operation_name=operation_name,
+            operation_name=intern_name(operation_name),
             duration_ms=duration_ms,
             status_code=int(status_code) if status_code else None,
             error=error,
             tags=tags,
-            raw_data=item,
+            raw_data=item if keep_raw else None,
         )
     except (ValueError, KeyError):
         return None
@@ -4,9 +4,47 @@ Logging configuration for AutoRCA-Core.
 Provides structured logging with configurable log levels and formats.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+from autorca_core import _json
+
+# Background listeners that own the real handlers, one per configured logger
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# Whether get_logger() has made sure the package logger is configured
+_defaults_applied = False
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format each record as one JSON object per line.
+
+    Fields are encoded by the JSON backend rather than interpolated into a
+    template, so quotes, backslashes and newlines in messages (and exception
+    tracebacks) are escaped and every line stays valid JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "module": record.module,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return _json.dumps(entry)
 
 
 def configure_logging(
@@ -17,6 +55,9 @@ def configure_logging(
     """
     Configure AutoRCA logging.
 
+    Records are handed to a queue and written to stderr by a background
+    listener thread, so logging calls never block on the stream write.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         structured: If True, use JSON-structured log format
@@ -37,11 +78,7 @@ def configure_logging(
     logger.handlers.clear()
 
     if structured:
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"module": "%(module)s", "function": "%(funcName)s", '
-            '"message": "%(message)s"}'
-        )
+        formatter: logging.Formatter = JSONFormatter()
     else:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -50,7 +87,15 @@ def configure_logging(
 
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    previous = _listeners.pop(logger_name, None)
+    if previous is not None:
+        previous.stop()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    _listeners[logger_name] = listener
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -58,22 +103,38 @@ def configure_logging(
     return logger
 
 
+def _stop_listeners() -> None:
+    """Flush and stop every queue listener (registered to run at exit)."""
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger instance.
 
+    The package logger is given default settings on first use unless it has
+    been configured already; child loggers only propagate to it.
+
     Args:
-        name: Optional logger name (defaults to "autorca_core")
+        name: Optional logger name, relative to "autorca_core" unless it is
+            already a module name inside the package (such as ``__name__``)
 
     Returns:
         Logger instance
     """
-    logger_name = f"autorca_core.{name}" if name else "autorca_core"
-    logger = logging.getLogger(logger_name)
-
-    # If logger has no handlers, configure it with default settings
-    if not logger.handlers:
-        configure_logging()
-
-    return logger
-
+    global _defaults_applied
+    if not _defaults_applied:
+        if not logging.getLogger("autorca_core").handlers:
+            configure_logging()
+        _defaults_applied = True
+
+    if not name or name == "autorca_core":
+        return logging.getLogger("autorca_core")
+    if name.startswith("autorca_core."):
+        return logging.getLogger(name)
+    return logging.getLogger(f"autorca_core.{name}")
@@ -5,7 +5,7 @@ Exposes AutoRCA-Core functionality as MCP tools for integration with
 Claude Desktop, Claude Code, and other MCP-compatible clients.
 """
 
-from autorca_core.mcp.server import create_mcp_server, start_mcp_server
+from autorca_core.mcp.server import clear_load_cache, create_mcp_server, start_mcp_server
 
-__all__ = ["create_mcp_server", "start_mcp_server"]
+__all__ = ["clear_load_cache", "create_mcp_server", "start_mcp_server"]
 
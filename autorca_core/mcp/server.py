@@ -9,15 +9,19 @@ Provides MCP tools for:
 """
 
 import asyncio
-import json
+import heapq
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from autorca_core.reasoning.loop import run_rca_from_files, DataSourcesConfig, run_rca
 from autorca_core.outputs.reports import generate_markdown_report, generate_json_report
 from autorca_core.ingestion import load_logs, load_metrics, load_traces
 from autorca_core.graph_engine.builder import build_service_graph
 from autorca_core.reasoning.rules import apply_rules
+from autorca_core.cache.exact import fingerprint_paths
 from autorca_core.config import ThresholdConfig
 from autorca_core.logging import configure_logging, get_logger
 
@@ -178,36 +182,97 @@ def create_mcp_server():
                     "required": ["logs_path"],
                 },
             ),
+            Tool(
+                name="clear_cache",
+                description=(
+                    "Drop the log, metric and trace data cached between tool calls, "
+                    "so the next call reads the files again."
+                ),
+                inputSchema={"type": "object", "properties": {}},
+            ),
         ]
 
     @server.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
         """Handle tool calls."""
-        logger.info(f"MCP tool called: {name} with args: {arguments}")
+        logger.info("MCP tool called: %s with args: %s", name, arguments)
 
         try:
-            if name == "run_rca":
-                result = await _handle_run_rca(arguments)
-            elif name == "analyze_logs":
-                result = await _handle_analyze_logs(arguments)
-            elif name == "get_service_graph":
-                result = await _handle_get_service_graph(arguments)
-            elif name == "find_root_causes":
-                result = await _handle_find_root_causes(arguments)
-            else:
+            handler = _HANDLERS.get(name)
+            if handler is None:
                 result = f"Unknown tool: {name}"
+            else:
+                # Handlers load files and run the analysis synchronously; run
+                # them in a worker thread so the event loop keeps serving the
+                # transport (pings, cancellations, concurrent calls)
+                result = await asyncio.to_thread(handler, arguments)
 
             return [TextContent(type="text", text=result)]
 
         except Exception as e:
-            logger.error(f"Error in tool {name}: {e}", exc_info=True)
+            logger.error("Error in tool %s: %s", name, e, exc_info=True)
             error_msg = f"Error executing {name}: {str(e)}"
             return [TextContent(type="text", text=error_msg)]
 
     return server
 
 
-async def _handle_run_rca(args: Dict[str, Any]) -> str:
+_MAX_CACHED_SOURCES = 8
+
+# (loader, path) -> (fingerprint, options, events), least recently used first.
+# Handlers run in worker threads, so the cache is guarded by a lock.
+_loaded: "OrderedDict[Tuple[Callable[..., List[Any]], str], Tuple[Any, Any, List[Any]]]" = (
+    OrderedDict()
+)
+_loaded_lock = threading.Lock()
+
+
+def _load_cached(loader: Callable[..., List[Any]], path: str, **options: Any) -> List[Any]:
+    """
+    Call ``loader(path, **options)``, reusing the result of an identical earlier call.
+
+    One result is kept per loader and path, for the files' current paths,
+    sizes and modification times (see fingerprint_paths()) and the options
+    it was loaded with. Editing, adding or removing a file, or asking for
+    other options, replaces that result; at most _MAX_CACHED_SOURCES
+    sources are kept. Clients typically query the same dataset repeatedly.
+
+    Returns:
+        A new list of the loaded events (the cached list itself is never handed out)
+    """
+    fingerprint = tuple(map(tuple, fingerprint_paths([path])))
+    key, stamp = (loader, path), (fingerprint, tuple(sorted(options.items())))
+    with _loaded_lock:
+        entry = _loaded.get(key)
+        if entry is not None and entry[:2] == stamp:
+            _loaded.move_to_end(key)
+            return list(entry[2])
+        # Dropped before reloading, so the stale and the new events are not both held
+        _loaded.pop(key, None)
+
+    events = loader(path, **options)
+    with _loaded_lock:
+        _loaded[key] = (*stamp, events)
+        _loaded.move_to_end(key)
+        while len(_loaded) > _MAX_CACHED_SOURCES:
+            _loaded.popitem(last=False)
+    return list(events)
+
+
+def clear_load_cache() -> int:
+    """
+    Drop every data source the MCP tools have cached.
+
+    Returns:
+        Number of cached sources removed
+    """
+    with _loaded_lock:
+        count = len(_loaded)
+        _loaded.clear()
+    return count
+
+
+def _handle_run_rca(args: Dict[str, Any]) -> str:
     """Handle run_rca tool call."""
     logs_path = args["logs_path"]
     symptom = args["symptom"]
@@ -217,7 +282,7 @@ async def _handle_run_rca(args: Dict[str, Any]) -> str:
     window_minutes = args.get("window_minutes", 60)
     output_format = args.get("format", "markdown")
 
-    logger.info(f"Running RCA for symptom: {symptom}")
+    logger.info("Running RCA for symptom: %s", symptom)
 
     # Run RCA
     result = run_rca_from_files(
@@ -236,7 +301,7 @@ async def _handle_run_rca(args: Dict[str, Any]) -> str:
         return generate_markdown_report(result)
 
 
-async def _handle_analyze_logs(args: Dict[str, Any]) -> str:
+def _handle_analyze_logs(args: Dict[str, Any]) -> str:
     """Handle analyze_logs tool call."""
     logs_path = args["logs_path"]
     time_from_str = args.get("time_from")
@@ -247,15 +312,24 @@ async def _handle_analyze_logs(args: Dict[str, Any]) -> str:
     time_from = datetime.fromisoformat(time_from_str) if time_from_str else None
     time_to = datetime.fromisoformat(time_to_str) if time_to_str else None
 
-    logger.info(f"Analyzing logs from: {logs_path}")
+    logger.info("Analyzing logs from: %s", logs_path)
 
     # Load logs
-    logs = load_logs(logs_path, time_from, time_to, service_filter)
+    logs = _load_cached(
+        load_logs, logs_path,
+        time_from=time_from, time_to=time_to, service_filter=service_filter,
+    )
 
-    # Analyze
+    # Analyze in one pass
     total_logs = len(logs)
-    error_logs = [log for log in logs if log.is_error()]
-    services = set(log.service for log in logs)
+    error_logs = []
+    errors_by_service: Counter = Counter()
+    services = set()
+    for log in logs:
+        services.add(log.service)
+        if log.is_error():
+            error_logs.append(log)
+            errors_by_service[log.service] += 1
 
     # Build summary
     summary_parts = [
@@ -274,19 +348,18 @@ async def _handle_analyze_logs(args: Dict[str, Any]) -> str:
     if services:
         summary_parts.append("**Services Detected:**")
         for service in sorted(services):
-            service_errors = len([log for log in error_logs if log.service == service])
-            summary_parts.append(f"- {service}: {service_errors} errors")
+            summary_parts.append(f"- {service}: {errors_by_service[service]} errors")
         summary_parts.append("")
 
     if error_logs:
         summary_parts.append("**Recent Errors:**")
-        for log in sorted(error_logs, key=lambda x: x.timestamp, reverse=True)[:10]:
+        for log in heapq.nlargest(10, error_logs, key=attrgetter('timestamp')):
             summary_parts.append(f"- [{log.timestamp.isoformat()}] {log.service}: {log.message[:100]}")
 
     return "\n".join(summary_parts)
 
 
-async def _handle_get_service_graph(args: Dict[str, Any]) -> str:
+def _handle_get_service_graph(args: Dict[str, Any]) -> str:
     """Handle get_service_graph tool call."""
     logs_path = args["logs_path"]
     traces_path = args.get("traces_path")
@@ -295,26 +368,25 @@ async def _handle_get_service_graph(args: Dict[str, Any]) -> str:
     logger.info("Building service graph")
 
     # Load data
-    logs = load_logs(logs_path) if logs_path else []
-    traces = load_traces(traces_path) if traces_path else []
-    metrics = load_metrics(metrics_path) if metrics_path else []
+    logs = _load_cached(load_logs, logs_path) if logs_path else []
+    traces = _load_cached(load_traces, traces_path) if traces_path else []
+    metrics = _load_cached(load_metrics, metrics_path) if metrics_path else []
 
     # Build graph
     graph = build_service_graph(logs=logs, metrics=metrics, traces=traces)
 
     # Convert to JSON
-    graph_dict = graph.to_dict()
-    return json.dumps(graph_dict, indent=2, default=str)
+    return graph.to_json_bytes(indent=True).decode("utf-8")
 
 
-async def _handle_find_root_causes(args: Dict[str, Any]) -> str:
+def _handle_find_root_causes(args: Dict[str, Any]) -> str:
     """Handle find_root_causes tool call."""
     logs_path = args["logs_path"]
     metrics_path = args.get("metrics_path")
     traces_path = args.get("traces_path")
     sensitivity = args.get("sensitivity", "normal")
 
-    logger.info(f"Finding root causes with sensitivity: {sensitivity}")
+    logger.info("Finding root causes with sensitivity: %s", sensitivity)
 
     # Configure thresholds based on sensitivity
     if sensitivity == "strict":
@@ -325,9 +397,9 @@ async def _handle_find_root_causes(args: Dict[str, Any]) -> str:
         thresholds = ThresholdConfig()
 
     # Load data
-    logs = load_logs(logs_path) if logs_path else []
-    metrics = load_metrics(metrics_path) if metrics_path else []
-    traces = load_traces(traces_path) if traces_path else []
+    logs = _load_cached(load_logs, logs_path) if logs_path else []
+    metrics = _load_cached(load_metrics, metrics_path) if metrics_path else []
+    traces = _load_cached(load_traces, traces_path) if traces_path else []
 
     # Build graph and find candidates
     graph = build_service_graph(logs=logs, metrics=metrics, traces=traces, thresholds=thresholds)
@@ -356,6 +428,20 @@ async def _handle_find_root_causes(args: Dict[str, Any]) -> str:
     return "\n".join(result_parts)
 
 
+def _handle_clear_cache(args: Dict[str, Any]) -> str:
+    """Handle clear_cache tool call."""
+    return f"Removed {clear_load_cache()} cached data source(s)"
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "run_rca": _handle_run_rca,
+    "analyze_logs": _handle_analyze_logs,
+    "get_service_graph": _handle_get_service_graph,
+    "find_root_causes": _handle_find_root_causes,
+    "clear_cache": _handle_clear_cache,
+}
+
+
 def start_mcp_server():
     """Start the MCP server (stdio transport)."""
     configure_logging(level="INFO")
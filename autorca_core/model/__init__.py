@@ -3,12 +3,14 @@ Model layer: Core data structures for events, metrics, traces, and graphs.
 """
 
 from autorca_core.model.events import Event, LogEvent, MetricPoint, Span
+from autorca_core.model.metric_series import MetricSeries
 from autorca_core.model.graph import Service, Dependency, IncidentNode, ServiceGraph
 
 __all__ = [
     "Event",
     "LogEvent",
     "MetricPoint",
+    "MetricSeries",
     "Span",
     "Service",
     "Dependency",
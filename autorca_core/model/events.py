@@ -4,11 +4,62 @@ Event models: LogEvent, MetricPoint, Span, and base Event class.
 These models represent normalized observations from logs, metrics, traces, and configs.
 """
 
+import sys
 from datetime import datetime
-from typing import Dict, Any, Optional, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Literal
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    # Optional C parser for ISO 8601 (the ``fast`` extra)
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - exercised when ciso8601 is absent
+    if sys.version_info >= (3, 11):
+        # fromisoformat() accepts a trailing 'Z' itself from 3.11 on
+        _parse_iso = datetime.fromisoformat
+    else:
+
+        def _parse_iso(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def timestamp_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime to integer nanoseconds since the epoch.
+
+    Rounded through microseconds (datetime's resolution), so the result is exact.
+    """
+    return round(timestamp.timestamp() * 1_000_000) * 1000
+
+
+def intern_name(value: Any) -> Any:
+    """
+    Return ``value`` interned if it is a string, otherwise unchanged.
+
+    For name-like fields (service, metric, unit, operation) that repeat across
+    most records: every record then refers to one shared string object instead
+    of its own copy, and equality checks on them short-circuit on identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Uses ciso8601 when it is installed, datetime.fromisoformat() otherwise.
+    Cached by string: ingested events often share timestamps (one per second
+    or per scrape), and datetimes are immutable so the parsed value can be
+    reused.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+    """
+    return _parse_iso(value)
+
 
 class EventType(str, Enum):
     """Type of observability event."""
@@ -28,7 +79,27 @@ class Severity(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+# Level names (upper-cased) that count as errors. FATAL is what ingestion maps to
+# CRITICAL, listed for events built directly from raw level strings.
+ERROR_LEVELS = frozenset({Severity.ERROR.value, Severity.CRITICAL.value, "FATAL"})
+
+# What the events' get_tags()/get_raw_data() return for an event without tags or raw data.
+# Most events have neither, so those fields default to None rather than a new
+# empty dict per event; read them through the getters to always get a mapping.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _get_tags(self) -> Mapping[str, str]:
+    """Return the tags, or an empty read-only mapping if there are none."""
+    return _EMPTY_MAPPING if self.tags is None else self.tags
+
+
+def _get_raw_data(self) -> Mapping[str, Any]:
+    """Return the raw source record, or an empty read-only mapping if it was not kept."""
+    return _EMPTY_MAPPING if self.raw_data is None else self.raw_data
+
+
+@dataclass(slots=True)
 class Event:
     """
     Base event class for all observability signals.
@@ -38,16 +109,22 @@ class Event:
     timestamp: datetime
     service: str
     event_type: EventType
-    raw_data: Dict[str, Any] = field(default_factory=dict)
-    tags: Dict[str, str] = field(default_factory=dict)
+    raw_data: Optional[Dict[str, Any]] = None
+    tags: Optional[Dict[str, str]] = None
+    _ts_ns: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure timestamp is a datetime object."""
+        """Normalize the timestamp, precompute its epoch nanoseconds and intern names."""
         if isinstance(self.timestamp, str):
-            self.timestamp = datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+            self.timestamp = parse_timestamp(self.timestamp)
+        self._ts_ns = timestamp_ns(self.timestamp)
+        self.service = intern_name(self.service)
+
+    get_tags = _get_tags
+    get_raw_data = _get_raw_data
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent(Event):
     """
     Normalized log event.
@@ -61,6 +138,7 @@ class LogEvent(Event):
         error_type: Error class or type (optional)
         stack_trace: Stack trace if available (optional)
     """
+    event_type: EventType = EventType.LOG
     message: str = ""
     level: Severity = Severity.INFO
     logger: Optional[str] = None
@@ -68,17 +146,21 @@ class LogEvent(Event):
     request_id: Optional[str] = None
     error_type: Optional[str] = None
     stack_trace: Optional[str] = None
+    _is_error: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        super().__post_init__()
+        # Zero-argument super() does not work in slotted dataclasses
+        Event.__post_init__(self)
         self.event_type = EventType.LOG
+        # Events are treated as immutable once built, so classify the level once
+        self._is_error = str(getattr(self.level, "value", self.level)).upper() in ERROR_LEVELS
 
     def is_error(self) -> bool:
         """Check if this is an error-level log."""
-        return self.level in (Severity.ERROR, Severity.CRITICAL)
+        return self._is_error
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricPoint:
     """
     Normalized metric data point.
@@ -90,16 +172,23 @@ class MetricPoint:
     metric_name: str
     value: float
     unit: Optional[str] = None
-    tags: Dict[str, str] = field(default_factory=dict)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    tags: Optional[Dict[str, str]] = None
+    raw_data: Optional[Dict[str, Any]] = None
+    _ts_ns: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure timestamp is a datetime object."""
+        """Normalize the timestamp, precompute its epoch nanoseconds and intern names."""
         if isinstance(self.timestamp, str):
-            self.timestamp = datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+            self.timestamp = parse_timestamp(self.timestamp)
+        self._ts_ns = timestamp_ns(self.timestamp)
+        self.service = intern_name(self.service)
+        self.metric_name = intern_name(self.metric_name)
 
+    get_tags = _get_tags
+    get_raw_data = _get_raw_data
 
-@dataclass
+
+@dataclass(slots=True)
 class Span:
     """
     Normalized distributed trace span.
@@ -115,20 +204,30 @@ class Span:
     duration_ms: float = 0.0
     status_code: Optional[int] = None
     error: bool = False
-    tags: Dict[str, str] = field(default_factory=dict)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    tags: Optional[Dict[str, str]] = None
+    raw_data: Optional[Dict[str, Any]] = None
+    _ts_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _is_error: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure timestamp is a datetime object."""
+        """Ensure timestamp is a datetime object and classify the span once."""
         if isinstance(self.timestamp, str):
-            self.timestamp = datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+            self.timestamp = parse_timestamp(self.timestamp)
+        self._ts_ns = timestamp_ns(self.timestamp)
+        self.service = intern_name(self.service)
+        self._is_error = bool(self.error) or (
+            self.status_code is not None and self.status_code >= 400
+        )
 
     def is_error(self) -> bool:
         """Check if this span represents an error."""
-        return self.error or (self.status_code is not None and self.status_code >= 400)
+        return self._is_error
+
+    get_tags = _get_tags
+    get_raw_data = _get_raw_data
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigChange:
     """
     Represents a configuration or deployment change event.
@@ -142,10 +241,16 @@ class ConfigChange:
     version_before: Optional[str] = None
     version_after: Optional[str] = None
     changed_by: Optional[str] = None
-    tags: Dict[str, str] = field(default_factory=dict)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    tags: Optional[Dict[str, str]] = None
+    raw_data: Optional[Dict[str, Any]] = None
+    _ts_ns: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure timestamp is a datetime object."""
+        """Normalize the timestamp, precompute its epoch nanoseconds and intern names."""
         if isinstance(self.timestamp, str):
-            self.timestamp = datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+            self.timestamp = parse_timestamp(self.timestamp)
+        self._ts_ns = timestamp_ns(self.timestamp)
+        self.service = intern_name(self.service)
+
+    get_tags = _get_tags
+    get_raw_data = _get_raw_data
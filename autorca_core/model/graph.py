@@ -5,11 +5,16 @@ These models represent the topology and causal relationships between services,
 dependencies, and incident symptoms.
 """
 
+import heapq
+from collections.abc import MutableSet
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
+from autorca_core import _json
+from autorca_core.model.events import parse_timestamp
+
 
 class DependencyType(str, Enum):
     """Type of dependency between services."""
@@ -32,7 +37,13 @@ class IncidentType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Member -> value, for serializing many edges and incidents: a dict lookup is
+# several times cheaper than the Enum.value property
+_DEPENDENCY_TYPE_VALUES = {member: member.value for member in DependencyType}
+_INCIDENT_TYPE_VALUES = {member: member.value for member in IncidentType}
+
+
+@dataclass(slots=True)
 class Service:
     """
     Represents a service node in the service graph.
@@ -55,7 +66,7 @@ class Service:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     """
     Represents a dependency edge between two services.
@@ -73,20 +84,69 @@ class Dependency:
     weight: float = 1.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def key(self) -> "DependencyKey":
+        """The edge's identity in ServiceGraph.dependencies."""
+        return (self.from_service, self.to_service, self.dependency_type)
+
     def __hash__(self):
-        return hash((self.from_service, self.to_service, self.dependency_type))
+        return hash(self.key)
 
     def __eq__(self, other):
         if isinstance(other, Dependency):
-            return (
-                self.from_service == other.from_service
-                and self.to_service == other.to_service
-                and self.dependency_type == other.dependency_type
-            )
+            return self.key == other.key
         return False
 
 
-@dataclass
+DependencyKey = Tuple[str, str, DependencyType]
+
+
+class DependencySet(MutableSet):
+    """
+    The dependency edges of a ServiceGraph: a set of Dependency objects.
+
+    Edges are stored by Dependency.key, so membership and duplicate checks
+    are one dict lookup and iteration follows the order edges were added.
+    Once owned by a graph, add() and discard() go through the graph so its
+    per-service indexes and version stay current.
+    """
+
+    __slots__ = ("_by_key", "_graph")
+
+    def __init__(self, dependencies: Iterable[Dependency] = ()):
+        self._by_key: Dict[DependencyKey, Dependency] = {}
+        self._graph: Optional["ServiceGraph"] = None
+        for dependency in dependencies:
+            self._by_key.setdefault(dependency.key, dependency)
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, Dependency) and item.key in self._by_key
+
+    def __iter__(self) -> Iterator[Dependency]:
+        return iter(self._by_key.values())
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __repr__(self) -> str:
+        return f"DependencySet({list(self._by_key.values())!r})"
+
+    def add(self, dependency: Dependency) -> None:
+        """Add an edge (no-op if an edge with the same key is present)."""
+        if self._graph is not None:
+            self._graph.add_dependency(dependency)
+        else:
+            self._by_key.setdefault(dependency.key, dependency)
+
+    def discard(self, dependency: Dependency) -> None:
+        """Remove the edge with the same key as ``dependency``, if present."""
+        if self._graph is not None:
+            self._graph.remove_dependency(dependency)
+        else:
+            self._by_key.pop(dependency.key, None)
+
+
+@dataclass(slots=True)
 class IncidentNode:
     """
     Represents an incident symptom or anomaly detected in a service.
@@ -107,13 +167,27 @@ class IncidentNode:
     description: str = ""
     evidence: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Ensure timestamp is a datetime object and severity is valid."""
         if isinstance(self.timestamp, str):
-            self.timestamp = datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
+            self.timestamp = parse_timestamp(self.timestamp)
         self.severity = max(0.0, min(1.0, self.severity))
 
+    def timestamp_iso(self) -> str:
+        """
+        Return ``timestamp.isoformat()``, formatted on first use only.
+
+        Incidents are serialized repeatedly (graph dict, timeline, prompts) and
+        are not changed once built, so the string is kept.
+        """
+        # getattr: instances unpickled from before this slot existed lack it
+        iso = getattr(self, "_iso", None)
+        if iso is None:
+            iso = self._iso = self.timestamp.isoformat()
+        return iso
+
 
 @dataclass
 class ServiceGraph:
@@ -122,14 +196,91 @@ class ServiceGraph:
 
     This graph represents the runtime relationships between services and
     is used to propagate causal analysis during RCA.
+
+    ``dependencies`` is a set of Dependency (a DependencySet) keyed by
+    Dependency.key (from, to, type), so duplicate edges are found with one
+    dict lookup and edges iterate in the order they were added. Dependencies
+    and incidents are also indexed by service, so the per-service getters
+    cost O(degree) instead of a scan of the whole graph. The indexes are
+    maintained by add_dependency(), remove_dependency() and add_incident()
+    (``dependencies.add()`` goes through add_dependency()); don't append to
+    ``incidents`` directly. Every change also bumps ``version``, so results
+    derived from the graph can be cached until it changes.
     """
     services: Dict[str, Service] = field(default_factory=dict)
-    dependencies: Set[Dependency] = field(default_factory=set)
+    dependencies: DependencySet = field(default_factory=DependencySet)
     incidents: List[IncidentNode] = field(default_factory=list)
+    _outbound: Dict[str, List[Dependency]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _inbound: Dict[str, List[Dependency]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _incidents_by_service: Dict[str, List[IncidentNode]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _severity_sum: Dict[str, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _evidence_pool: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index the dependencies and incidents the graph was created with."""
+        dependencies = self.dependencies
+        if isinstance(dependencies, dict):
+            # Graphs pickled while dependencies were a plain dict by key
+            dependencies = dependencies.values()
+        # Always a new set, so no other graph or caller shares this one
+        self.dependencies = DependencySet(dependencies)
+        self.dependencies._graph = self
+        for dependency in self.dependencies:
+            self._index_dependency(dependency)
+        for incident in self.incidents:
+            self._index_incident(incident)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Graphs pickled before the indexes existed (e.g. cached results) get them rebuilt
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_version", 0)
+        if "_evidence_pool" not in state or not isinstance(self.dependencies, DependencySet):
+            self._outbound, self._inbound = {}, {}
+            self._incidents_by_service, self._severity_sum = {}, {}
+            self._evidence_pool = {}
+            self.__post_init__()
+
+    @property
+    def version(self) -> int:
+        """Number of times the graph has been added to; changes on every add_* call."""
+        return self._version
 
     def add_service(self, service: Service) -> None:
         """Add a service to the graph."""
         self.services[service.name] = service
+        self._version += 1
+
+    def add_services_bulk(self, names: Iterable[str], service_type: str = "unknown") -> None:
+        """
+        Register many services at once.
+
+        Names that are already in the graph are left untouched, so callers can
+        pass every service name they saw, ideally de-duplicated up front.
+        """
+        services = self.services
+        for name in names:
+            if name not in services:
+                services[name] = Service(name=name, service_type=service_type)
+        self._version += 1
+
+    def _ensure_service(self, name: str) -> Service:
+        """Return the service called ``name``, creating it if the graph lacks it."""
+        service = self.services.get(name)
+        if service is None:
+            service = self.services[name] = Service(name=name)
+            self._version += 1
+        return service
 
     def add_dependency(self, dependency: Dependency) -> None:
         """
@@ -137,64 +288,132 @@ class ServiceGraph:
 
         Automatically creates service nodes if they don't exist.
         """
-        if dependency.from_service not in self.services:
-            self.add_service(Service(name=dependency.from_service))
-        if dependency.to_service not in self.services:
-            self.add_service(Service(name=dependency.to_service))
-        self.dependencies.add(dependency)
+        self._ensure_service(dependency.from_service)
+        self._ensure_service(dependency.to_service)
+        by_key = self.dependencies._by_key
+        key = dependency.key
+        if key not in by_key:
+            by_key[key] = dependency
+            self._index_dependency(dependency)
+            self._version += 1
+
+    def remove_dependency(self, dependency: Dependency) -> None:
+        """Remove the edge with the same key as ``dependency``, if the graph has it."""
+        removed = self.dependencies._by_key.pop(dependency.key, None)
+        if removed is not None:
+            self._outbound[removed.from_service].remove(removed)
+            self._inbound[removed.to_service].remove(removed)
+            self._version += 1
+
+    def _index_dependency(self, dependency: Dependency) -> None:
+        self._outbound.setdefault(dependency.from_service, []).append(dependency)
+        self._inbound.setdefault(dependency.to_service, []).append(dependency)
 
     def add_incident(self, incident: IncidentNode) -> None:
         """Add an incident node to the graph."""
-        if incident.service not in self.services:
-            self.add_service(Service(name=incident.service))
+        self._ensure_service(incident.service)
         self.incidents.append(incident)
+        self._index_incident(incident)
+        self._version += 1
+
+    def _index_incident(self, incident: IncidentNode) -> None:
+        # Evidence lines (error messages, metric readings) repeat across
+        # incidents; keep one copy of each per graph
+        pool = self._evidence_pool
+        incident.evidence = [pool.setdefault(line, line) for line in incident.evidence]
+        self._incidents_by_service.setdefault(incident.service, []).append(incident)
+        severity_sum = self._severity_sum
+        severity_sum[incident.service] = severity_sum.get(incident.service, 0.0) + incident.severity
 
     def get_dependencies_for_service(self, service_name: str) -> List[Dependency]:
-        """Get all outbound dependencies for a service."""
-        return [d for d in self.dependencies if d.from_service == service_name]
+        """Get all outbound dependencies for a service, in the order they were added."""
+        return list(self.iter_dependencies_for_service(service_name))
 
     def get_upstream_dependencies(self, service_name: str) -> List[Dependency]:
         """Get all services that depend on this service (upstream callers)."""
-        return [d for d in self.dependencies if d.to_service == service_name]
+        return list(self.iter_upstream_dependencies(service_name))
 
     def get_incidents_for_service(self, service_name: str) -> List[IncidentNode]:
-        """Get all incidents for a specific service."""
-        return [i for i in self.incidents if i.service == service_name]
+        """Get all incidents for a specific service, in the order they were added."""
+        return list(self.iter_incidents_for_service(service_name))
+
+    # The iter_* variants walk the index without copying it, for callers that
+    # stop at the first match; don't add to the graph while consuming one.
+
+    def iter_dependencies_for_service(self, service_name: str) -> Iterator[Dependency]:
+        """Iterate over the outbound dependencies of a service."""
+        return iter(self._outbound.get(service_name, ()))
+
+    def iter_upstream_dependencies(self, service_name: str) -> Iterator[Dependency]:
+        """Iterate over the dependencies pointing at a service."""
+        return iter(self._inbound.get(service_name, ()))
+
+    def iter_incidents_for_service(self, service_name: str) -> Iterator[IncidentNode]:
+        """Iterate over the incidents of a service."""
+        return iter(self._incidents_by_service.get(service_name, ()))
 
     def get_services_sorted_by_incident_severity(self) -> List[str]:
         """
         Return services sorted by total incident severity (highest first).
 
-        Useful for prioritizing which services to investigate first.
+        Useful for prioritizing which services to investigate first. The
+        totals are kept up to date by add_incident(), so this only sorts.
         """
-        severity_map: Dict[str, float] = {}
-        for incident in self.incidents:
-            severity_map[incident.service] = severity_map.get(incident.service, 0.0) + incident.severity
-        return sorted(severity_map.keys(), key=lambda s: severity_map[s], reverse=True)
+        severity_sum = self._severity_sum
+        return sorted(severity_sum, key=severity_sum.__getitem__, reverse=True)
+
+    def top_services(self, k: int) -> List[str]:
+        """
+        Return the ``k`` services with the highest total incident severity.
+
+        Same as the first ``k`` of get_services_sorted_by_incident_severity(),
+        without sorting every service.
+        """
+        severity_sum = self._severity_sum
+        return heapq.nlargest(k, severity_sum, key=severity_sum.__getitem__)
+
+    def iter_services_dict(self) -> Iterator[Dict[str, Any]]:
+        """Yield the serialized form of each service."""
+        for s in self.services.values():
+            yield {"name": s.name, "type": s.service_type, "metadata": s.metadata}
+
+    def iter_dependencies_dict(self) -> Iterator[Dict[str, Any]]:
+        """Yield the serialized form of each dependency edge."""
+        type_values = _DEPENDENCY_TYPE_VALUES
+        for d in self.dependencies:
+            yield {
+                "from": d.from_service,
+                "to": d.to_service,
+                "type": type_values[d.dependency_type],
+                "weight": d.weight,
+            }
+
+    def iter_incidents_dict(self) -> Iterator[Dict[str, Any]]:
+        """Yield the serialized form of each incident."""
+        type_values = _INCIDENT_TYPE_VALUES
+        for i in self.incidents:
+            yield {
+                "service": i.service,
+                "type": type_values[i.incident_type],
+                "timestamp": i.timestamp_iso(),
+                "severity": i.severity,
+                "description": i.description,
+                "evidence": i.evidence,
+            }
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the graph to a dictionary."""
         return {
-            "services": [{"name": s.name, "type": s.service_type, "metadata": s.metadata}
-                        for s in self.services.values()],
-            "dependencies": [
-                {
-                    "from": d.from_service,
-                    "to": d.to_service,
-                    "type": d.dependency_type.value,
-                    "weight": d.weight,
-                }
-                for d in self.dependencies
-            ],
-            "incidents": [
-                {
-                    "service": i.service,
-                    "type": i.incident_type.value,
-                    "timestamp": i.timestamp.isoformat(),
-                    "severity": i.severity,
-                    "description": i.description,
-                    "evidence": i.evidence,
-                }
-                for i in self.incidents
-            ],
+            "services": list(self.iter_services_dict()),
+            "dependencies": list(self.iter_dependencies_dict()),
+            "incidents": list(self.iter_incidents_dict()),
         }
+
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize the graph to UTF-8 JSON (the structure of to_dict()).
+
+        Encoded by orjson when installed. Metadata values that are not JSON
+        types are written as their str().
+        """
+        return _json.dumps_bytes(self.to_dict(), indent=indent)
@@ -0,0 +1,123 @@
+"""
+Metric series: Columnar storage for metric data points.
+
+MetricSeries keeps the fields of many metric points in parallel columns
+instead of one MetricPoint object per observation. Values and epoch
+nanoseconds live in typed arrays (8 bytes per point each), and service and
+metric names are dictionary-encoded to small integer codes. Scans over the
+values of one metric then read a contiguous block of floats rather than
+chasing a pointer to every point and its boxed value.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from autorca_core.model.events import MetricPoint
+
+
+class MetricSeries:
+    """
+    Column store of metric data points.
+
+    Attributes:
+        timestamps: Timestamp of each point
+        ts_ns: Epoch nanoseconds of each point
+        values: Value of each point
+        service_ids: Code of each point's service (an index into ``services``)
+        metric_ids: Code of each point's metric (an index into ``metric_names``)
+        units: Unit of each point
+        tags: Tags of each point (equal tag dicts are shared, as loaded)
+        services: Service names, by code, in first-seen order
+        metric_names: Metric names, by code, in first-seen order
+    """
+
+    __slots__ = (
+        'timestamps', 'ts_ns', 'values', 'service_ids', 'metric_ids', 'units', 'tags',
+        'services', 'metric_names', '_service_codes', '_metric_codes',
+    )
+
+    def __init__(self):
+        self.timestamps: List[datetime] = []
+        self.ts_ns = array('q')
+        self.values = array('d')
+        self.service_ids = array('I')
+        self.metric_ids = array('I')
+        self.units: List[Optional[str]] = []
+        self.tags: List[Dict[str, str]] = []
+        self.services: List[str] = []
+        self.metric_names: List[str] = []
+        self._service_codes: Dict[str, int] = {}
+        self._metric_codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_points(cls, points: Iterable[MetricPoint]) -> "MetricSeries":
+        """Build a series holding ``points`` in order."""
+        series = cls()
+        series.extend(points)
+        return series
+
+    def append(self, point: MetricPoint) -> None:
+        """Add one point (its raw_data is not kept)."""
+        self.extend((point,))
+
+    def extend(self, points: Iterable[MetricPoint]) -> None:
+        """Add ``points`` in order (their raw_data is not kept)."""
+        service_codes = self._service_codes
+        metric_codes = self._metric_codes
+        for point in points:
+            service_id = service_codes.get(point.service)
+            if service_id is None:
+                service_id = service_codes[point.service] = len(self.services)
+                self.services.append(point.service)
+            metric_id = metric_codes.get(point.metric_name)
+            if metric_id is None:
+                metric_id = metric_codes[point.metric_name] = len(self.metric_names)
+                self.metric_names.append(point.metric_name)
+
+            self.timestamps.append(point.timestamp)
+            self.ts_ns.append(point._ts_ns)
+            self.values.append(point.value)
+            self.service_ids.append(service_id)
+            self.metric_ids.append(metric_id)
+            self.units.append(point.unit)
+            self.tags.append(point.tags)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[MetricPoint]:
+        return map(self.to_point, range(len(self.values)))
+
+    def to_point(self, row: int) -> MetricPoint:
+        """Return row ``row`` as a (new) MetricPoint."""
+        return MetricPoint(
+            timestamp=self.timestamps[row],
+            service=self.services[self.service_ids[row]],
+            metric_name=self.metric_names[self.metric_ids[row]],
+            value=self.values[row],
+            unit=self.units[row],
+            tags=self.tags[row],
+        )
+
+    def groups(self) -> List[Tuple[str, str, List[int]]]:
+        """
+        Split the rows by service and metric.
+
+        Returns:
+            ``(service, metric_name, rows)`` for every combination present,
+            ordered by service then metric name, with each group's rows in
+            timestamp order (rows with equal timestamps keep their order)
+        """
+        by_key: Dict[int, List[int]] = {}
+        for row, (service_id, metric_id) in enumerate(zip(self.service_ids, self.metric_ids)):
+            # Codes are below 2**32, so a packed int stands in for the pair
+            by_key.setdefault(service_id << 32 | metric_id, []).append(row)
+
+        ts_ns = self.ts_ns
+        groups = []
+        for key, rows in by_key.items():
+            rows.sort(key=ts_ns.__getitem__)
+            groups.append((self.services[key >> 32], self.metric_names[key & 0xFFFFFFFF], rows))
+        groups.sort(key=lambda group: (group[0], group[1]))
+        return groups
@@ -10,6 +10,7 @@ from autorca_core.reasoning.loop import RCARunResult
 from autorca_core.reasoning.rules import RootCauseCandidate
 from autorca_core.model.graph import ServiceGraph
 from autorca_core.logging import get_logger
+from autorca_core import _json
 
 logger = get_logger(__name__)
 
@@ -151,7 +152,11 @@ def generate_json_report(result: RCARunResult, indent: int = 2) -> str:
     # Add timestamp
     report['generated_at'] = datetime.now().isoformat()
 
-    return json.dumps(report, indent=indent, default=str)
+    if indent == 2:
+        # The default layout is encoded by orjson when installed
+        return _json.dumps_bytes(report, indent=True).decode("utf-8")
+    # Non-ASCII text is kept as is, as the default layout keeps it
+    return json.dumps(report, indent=indent, ensure_ascii=False, default=str)
 
 
 def generate_html_report(result: RCARunResult) -> str:
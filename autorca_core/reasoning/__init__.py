@@ -4,7 +4,7 @@ Reasoning layer: RCA logic, heuristics, and LLM integration.
 
 from autorca_core.reasoning.loop import run_rca, RCARunResult
 from autorca_core.reasoning.rules import apply_rules, RootCauseCandidate
-from autorca_core.reasoning.llm import LLMInterface, DummyLLM
+from autorca_core.reasoning.llm import LLMInterface, DummyLLM, CachedLLM
 
 __all__ = [
     "run_rca",
@@ -13,4 +13,5 @@ __all__ = [
     "RootCauseCandidate",
     "LLMInterface",
     "DummyLLM",
+    "CachedLLM",
 ]
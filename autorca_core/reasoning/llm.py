@@ -5,17 +5,251 @@ Provides an abstraction for calling LLMs to enhance rule-based RCA with
 natural language explanations and insights.
 """
 
+import asyncio
+import atexit
+import hashlib
+import heapq
 import os
+import random
+import re
+import threading
 import time
-from typing import List, Dict, Any, Optional, Protocol
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import count
+from typing import (
+    TYPE_CHECKING, List, Dict, Any, Callable, Iterable, Iterator, Optional, Protocol, Tuple,
+    TypeVar,
+)
 from dataclasses import dataclass
 
-from autorca_core.model.graph import ServiceGraph
+from autorca_core.model.graph import Dependency, IncidentNode, ServiceGraph
 from autorca_core.reasoning.rules import RootCauseCandidate
 from autorca_core.logging import get_logger
+from autorca_core import _json
+
+if TYPE_CHECKING:
+    from autorca_core.cache.responses import DiskResponseCache
+    from autorca_core.cache.semantic import SemanticCache
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# System prompts are kept byte-identical across calls so that the prompt-cache
+# prefix they anchor stays valid.
+_RCA_SYSTEM_PROMPT = """You are an expert SRE (Site Reliability Engineer) analyzing a production incident.
+Your task is to provide a clear, actionable Root Cause Analysis based on the observability data and detected incidents.
+
+Provide your analysis in the following structure:
+
+## Executive Summary
+2-3 sentences summarizing the incident and most likely root cause.
+
+## Root Cause Analysis
+Identify the most likely root cause with:
+- Confidence level (High/Medium/Low)
+- Supporting evidence from the data
+- Why this is more likely than other candidates
+
+## Impact Assessment
+Describe the scope and severity of the impact.
+
+## Remediation Steps
+Provide specific, ordered steps to:
+1. Immediately resolve the issue
+2. Verify the fix is working
+3. Prevent recurrence
+
+## Monitoring Recommendations
+What metrics/logs to watch to ensure the issue is resolved and doesn't recur.
+
+Be concise, technical, and actionable. Focus on facts from the data provided."""
+
+# Shared by the single and batched remediation prompts
+_REMEDIATION_REQUEST = """Please provide enhanced, detailed remediation steps including:
+1. Immediate actions to resolve the issue
+2. Verification steps to confirm the fix
+3. Long-term prevention strategies
+4. Monitoring and alerting recommendations"""
+
+_ANSWER_RE = re.compile(r'<answer id="(\d+)">(.*?)</answer>', re.DOTALL)
+
+_REMEDIATION_SYSTEM_PROMPT = """You are an expert SRE providing remediation guidance.
+        Given a root cause and context, provide specific, actionable remediation steps.
+        Focus on immediate fixes, verification steps, and prevention strategies."""
+
+
+# A numbered ("1." / "1)") or bulleted ("-" / "* ") list item; a "*" must be
+# followed by whitespace so that **bold** lines are not taken for bullets
+_LIST_ITEM_RE = re.compile(r'\s*(?:\d+[.)]|-|\*(?=\s))\s*(.*\S)')
+
+
+def _parse_steps(text: str) -> List[str]:
+    """Return the numbered or bulleted lines of ``text``, without their markers."""
+    match = _LIST_ITEM_RE.match
+    return [m.group(1) for m in map(match, text.splitlines()) if m]
+
+
+def _remediation_details(candidate: RootCauseCandidate) -> str:
+    """Describe a candidate and its current remediation for a remediation prompt."""
+    evidence = "\n".join(f"- {e}" for e in candidate.evidence[:5])
+    steps = "\n".join(f"{i}. {step}" for i, step in enumerate(candidate.remediation, 1))
+    return f"""Root Cause: {candidate.service} - {candidate.incident_type.value}
+
+Explanation: {candidate.explanation}
+
+Current Evidence:
+{evidence}
+
+Current Remediation Steps:
+{steps}"""
+
+
+# Prompts are built canonically: everything listed is sorted by a total key
+# and whitespace is normalized, so equal inputs give byte-identical prompts
+# however their lists happen to be ordered, and the provider's prompt cache
+# keeps hitting.
+def _canonicalize(text: str) -> str:
+    """Normalize line endings to ``\\n`` and strip trailing whitespace from every line."""
+    return "\n".join(line.rstrip() for line in text.replace("\r\n", "\n").split("\n"))
+
+
+def _dependency_order(dep: Dependency) -> Tuple[str, str, str]:
+    return (dep.from_service, dep.to_service, dep.dependency_type.value)
+
+
+def _incident_order(incident: IncidentNode) -> Tuple[Any, ...]:
+    return (incident.timestamp, incident.service, incident.incident_type.value, incident.severity)
+
+
+def _candidate_order(candidate: RootCauseCandidate) -> Tuple[float, str]:
+    return (-candidate.confidence, candidate.service)
+
+
+# Templated prompt lines, formatted with str.format()
+_DEPENDENCY_LINE = "- {0.from_service} → {0.to_service} ({0.dependency_type.value})"
+_EVIDENCE_LINE = "- {}"
+_NUMBERED_LINE = "{}. {}"
+_CANDIDATE_HEADER = (
+    "### Candidate {index}: {c.service}\n"
+    "**Type:** {c.incident_type.value}\n"
+    "**Confidence:** {c.confidence:.0%}\n"
+    "**Explanation:** {c.explanation}\n"
+    "\n"
+    "**Evidence:**"
+)
+_CANDIDATE_REMEDIATION_HEADER = "\n**Suggested Remediation:**"
+
+
+def _approx_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _take_within_budget(
+    items: Iterable[T], render: Callable[[T], str], budget: int
+) -> Tuple[List[T], int]:
+    """
+    Take leading ``items`` while their rendered lines fit an estimated token budget.
+
+    Returns:
+        The items taken and the budget left over
+    """
+    taken = []
+    for item in items:
+        cost = _approx_tokens(render(item)) + 1  # the line plus its newline
+        if cost > budget:
+            break
+        budget -= cost
+        taken.append(item)
+    return taken, budget
+
+
+def _incident_line(incident: IncidentNode) -> str:
+    return (
+        f"- {incident.timestamp_iso()}: {incident.service} - "
+        f"{incident.incident_type.value} (severity: {incident.severity:.2f})"
+    )
+
+
+_DEPENDENCIES_HEADING = "**Service Dependencies:**"
+_TIMELINE_HEADING = "**Incident Timeline:**"
+
+
+def _build_rca_context(graph: ServiceGraph, token_budget: Optional[int] = None) -> str:
+    """
+    Build the first part of the RCA prompt: the topology and timeline.
+
+    This part depends only on the graph, not on the symptom or the
+    candidates, and is sent as a cacheable prefix of the user message.
+
+    Without a ``token_budget`` the first 10 dependencies and the earliest 15
+    incidents are listed. With one, incidents (highest severity first) and
+    then dependencies are added while the estimated size of the whole part
+    stays within the budget.
+    """
+    prompt_parts = [
+        f"# Root Cause Analysis Request",
+        f"",
+        f"## Service Topology",
+        f"",
+        f"**Services:** {len(graph.services)}",
+        f"**Dependencies:** {len(graph.dependencies)}",
+        f"**Incidents Detected:** {len(graph.incidents)}",
+        f"",
+    ]
+
+    if token_budget is None:
+        edges = heapq.nsmallest(10, graph.dependencies, key=_dependency_order)
+        timeline = heapq.nsmallest(15, graph.incidents, key=_incident_order)
+    else:
+        # Both section headings and their trailing blank lines are reserved up front
+        budget = token_budget - sum(
+            _approx_tokens(line) + 1
+            for line in (*prompt_parts, _DEPENDENCIES_HEADING, "", _TIMELINE_HEADING, "")
+        )
+        by_priority = sorted(
+            graph.incidents, key=lambda incident: (-incident.severity, _incident_order(incident))
+        )
+        timeline, budget = _take_within_budget(by_priority, _incident_line, budget)
+        timeline.sort(key=_incident_order)
+        edges, _ = _take_within_budget(
+            sorted(graph.dependencies, key=_dependency_order),
+            _DEPENDENCY_LINE.format,
+            budget,
+        )
+
+    # Add service graph structure (edges in sorted order)
+    if edges:
+        prompt_parts.append(_DEPENDENCIES_HEADING)
+        prompt_parts.extend(map(_DEPENDENCY_LINE.format, edges))
+        prompt_parts.append("")
+
+    # Add incident timeline (in time order)
+    if timeline:
+        prompt_parts.append(_TIMELINE_HEADING)
+        prompt_parts.extend(map(_incident_line, timeline))
+        prompt_parts.append("")
+
+    return _canonicalize("\n".join(prompt_parts))
+
+
+def _build_candidates_prompt(candidates: List[RootCauseCandidate], primary_symptom: str) -> str:
+    """Build the second part of the RCA prompt: the symptom and top 5 root cause candidates."""
+    prompt_parts = [f"**Primary Symptom:** {primary_symptom}", "", "## Root Cause Candidates", ""]
+
+    top_candidates = sorted(candidates, key=_candidate_order)[:5]
+    for i, candidate in enumerate(top_candidates, 1):
+        prompt_parts.append(_CANDIDATE_HEADER.format(index=i, c=candidate))
+        prompt_parts.extend(map(_EVIDENCE_LINE.format, candidate.evidence[:5]))
+        prompt_parts.append(_CANDIDATE_REMEDIATION_HEADER)
+        prompt_parts.extend(map(_NUMBERED_LINE.format, count(1), candidate.remediation))
+        prompt_parts.append("")
+
+    return _canonicalize("\n".join(prompt_parts))
+
 
 class LLMInterface(Protocol):
     """
@@ -61,6 +295,22 @@ class LLMInterface(Protocol):
         ...
 
 
+# Templated summary layout used by DummyLLM, formatted with str.format()
+_SUMMARY_HEADER = (
+    "## RCA Summary: {symptom}\n"
+    "\n"
+    "**Most Likely Root Cause:** {top.service} ({top.incident_type.value})\n"
+    "**Confidence:** {top.confidence:.0%}\n"
+    "\n"
+    "**Explanation:** {top.explanation}\n"
+    "\n"
+    "**Evidence:**"
+)
+_SUMMARY_ACTIONS_HEADER = "\n**Recommended Actions:**"
+_SUMMARY_OTHERS_HEADER = "\n**Other Possible Causes:**"
+_OTHER_CAUSE_LINE = "- {0.service}: {0.explanation} (confidence: {0.confidence:.0%})"
+
+
 class DummyLLM:
     """
     Dummy LLM implementation for testing and offline use.
@@ -80,34 +330,15 @@ class DummyLLM:
 
         top_candidate = candidates[0]
 
-        summary_parts = [
-            f"## RCA Summary: {primary_symptom}",
-            "",
-            f"**Most Likely Root Cause:** {top_candidate.service} ({top_candidate.incident_type.value})",
-            f"**Confidence:** {top_candidate.confidence:.0%}",
-            "",
-            f"**Explanation:** {top_candidate.explanation}",
-            "",
-            "**Evidence:**",
-        ]
-
-        for i, evidence in enumerate(top_candidate.evidence[:5], 1):
-            summary_parts.append(f"{i}. {evidence}")
+        summary_parts = [_SUMMARY_HEADER.format(symptom=primary_symptom, top=top_candidate)]
+        summary_parts.extend(map(_NUMBERED_LINE.format, count(1), top_candidate.evidence[:5]))
+        summary_parts.append(_SUMMARY_ACTIONS_HEADER)
+        summary_parts.extend(map(_NUMBERED_LINE.format, count(1), top_candidate.remediation))
 
-        summary_parts.append("")
-        summary_parts.append("**Recommended Actions:**")
-
-        for i, action in enumerate(top_candidate.remediation, 1):
-            summary_parts.append(f"{i}. {action}")
-
-        # Add other candidates if available
+        # Add other candidates if available (up to 3 more)
         if len(candidates) > 1:
-            summary_parts.append("")
-            summary_parts.append("**Other Possible Causes:**")
-            for candidate in candidates[1:4]:  # Show up to 3 more
-                summary_parts.append(
-                    f"- {candidate.service}: {candidate.explanation} (confidence: {candidate.confidence:.0%})"
-                )
+            summary_parts.append(_SUMMARY_OTHERS_HEADER)
+            summary_parts.extend(map(_OTHER_CAUSE_LINE.format, candidates[1:4]))
 
         return "\n".join(summary_parts)
 
@@ -161,23 +392,116 @@ class OpenAILLM:
         raise NotImplementedError("OpenAI integration not yet implemented")
 
 
+@lru_cache(maxsize=None)
+def _anthropic() -> Any:
+    """Import the optional anthropic package once and return the module."""
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "anthropic package required. Install with: pip install anthropic"
+        )
+    return anthropic
+
+
+# Synchronous clients shared per API key, so HTTP keep-alive connections
+# (and their TLS sessions) survive from one AnthropicLLM to the next
+_shared_clients: Dict[str, Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(api_key: str) -> Any:
+    """Return the process-wide ``anthropic.Anthropic`` client for ``api_key``."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = _shared_clients[api_key] = _anthropic().Anthropic(api_key=api_key)
+        return client
+
+
+def _close_shared_clients() -> None:
+    """Close the shared clients' connection pools (registered to run at exit)."""
+    with _shared_clients_lock:
+        while _shared_clients:
+            _, client = _shared_clients.popitem()
+            client.close()
+
+
+atexit.register(_close_shared_clients)
+
+
+# Statuses worth retrying: timeouts, conflicts, rate limits, server errors
+# and Anthropic's 529 "overloaded"
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+_MAX_RETRY_WAIT_SECONDS = 30.0
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Return the seconds to wait before retrying after ``error``, or None if retrying is pointless.
+
+    Connection failures, timeouts and the statuses above are retried; any
+    other error (a bad request, a rejected key, ...) would fail the same way
+    again. A numeric Retry-After header from the server is honoured.
+    Otherwise the wait doubles per attempt (1s, 2s, 4s, ...) plus up to a
+    second of random jitter, so concurrent callers do not retry in lockstep.
+    """
+    # Classified by shape rather than isinstance, so handling an error never
+    # needs the SDK (an injected client may be used without it installed)
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        if status_code not in _RETRYABLE_STATUS_CODES:
+            return None
+        try:
+            return min(float(error.response.headers["retry-after"]), _MAX_RETRY_WAIT_SECONDS)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            pass
+    elif not any(cls.__name__ == "APIConnectionError" for cls in type(error).__mro__):
+        # APITimeoutError subclasses APIConnectionError
+        return None
+
+    return min(2 ** attempt + random.uniform(0, 1), _MAX_RETRY_WAIT_SECONDS)
+
+
 class AnthropicLLM:
     """
     Anthropic Claude LLM integration for RCA summarization.
 
     Features:
-    - Automatic retry with exponential backoff
-    - Token usage tracking
+    - Automatic retry of transient errors with jittered exponential backoff
+    - Prompt caching of the system prompt
+    - Streamed summaries (summarize_rca_stream)
+    - Token usage tracking (including prompt-cache reads and writes)
+    - Optional on-disk cache of responses to identical requests
     - Cost estimation
     - Error handling with fallback to DummyLLM
     """
 
+    # Approximate list prices in USD per million (input, output) tokens.
+    # Prompt-cache writes cost 1.25x and reads 0.1x the input price; models
+    # not listed are estimated at Claude 3.5 Sonnet prices.
+    PRICING: Dict[str, Tuple[float, float]] = {
+        "claude-3-5-sonnet-20241022": (3.0, 15.0),
+        "claude-3-5-sonnet-20240620": (3.0, 15.0),
+        "claude-3-7-sonnet-20250219": (3.0, 15.0),
+        "claude-sonnet-4-20250514": (3.0, 15.0),
+        "claude-3-5-haiku-20241022": (0.80, 4.0),
+        "claude-3-haiku-20240307": (0.25, 1.25),
+        "claude-3-opus-20240229": (15.0, 75.0),
+        "claude-opus-4-20250514": (15.0, 75.0),
+    }
+    DEFAULT_PRICING = (3.0, 15.0)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "claude-3-5-sonnet-20241022",
         max_tokens: int = 2048,
         max_retries: int = 3,
+        token_budget: Optional[int] = None,
+        response_cache: Optional["DiskResponseCache"] = None,
+        strict: bool = False,
+        client: Optional[Any] = None,
     ):
         """
         Initialize Anthropic LLM client.
@@ -187,6 +511,16 @@ class AnthropicLLM:
             model: Model name to use
             max_tokens: Maximum tokens in response
             max_retries: Maximum number of retry attempts
+            token_budget: Approximate token budget for the topology and
+                timeline part of RCA prompts, filled by priority (None lists
+                a fixed 10 dependencies and 15 incidents)
+            response_cache: Optional DiskResponseCache answering repeated
+                identical requests from disk instead of the API
+            strict: Raise when a summary cannot be generated, instead of
+                falling back to DummyLLM's templated summary
+            client: Optional pre-built ``anthropic.Anthropic`` client. By
+                default one client per API key is shared by every instance
+                in the process, so its open connections are reused
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -198,17 +532,28 @@ class AnthropicLLM:
         self.model = model
         self.max_tokens = max_tokens
         self.max_retries = max_retries
+        self.token_budget = token_budget
+        # Per-token prices of input, output, cache writes and cache reads
+        input_price, output_price = self.PRICING.get(model, self.DEFAULT_PRICING)
+        self._input_cost = input_price / 1_000_000
+        self._output_cost = output_price / 1_000_000
+        self._cache_write_cost = self._input_cost * 1.25
+        self._cache_read_cost = self._input_cost * 0.1
+        self.response_cache = response_cache
+        self.strict = strict
+        # Summaries replaced by DummyLLM's after the API calls failed
+        self.fallback_summaries = 0
+        # Remediations returned unenhanced after the API calls failed
+        self.fallback_remediations = 0
         self.total_tokens_used = 0
         self.total_cost_usd = 0.0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        # Guards the usage counters when enhance_many() calls from several threads
+        self._usage_lock = threading.Lock()
 
         # Initialize Anthropic client
-        try:
-            import anthropic
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-        except ImportError:
-            raise ImportError(
-                "anthropic package required. Install with: pip install anthropic"
-            )
+        self.client = client if client is not None else _shared_client(self.api_key)
 
     def summarize_rca(
         self,
@@ -230,13 +575,75 @@ class AnthropicLLM:
         if not candidates:
             return f"No root cause candidates identified for: {primary_symptom}"
 
-        # Build the analysis context
-        user_prompt = self._build_rca_prompt(graph, candidates, primary_symptom)
+        try:
+            return "".join(self._stream_summary(graph, candidates, primary_symptom))
+        except RuntimeError as e:
+            return self._fallback_summary(e, graph, candidates, primary_symptom)
 
-        # Call Claude API with retry logic
-        response_text = self._call_claude_with_retry(user_prompt)
+    def summarize_rca_stream(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> Iterator[str]:
+        """
+        Generate the RCA summary as a stream of text chunks.
+
+        Chunks are yielded as the model produces them, so a caller can show
+        the start of a long summary while the rest is still being generated.
+        Joined, they are the text summarize_rca() returns. The DummyLLM
+        fallback only applies if the API fails before the first chunk.
+
+        Args:
+            graph: ServiceGraph with incidents and dependencies
+            candidates: Root cause candidates from rules
+            primary_symptom: The primary symptom reported
+
+        Yields:
+            Pieces of the summary text, in order
+        """
+        if not candidates:
+            yield f"No root cause candidates identified for: {primary_symptom}"
+            return
 
-        return response_text
+        started = False
+        try:
+            for text in self._stream_summary(graph, candidates, primary_symptom):
+                started = True
+                yield text
+        except RuntimeError as e:
+            if started:
+                raise
+            yield self._fallback_summary(e, graph, candidates, primary_symptom)
+
+    def _stream_summary(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> Iterator[str]:
+        """Stream the summary from the API, without the DummyLLM fallback."""
+        # Build the analysis context; the graph part is a cacheable prefix
+        context = _build_rca_context(graph, self.token_budget)
+        user_prompt = _build_candidates_prompt(candidates, primary_symptom)
+
+        # Stream from the Claude API with retry logic
+        yield from self._stream_claude_with_retry(user_prompt, cached_prefix=context)
+
+    def _fallback_summary(
+        self,
+        error: RuntimeError,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> str:
+        """Return DummyLLM's summary after ``error`` (or re-raise it in strict mode)."""
+        if self.strict:
+            raise error
+        logger.error(f"Falling back to the templated RCA summary: {error}")
+        with self._usage_lock:
+            self.fallback_summaries += 1
+        return DummyLLM().summarize_rca(graph, candidates, primary_symptom)
 
     def enhance_remediation(
         self,
@@ -253,49 +660,138 @@ class AnthropicLLM:
         Returns:
             Enhanced remediation steps
         """
-        system_prompt = """You are an expert SRE providing remediation guidance.
-        Given a root cause and context, provide specific, actionable remediation steps.
-        Focus on immediate fixes, verification steps, and prevention strategies."""
+        try:
+            response_text = self._call_claude_with_retry(
+                self._build_remediation_prompt(candidate),
+                system_prompt=_REMEDIATION_SYSTEM_PROMPT,
+                max_tokens=1024,
+            )
+        except Exception as e:
+            return self._fallback_remediation(e, candidate)
 
-        user_prompt = f"""Root Cause: {candidate.service} - {candidate.incident_type.value}
+        return self._parse_remediation(response_text, candidate)
 
-Explanation: {candidate.explanation}
+    def _fallback_remediation(self, error: Exception, candidate: RootCauseCandidate) -> List[str]:
+        """Return the candidate's own remediation after ``error``."""
+        logger.warning(f"Failed to enhance remediation: {error}")
+        with self._usage_lock:
+            self.fallback_remediations += 1
+        return candidate.remediation
 
-Current Evidence:
-{chr(10).join(f"- {e}" for e in candidate.evidence[:5])}
+    def enhance_many(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Dict[str, Any],
+        max_concurrency: int = 4,
+    ) -> List[List[str]]:
+        """
+        Enhance the remediation of several candidates with concurrent API calls.
 
-Current Remediation Steps:
-{chr(10).join(f"{i}. {step}" for i, step in enumerate(candidate.remediation, 1))}
+        Each candidate is one enhance_remediation() request; up to
+        ``max_concurrency`` of them are in flight at once over the client's
+        shared connection pool, instead of waiting on each round-trip in turn.
 
-Please provide enhanced, detailed remediation steps including:
-1. Immediate actions to resolve the issue
-2. Verification steps to confirm the fix
-3. Long-term prevention strategies
-4. Monitoring and alerting recommendations
+        Args:
+            candidates: Root cause candidates
+            context: Additional context (logs, metrics, etc.)
+            max_concurrency: Maximum number of simultaneous requests
 
-Return the steps as a numbered list."""
+        Returns:
+            Enhanced remediation steps for each candidate, in order
+        """
+        if len(candidates) < 2 or max_concurrency <= 1:
+            return [self.enhance_remediation(c, context) for c in candidates]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(candidates))) as executor:
+            return list(executor.map(lambda c: self.enhance_remediation(c, context), candidates))
 
+    def enhance_remediation_batch(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Dict[str, Any],
+    ) -> List[List[str]]:
+        """
+        Enhance the remediation of several candidates with a single API call.
+
+        All candidates go into one prompt that asks for one tagged answer per
+        candidate, so the system prompt and round-trip are paid once rather
+        than per candidate. Candidates whose answer is missing or empty (or
+        all of them, if the call fails) fall back to enhance_remediation().
+
+        Args:
+            candidates: Root cause candidates
+            context: Additional context (logs, metrics, etc.)
+
+        Returns:
+            Enhanced remediation steps for each candidate, in order
+        """
+        if len(candidates) < 2:
+            return [self.enhance_remediation(c, context) for c in candidates]
+
+        answers: Dict[int, List[str]] = {}
         try:
             response_text = self._call_claude_with_retry(
-                user_prompt, system_prompt=system_prompt, max_tokens=1024
+                self._build_remediation_batch_prompt(candidates),
+                system_prompt=_REMEDIATION_SYSTEM_PROMPT,
+                max_tokens=min(1024 * len(candidates), 8192),
             )
+            answers = self._parse_remediation_batch(response_text, len(candidates))
+        except Exception as e:
+            logger.warning(f"Batched remediation failed, enhancing one by one: {e}")
 
-            # Parse numbered list from response
-            lines = response_text.strip().split('\n')
-            enhanced_steps = []
-            for line in lines:
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith('-')):
-                    # Remove numbering/bullets
-                    step = line.lstrip('0123456789.-) ')
-                    if step:
-                        enhanced_steps.append(step)
+        return [
+            answers[i] if i in answers else self.enhance_remediation(candidate, context)
+            for i, candidate in enumerate(candidates)
+        ]
 
-            return enhanced_steps if enhanced_steps else candidate.remediation
+    def _build_remediation_prompt(self, candidate: RootCauseCandidate) -> str:
+        """Build the user prompt for enhancing one candidate's remediation."""
+        return f"""{_remediation_details(candidate)}
 
-        except Exception as e:
-            logger.warning(f"Failed to enhance remediation: {e}")
-            return candidate.remediation
+{_REMEDIATION_REQUEST}
+
+Return the steps as a numbered list."""
+
+    def _build_remediation_batch_prompt(self, candidates: List[RootCauseCandidate]) -> str:
+        """Build one user prompt asking for the remediation of every candidate."""
+        blocks = "\n\n".join(
+            f"### Candidate {i}\n\n{_remediation_details(candidate)}"
+            for i, candidate in enumerate(candidates, 1)
+        )
+        answers = "\n".join(
+            f'<answer id="{i}">\n1. ...\n</answer>' for i in range(1, len(candidates) + 1)
+        )
+        return f"""{blocks}
+
+For each candidate above, {_REMEDIATION_REQUEST[0].lower()}{_REMEDIATION_REQUEST[1:]}
+
+Return every candidate's steps as a numbered list inside its own answer element,
+in exactly this format:
+<answers>
+{answers}
+</answers>"""
+
+    @staticmethod
+    def _parse_remediation(response_text: str, candidate: RootCauseCandidate) -> List[str]:
+        """Parse the numbered list of a remediation response (the candidate's own if none)."""
+        return _parse_steps(response_text) or candidate.remediation
+
+    @staticmethod
+    def _parse_remediation_batch(response_text: str, count: int) -> Dict[int, List[str]]:
+        """
+        Parse a batched remediation response.
+
+        Returns:
+            Steps by 0-based candidate position, for the answers that parsed
+            to at least one step
+        """
+        answers: Dict[int, List[str]] = {}
+        for answer_id, body in _ANSWER_RE.findall(response_text):
+            position = int(answer_id) - 1
+            steps = _parse_steps(body)
+            if 0 <= position < count and steps:
+                answers[position] = steps
+        return answers
 
     def _build_rca_prompt(
         self,
@@ -304,153 +800,192 @@ Return the steps as a numbered list."""
         primary_symptom: str,
     ) -> str:
         """Build the user prompt for RCA summarization."""
-        prompt_parts = [
-            f"# Root Cause Analysis Request",
-            f"",
-            f"**Primary Symptom:** {primary_symptom}",
-            f"",
-            f"## Service Topology",
-            f"",
-            f"**Services:** {len(graph.services)}",
-            f"**Dependencies:** {len(graph.dependencies)}",
-            f"**Incidents Detected:** {len(graph.incidents)}",
-            f"",
-        ]
-
-        # Add service graph structure
-        if graph.dependencies:
-            prompt_parts.append("**Service Dependencies:**")
-            for dep in graph.dependencies[:10]:  # Limit to 10
-                prompt_parts.append(f"- {dep.from_service} → {dep.to_service} ({dep.dependency_type.value})")
-            prompt_parts.append("")
-
-        # Add incident timeline
-        if graph.incidents:
-            prompt_parts.append("**Incident Timeline:**")
-            sorted_incidents = sorted(graph.incidents, key=lambda i: i.timestamp)
-            for incident in sorted_incidents[:15]:  # Limit to 15
-                prompt_parts.append(
-                    f"- {incident.timestamp.isoformat()}: {incident.service} - "
-                    f"{incident.incident_type.value} (severity: {incident.severity:.2f})"
-                )
-            prompt_parts.append("")
-
-        # Add root cause candidates
-        prompt_parts.append("## Root Cause Candidates")
-        prompt_parts.append("")
-
-        for i, candidate in enumerate(candidates[:5], 1):  # Top 5
-            prompt_parts.append(f"### Candidate {i}: {candidate.service}")
-            prompt_parts.append(f"**Type:** {candidate.incident_type.value}")
-            prompt_parts.append(f"**Confidence:** {candidate.confidence:.0%}")
-            prompt_parts.append(f"**Explanation:** {candidate.explanation}")
-            prompt_parts.append("")
-            prompt_parts.append("**Evidence:**")
-            for evidence in candidate.evidence[:5]:
-                prompt_parts.append(f"- {evidence}")
-            prompt_parts.append("")
-            prompt_parts.append("**Suggested Remediation:**")
-            for j, action in enumerate(candidate.remediation, 1):
-                prompt_parts.append(f"{j}. {action}")
-            prompt_parts.append("")
-
-        return "\n".join(prompt_parts)
+        return "\n".join((
+            _build_rca_context(graph, self.token_budget),
+            _build_candidates_prompt(candidates, primary_symptom),
+        ))
 
     def _call_claude_with_retry(
         self,
         user_prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
     ) -> str:
         """
-        Call Claude API with exponential backoff retry logic.
+        Call Claude API, retrying transient failures with jittered exponential backoff.
 
         Args:
             user_prompt: User message content
             system_prompt: Optional system prompt
             max_tokens: Optional max tokens override
+            cached_prefix: Optional stable start of the user message, sent
+                before ``user_prompt`` as a separately cached block
 
         Returns:
             Response text from Claude
         """
-        if system_prompt is None:
-            system_prompt = """You are an expert SRE (Site Reliability Engineer) analyzing a production incident.
-Your task is to provide a clear, actionable Root Cause Analysis based on the observability data and detected incidents.
+        request = self._request_params(user_prompt, system_prompt, max_tokens, cached_prefix)
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
 
-Provide your analysis in the following structure:
-
-## Executive Summary
-2-3 sentences summarizing the incident and most likely root cause.
+        for attempt in range(self.max_retries):
+            try:
+                logger.info(f"Calling Anthropic API (attempt {attempt + 1}/{self.max_retries})")
+                text = self._record_response(self.client.messages.create(**request))
+                self._store_response(request, text)
+                return text
 
-## Root Cause Analysis
-Identify the most likely root cause with:
-- Confidence level (High/Medium/Low)
-- Supporting evidence from the data
-- Why this is more likely than other candidates
+            except Exception as e:
+                time.sleep(self._retry_wait(e, attempt))
 
-## Impact Assessment
-Describe the scope and severity of the impact.
+        raise RuntimeError(f"Anthropic API not called: max_retries is {self.max_retries}")
 
-## Remediation Steps
-Provide specific, ordered steps to:
-1. Immediately resolve the issue
-2. Verify the fix is working
-3. Prevent recurrence
-
-## Monitoring Recommendations
-What metrics/logs to watch to ensure the issue is resolved and doesn't recur.
+    def _stream_claude_with_retry(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming version of _call_claude_with_retry().
 
-Be concise, technical, and actionable. Focus on facts from the data provided."""
+        A failed attempt is retried only while nothing has been yielded yet;
+        after that, a retry would repeat text the caller already has, so the
+        error is raised as a RuntimeError instead.
 
-        max_tokens = max_tokens or self.max_tokens
-        last_error = None
+        Yields:
+            Response text chunks as they arrive
+        """
+        request = self._request_params(user_prompt, system_prompt, max_tokens, cached_prefix)
+        cached = self._cached_response(request)
+        if cached is not None:
+            yield cached
+            return
 
         for attempt in range(self.max_retries):
+            chunks: List[str] = []
             try:
-                logger.info(f"Calling Anthropic API (attempt {attempt + 1}/{self.max_retries})")
-
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_prompt}],
+                logger.info(
+                    f"Streaming from Anthropic API (attempt {attempt + 1}/{self.max_retries})"
                 )
+                with self.client.messages.stream(**request) as stream:
+                    for text in stream.text_stream:
+                        chunks.append(text)
+                        yield text
+                    self._record_usage(stream.get_final_message().usage)
+                self._store_response(request, "".join(chunks))
+                return
 
-                # Track token usage
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                total_tokens = input_tokens + output_tokens
-
-                self.total_tokens_used += total_tokens
+            except Exception as e:
+                if chunks:
+                    raise RuntimeError(f"Anthropic API stream failed part way: {e}") from e
+                time.sleep(self._retry_wait(e, attempt))
 
-                # Estimate cost (approximate pricing for Claude 3.5 Sonnet)
-                # Input: $3/MTok, Output: $15/MTok
-                cost = (input_tokens / 1_000_000 * 3.0) + (output_tokens / 1_000_000 * 15.0)
-                self.total_cost_usd += cost
+        raise RuntimeError(f"Anthropic API not called: max_retries is {self.max_retries}")
 
-                logger.info(
-                    f"API call successful. Tokens: {total_tokens} "
-                    f"(in: {input_tokens}, out: {output_tokens}), "
-                    f"Cost: ${cost:.4f}"
-                )
+    def _retry_wait(self, error: Exception, attempt: int) -> float:
+        """
+        Return the seconds to wait before retrying after ``error`` on ``attempt``.
 
-                # Extract text from response
-                return response.content[0].text
+        Raises:
+            RuntimeError: If the error is not retryable or this was the last attempt
+        """
+        logger.warning(f"API call failed (attempt {attempt + 1}): {error}")
+        wait_time = _retry_delay(error, attempt)
+        if wait_time is None:
+            error_msg = f"Anthropic API call failed with a non-retryable error: {error}"
+        elif attempt >= self.max_retries - 1:
+            error_msg = f"Failed to call Anthropic API after {self.max_retries} attempts: {error}"
+        else:
+            logger.info(f"Retrying in {wait_time:.1f}s...")
+            return wait_time
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from error
 
-            except Exception as e:
-                last_error = e
-                logger.warning(f"API call failed (attempt {attempt + 1}): {e}")
+    def _request_params(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the messages.create() arguments for one request."""
+        if system_prompt is None:
+            system_prompt = _RCA_SYSTEM_PROMPT
+
+        content: Any = user_prompt
+        if cached_prefix is not None:
+            # A second cache breakpoint after the stable part of the message,
+            # so reruns on the same graph (any symptom or candidates) also
+            # reuse the topology and timeline
+            content = [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt},
+            ]
 
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            # Mark the stable system prompt as a cacheable prefix
+            "system": [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            "messages": [{"role": "user", "content": content}],
+        }
 
-        # All retries failed
-        error_msg = f"Failed to call Anthropic API after {self.max_retries} attempts: {last_error}"
-        logger.error(error_msg)
-        raise RuntimeError(error_msg)
+    def _cached_response(self, request: Dict[str, Any]) -> Optional[str]:
+        """Return the response cache's answer to ``request``, if there is one."""
+        if self.response_cache is None:
+            return None
+        text = self.response_cache.get(request)
+        if text is not None:
+            logger.info("Using cached Anthropic API response")
+        return text
+
+    def _store_response(self, request: Dict[str, Any], text: str) -> None:
+        if self.response_cache is not None:
+            self.response_cache.set(request, text)
+
+    def _record_response(self, response: Any) -> str:
+        """Add a response's token usage and cost to the totals and return its text."""
+        self._record_usage(response.usage)
+
+        # Extract text from response
+        return response.content[0].text
+
+    def _record_usage(self, usage: Any) -> None:
+        """Add one response's token usage and cost to the totals."""
+        # Track token usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write_tokens = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        total_tokens = input_tokens + output_tokens + cache_read_tokens + cache_write_tokens
+
+        # Estimate cost from the model's list prices (see PRICING)
+        cost = (
+            input_tokens * self._input_cost
+            + cache_write_tokens * self._cache_write_cost
+            + cache_read_tokens * self._cache_read_cost
+            + output_tokens * self._output_cost
+        )
+        with self._usage_lock:
+            self.total_tokens_used += total_tokens
+            self.cache_read_tokens += cache_read_tokens
+            self.cache_write_tokens += cache_write_tokens
+            self.total_cost_usd += cost
+
+        logger.info(
+            f"API call successful. Tokens: {total_tokens} "
+            f"(in: {input_tokens}, out: {output_tokens}, "
+            f"cache read: {cache_read_tokens}, cache write: {cache_write_tokens}), "
+            f"Cost: ${cost:.4f}"
+        )
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """
@@ -462,5 +997,417 @@ Be concise, technical, and actionable. Focus on facts from the data provided."""
         return {
             "total_tokens": self.total_tokens_used,
             "total_cost_usd": self.total_cost_usd,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "fallback_summaries": self.fallback_summaries,
+            "fallback_remediations": self.fallback_remediations,
             "model": self.model,
         }
+
+
+class AsyncAnthropicLLM(AnthropicLLM):
+    """
+    Anthropic Claude integration with asyncio variants of the API calls.
+
+    The synchronous LLMInterface methods behave as in AnthropicLLM. The ``a``
+    methods await an ``anthropic.AsyncAnthropic`` client instead, so callers
+    running an event loop can overlap requests: candidates that
+    aenhance_remediation_batch() cannot answer in its one batched call are
+    enhanced concurrently, so its wall time is about that of the slowest
+    request rather than the sum of all of them.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: int = 2048,
+        max_retries: int = 3,
+        max_concurrency: int = 4,
+        token_budget: Optional[int] = None,
+        response_cache: Optional["DiskResponseCache"] = None,
+        strict: bool = False,
+        client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
+    ):
+        """
+        Initialize the Anthropic clients.
+
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            model: Model name to use
+            max_tokens: Maximum tokens in response
+            max_retries: Maximum number of retry attempts
+            max_concurrency: Maximum number of simultaneous batch requests
+            token_budget: Approximate token budget for the RCA prompt context
+                (see AnthropicLLM)
+            response_cache: Optional DiskResponseCache for repeated requests
+            strict: Raise instead of falling back to DummyLLM's summary
+            client: Optional pre-built synchronous client (see AnthropicLLM)
+            async_client: Optional pre-built ``anthropic.AsyncAnthropic`` client
+        """
+        super().__init__(
+            api_key=api_key, model=model, max_tokens=max_tokens, max_retries=max_retries,
+            token_budget=token_budget, response_cache=response_cache, strict=strict,
+            client=client,
+        )
+        self.max_concurrency = max_concurrency
+
+        # Not shared by default: an async client's connections belong to the
+        # event loop they were opened on
+        if async_client is None:
+            async_client = _anthropic().AsyncAnthropic(api_key=self.api_key)
+        self.async_client = async_client
+
+    async def asummarize_rca(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> str:
+        """Async version of summarize_rca()."""
+        if not candidates:
+            return f"No root cause candidates identified for: {primary_symptom}"
+
+        context = _build_rca_context(graph, self.token_budget)
+        user_prompt = _build_candidates_prompt(candidates, primary_symptom)
+        try:
+            return await self._acall_claude_with_retry(user_prompt, cached_prefix=context)
+        except RuntimeError as e:
+            return self._fallback_summary(e, graph, candidates, primary_symptom)
+
+    async def aenhance_remediation(
+        self,
+        candidate: RootCauseCandidate,
+        context: Dict[str, Any],
+    ) -> List[str]:
+        """Async version of enhance_remediation()."""
+        try:
+            response_text = await self._acall_claude_with_retry(
+                self._build_remediation_prompt(candidate),
+                system_prompt=_REMEDIATION_SYSTEM_PROMPT,
+                max_tokens=1024,
+            )
+        except Exception as e:
+            return self._fallback_remediation(e, candidate)
+
+        return self._parse_remediation(response_text, candidate)
+
+    async def aenhance_remediation_batch(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[List[str]]:
+        """
+        Async version of enhance_remediation_batch().
+
+        Candidates the batched answer does not cover are enhanced with
+        concurrent single requests, at most ``max_concurrency`` at once.
+
+        Args:
+            candidates: Root cause candidates
+            context: Additional context (logs, metrics, etc.)
+
+        Returns:
+            Enhanced remediation steps for each candidate, in order
+        """
+        context = context or {}
+        answers: Dict[int, List[str]] = {}
+        if len(candidates) > 1:
+            try:
+                response_text = await self._acall_claude_with_retry(
+                    self._build_remediation_batch_prompt(candidates),
+                    system_prompt=_REMEDIATION_SYSTEM_PROMPT,
+                    max_tokens=min(1024 * len(candidates), 8192),
+                )
+                answers = self._parse_remediation_batch(response_text, len(candidates))
+            except Exception as e:
+                logger.warning(f"Batched remediation failed, enhancing one by one: {e}")
+
+        missing = [i for i in range(len(candidates)) if i not in answers]
+        # Created per call: asyncio primitives belong to the loop they are used on
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def enhance(candidate: RootCauseCandidate) -> List[str]:
+            async with semaphore:
+                return await self.aenhance_remediation(candidate, context)
+
+        results = await asyncio.gather(*(enhance(candidates[i]) for i in missing))
+        answers.update(zip(missing, results))
+        return [answers[i] for i in range(len(candidates))]
+
+    async def _acall_claude_with_retry(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """Async version of _call_claude_with_retry(); backs off without blocking the loop."""
+        request = self._request_params(user_prompt, system_prompt, max_tokens, cached_prefix)
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.max_retries):
+            try:
+                logger.info(f"Calling Anthropic API (attempt {attempt + 1}/{self.max_retries})")
+                response = await self.async_client.messages.create(**request)
+                text = self._record_response(response)
+                self._store_response(request, text)
+                return text
+
+            except Exception as e:
+                await asyncio.sleep(self._retry_wait(e, attempt))
+
+        raise RuntimeError(f"Anthropic API not called: max_retries is {self.max_retries}")
+
+
+def candidate_signature(candidates: List[RootCauseCandidate]) -> Tuple[Any, ...]:
+    """
+    Build a hashable signature of the candidates an answer is written from.
+
+    Covers everything the summary prompts and templates read: the top five
+    candidates' service, type, confidence, explanation, first five pieces of
+    evidence and remediation steps.
+    """
+    return tuple(
+        (
+            c.service,
+            c.incident_type.value,
+            c.confidence,
+            c.explanation,
+            tuple(c.evidence[:5]),
+            tuple(c.remediation),
+        )
+        for c in candidates[:5]
+    )
+
+
+def _summary_data_key(
+    graph: ServiceGraph,
+    candidates: List[RootCauseCandidate],
+    token_budget: Optional[int] = None,
+) -> str:
+    """
+    Digest everything but the symptom that a summary is written from.
+
+    The graph enters through its canonical prompt context (rendered with the
+    LLM's ``token_budget``), which is all of the graph an LLM is shown.
+    """
+    context = _build_rca_context(graph, token_budget)
+    material = repr((candidate_signature(candidates), context))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CachedLLM:
+    """
+    Wrap an LLM, reusing its answers for inputs it has already seen.
+
+    RCA runs are often repeated with identical candidates (re-display, retries,
+    the same incident re-run while tuning), and an answer from a real model
+    costs a network round-trip. Two levels of reuse are applied:
+
+    - Exact: summaries are keyed by the symptom, candidate_signature() and a
+      digest of the graph context the prompt shows; remediation by the
+      candidate's signature and the context. Entries are kept in memory in
+      LRU order, and each counts its hits.
+    - Semantic (optional): on an exact miss, a SemanticCache is asked for a
+      summary of a similar symptom over the same candidates and graph, so a
+      reworded symptom does not cost another call.
+
+    Answers the wrapped LLM fell back to after a failed call are not cached,
+    so the next request retries. Other calls (including the async
+    remediation methods) are passed through to the wrapped LLM uncached.
+    """
+
+    def __init__(
+        self,
+        llm: LLMInterface,
+        maxsize: int = 512,
+        semantic_cache: Optional["SemanticCache"] = None,
+    ):
+        """
+        Args:
+            llm: LLM whose answers are cached
+            maxsize: Maximum number of answers kept in memory
+            semantic_cache: Optional cache consulted for similar symptoms on a miss
+        """
+        self.llm = llm
+        self.maxsize = maxsize
+        self.semantic_cache = semantic_cache
+        self.hits = 0
+        self.misses = 0
+        # key -> [answer, hit count], least recently used first
+        self._entries: "OrderedDict[Tuple[Any, ...], List[Any]]" = OrderedDict()
+
+    def _get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry[1] += 1
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, key: Tuple[Any, ...], value: Any) -> None:
+        self._entries[key] = [value, 0]
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _lookup_summary(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> Tuple[Tuple[Any, ...], str, Optional[str]]:
+        """Return the exact key, the data key and a cached summary (None on a miss)."""
+        data_key = _summary_data_key(graph, candidates, getattr(self.llm, "token_budget", None))
+        key = ("summary", primary_symptom, data_key)
+        summary = self._get(key)
+        if summary is None and self.semantic_cache is not None:
+            summary = self.semantic_cache.get(primary_symptom, data_key)
+            if summary is not None:
+                self._put(key, summary)
+        return key, data_key, summary
+
+    def _store_summary(
+        self,
+        key: Tuple[Any, ...],
+        data_key: str,
+        primary_symptom: str,
+        summary: str,
+        fallbacks: int,
+    ) -> None:
+        if getattr(self.llm, "fallback_summaries", 0) != fallbacks:
+            # A stand-in for a failed call; the next request should retry
+            return
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(primary_symptom, data_key, summary)
+        self._put(key, summary)
+
+    def summarize_rca(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> str:
+        """Return the cached summary for these inputs, or generate and cache it."""
+        key, data_key, summary = self._lookup_summary(graph, candidates, primary_symptom)
+        if summary is None:
+            fallbacks = getattr(self.llm, "fallback_summaries", 0)
+            summary = self.llm.summarize_rca(graph, candidates, primary_symptom)
+            self._store_summary(key, data_key, primary_symptom, summary, fallbacks)
+        return summary
+
+    async def asummarize_rca(
+        self,
+        graph: ServiceGraph,
+        candidates: List[RootCauseCandidate],
+        primary_symptom: str,
+    ) -> str:
+        """Async summarize_rca(): awaits the wrapped LLM's asummarize_rca() on a miss."""
+        key, data_key, summary = self._lookup_summary(graph, candidates, primary_symptom)
+        if summary is None:
+            fallbacks = getattr(self.llm, "fallback_summaries", 0)
+            asummarize = getattr(self.llm, "asummarize_rca", None)
+            if asummarize is not None:
+                summary = await asummarize(graph, candidates, primary_symptom)
+            else:
+                summary = await asyncio.to_thread(
+                    self.llm.summarize_rca, graph, candidates, primary_symptom
+                )
+            self._store_summary(key, data_key, primary_symptom, summary, fallbacks)
+        return summary
+
+    def _cached_remediations(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Dict[str, Any],
+        enhance: Callable[[List[RootCauseCandidate]], List[List[str]]],
+    ) -> List[List[str]]:
+        """
+        Return each candidate's cached remediation, calling ``enhance`` for the misses.
+
+        The new answers are cached only if the wrapped LLM fell back on none
+        of them. A context that cannot be serialized (e.g. non-string keys)
+        is not cached.
+        """
+        try:
+            context_key = _json.dumps(context)
+        except TypeError:
+            return enhance(candidates)
+        keys = [("remediation", candidate_signature([c]), context_key) for c in candidates]
+        results = [self._get(key) for key in keys]
+        missing = [i for i, steps in enumerate(results) if steps is None]
+        if missing:
+            fallbacks = getattr(self.llm, "fallback_remediations", 0)
+            answers = enhance([candidates[i] for i in missing])
+            store = getattr(self.llm, "fallback_remediations", 0) == fallbacks
+            for i, steps in zip(missing, answers):
+                results[i] = steps
+                if store:
+                    self._put(keys[i], steps)
+        # Copied so a caller editing the steps does not edit the cache
+        return [list(steps) for steps in results]
+
+    def enhance_remediation(
+        self,
+        candidate: RootCauseCandidate,
+        context: Dict[str, Any],
+    ) -> List[str]:
+        """Return the cached remediation for this candidate and context, or generate it."""
+        return self._cached_remediations(
+            [candidate], context, lambda missing: [self.llm.enhance_remediation(missing[0], context)]
+        )[0]
+
+    def enhance_many(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Dict[str, Any],
+        max_concurrency: int = 4,
+    ) -> List[List[str]]:
+        """Cached enhance_many(): only the misses go to the wrapped LLM."""
+        def enhance(missing: List[RootCauseCandidate]) -> List[List[str]]:
+            enhance_many = getattr(self.llm, "enhance_many", None)
+            if enhance_many is None:
+                return [self.llm.enhance_remediation(c, context) for c in missing]
+            return enhance_many(missing, context, max_concurrency)
+
+        return self._cached_remediations(candidates, context, enhance)
+
+    def enhance_remediation_batch(
+        self,
+        candidates: List[RootCauseCandidate],
+        context: Dict[str, Any],
+    ) -> List[List[str]]:
+        """Cached enhance_remediation_batch(): only the misses go to the wrapped LLM."""
+        def enhance(missing: List[RootCauseCandidate]) -> List[List[str]]:
+            batch = getattr(self.llm, "enhance_remediation_batch", None)
+            if batch is None:
+                return [self.llm.enhance_remediation(c, context) for c in missing]
+            return batch(missing, context)
+
+        return self._cached_remediations(candidates, context, enhance)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return in-memory hit and miss counts and the number of cached answers."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop every answer cached in memory and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else (e.g. AnthropicLLM.get_usage_stats) comes from the wrapped LLM
+        if name == "llm":
+            # Not set yet (e.g. while unpickling): don't recurse
+            raise AttributeError(name)
+        return getattr(self.llm, name)
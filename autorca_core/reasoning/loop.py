@@ -4,7 +4,9 @@ RCA reasoning loop: Orchestrates the end-to-end RCA process.
 The main entry point for running root cause analysis.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -17,6 +19,7 @@ from autorca_core.graph_engine.queries import GraphQueries
 from autorca_core.reasoning.rules import apply_rules, RootCauseCandidate
 from autorca_core.reasoning.llm import LLMInterface, DummyLLM
 from autorca_core.logging import get_logger
+from autorca_core import _json
 from autorca_core.config import ThresholdConfig
 
 logger = get_logger(__name__)
@@ -58,18 +61,54 @@ class RCARunResult:
     summary: str
     timeline: List[Dict[str, Any]] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # (candidates, graph, their sizes, serialized candidates, serialized graph)
+    _serialized: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary."""
+        """
+        Serialize to dictionary.
+
+        The candidate and graph conversions are computed once and reused by
+        later calls (until either list is replaced or grows), so the nested
+        values are shared between calls and should be treated as read-only.
+        The returned top-level dict is always new.
+        """
+        candidates, graph = self.root_cause_candidates, self.service_graph
+        sizes = (
+            len(candidates), len(graph.services), len(graph.dependencies), len(graph.incidents)
+        )
+        cached = self._serialized
+        if not (cached and cached[0] is candidates and cached[1] is graph and cached[2] == sizes):
+            cached = self._serialized = (
+                candidates, graph, sizes, [c.to_dict() for c in candidates], graph.to_dict()
+            )
+
         return {
             "primary_symptom": self.primary_symptom,
-            "root_cause_candidates": [c.to_dict() for c in self.root_cause_candidates],
-            "service_graph": self.service_graph.to_dict(),
+            "root_cause_candidates": cached[3],
+            "service_graph": cached[4],
             "summary": self.summary,
             "timeline": self.timeline,
             "metadata": self.metadata,
         }
 
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize the result to UTF-8 JSON (the structure of to_dict()).
+
+        Encoded by orjson when installed. Values that are not JSON types are
+        written as their str().
+        """
+        return _json.dumps_bytes(self.to_dict(), indent=indent)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The serialized form is rebuilt on demand, not stored in result caches
+        state = self.__dict__.copy()
+        state["_serialized"] = None
+        return state
+
 
 def run_rca(
     incident_window: tuple[datetime, datetime],
@@ -77,6 +116,7 @@ def run_rca(
     data_sources: DataSourcesConfig,
     llm: Optional[LLMInterface] = None,
     thresholds: Optional[ThresholdConfig] = None,
+    concurrent_load: bool = False,
 ) -> RCARunResult:
     """
     Run root cause analysis.
@@ -95,6 +135,9 @@ def run_rca(
         data_sources: Configuration for data sources
         llm: Optional LLM interface for enhanced analysis
         thresholds: Optional threshold configuration for anomaly detection
+        concurrent_load: Read the data sources in parallel threads. Worth it
+            when reads wait on slow or network storage; parsing holds the
+            GIL, so for local files it costs a little time instead
 
     Returns:
         RCARunResult with root cause candidates and analysis
@@ -113,65 +156,153 @@ def run_rca(
     """
     time_from, time_to = incident_window
 
+    # Step 1: Load observability data
+    logger.info(f"Loading data for window: {time_from} to {time_to}")
+
+    logs, metrics, traces, configs = _load_sources(
+        data_sources, time_from, time_to, concurrent=concurrent_load
+    )
+
+    return _analyze(
+        time_from, time_to, primary_symptom,
+        logs, metrics, traces, configs,
+        llm=llm, thresholds=thresholds,
+    )
+
+
+async def arun_rca(
+    incident_window: tuple[datetime, datetime],
+    primary_symptom: str,
+    data_sources: DataSourcesConfig,
+    llm: Optional[LLMInterface] = None,
+    thresholds: Optional[ThresholdConfig] = None,
+) -> RCARunResult:
+    """
+    Async variant of run_rca() that loads the data sources concurrently.
+
+    Each configured source is read and parsed in a worker thread, so the load
+    step waits for the slowest source rather than the sum of all of them.
+    The summary is requested while the incident timeline is being built,
+    through the LLM's ``asummarize_rca`` if it has one (otherwise its
+    summarize_rca() runs in a worker thread).
+
+    Args:
+        incident_window: Tuple of (start_time, end_time) for the analysis window
+        primary_symptom: Description of the symptom (e.g., "Checkout API 500 errors")
+        data_sources: Configuration for data sources
+        llm: Optional LLM interface for enhanced analysis
+        thresholds: Optional threshold configuration for anomaly detection
+
+    Returns:
+        RCARunResult with root cause candidates and analysis
+    """
+    time_from, time_to = incident_window
+
+    logger.info(f"Loading data for window: {time_from} to {time_to}")
+    logs, metrics, traces, configs = await _aload_sources(data_sources, time_from, time_to)
+
+    if llm is None:
+        llm = DummyLLM()
+    graph, candidates = _graph_and_candidates(logs, metrics, traces, configs, thresholds)
+
+    # The summary is usually a network round trip; build the timeline meanwhile
+    logger.info("Generating RCA summary...")
+    asummarize = getattr(llm, "asummarize_rca", None)
+    if asummarize is not None:
+        summary_call = asummarize(graph, candidates, primary_symptom)
+    else:
+        summary_call = asyncio.to_thread(llm.summarize_rca, graph, candidates, primary_symptom)
+    summary, timeline = await asyncio.gather(summary_call, asyncio.to_thread(_timeline, graph))
+
+    return _result(
+        time_from, time_to, primary_symptom,
+        logs, metrics, traces, configs,
+        graph, candidates, summary, timeline,
+    )
+
+
+def _analyze(
+    time_from: datetime,
+    time_to: datetime,
+    primary_symptom: str,
+    logs: List[LogEvent],
+    metrics: List[MetricPoint],
+    traces: List[Span],
+    configs: List[ConfigChange],
+    llm: Optional[LLMInterface] = None,
+    thresholds: Optional[ThresholdConfig] = None,
+) -> RCARunResult:
+    """Run the analysis steps of run_rca() on already loaded data."""
     # Use DummyLLM if no LLM provided
     if llm is None:
         llm = DummyLLM()
 
-    # Step 1: Load observability data
-    logger.info(f"Loading data for window: {time_from} to {time_to}")
+    graph, candidates = _graph_and_candidates(logs, metrics, traces, configs, thresholds)
 
-    logs: List[LogEvent] = []
-    metrics: List[MetricPoint] = []
-    traces: List[Span] = []
-    configs: List[ConfigChange] = []
+    # Step 4: Generate summary using LLM
+    logger.info("Generating RCA summary...")
+    summary = llm.summarize_rca(graph, candidates, primary_symptom)
 
-    if data_sources.logs_dir:
-        logs = load_logs(data_sources.logs_dir, time_from, time_to)
-        logger.info(f"  Loaded {len(logs)} log events")
+    return _result(
+        time_from, time_to, primary_symptom,
+        logs, metrics, traces, configs,
+        graph, candidates, summary, _timeline(graph),
+    )
 
-    if data_sources.metrics_dir:
-        metrics = load_metrics(data_sources.metrics_dir, time_from, time_to)
-        logger.info(f"  Loaded {len(metrics)} metric points")
 
-    if data_sources.traces_dir:
-        traces = load_traces(data_sources.traces_dir, time_from, time_to)
-        logger.info(f"  Loaded {len(traces)} trace spans")
+def _result(
+    time_from: datetime,
+    time_to: datetime,
+    primary_symptom: str,
+    logs: List[LogEvent],
+    metrics: List[MetricPoint],
+    traces: List[Span],
+    configs: List[ConfigChange],
+    graph: ServiceGraph,
+    candidates: List[RootCauseCandidate],
+    summary: str,
+    timeline: List[Dict[str, Any]],
+) -> RCARunResult:
+    """Assemble the RCARunResult shared by run_rca() and arun_rca()."""
+    return RCARunResult(
+        primary_symptom=primary_symptom,
+        root_cause_candidates=candidates,
+        service_graph=graph,
+        summary=summary,
+        timeline=timeline,
+        metadata=_metadata(time_from, time_to, logs, metrics, traces, configs, graph, candidates),
+    )
 
-    if data_sources.configs_dir:
-        configs = load_configs(data_sources.configs_dir, time_from, time_to)
-        logger.info(f"  Loaded {len(configs)} config changes")
 
+def _graph_and_candidates(
+    logs: List[LogEvent],
+    metrics: List[MetricPoint],
+    traces: List[Span],
+    configs: List[ConfigChange],
+    thresholds: Optional[ThresholdConfig],
+) -> Tuple[ServiceGraph, List[RootCauseCandidate]]:
+    """Build the service graph and rank the root cause candidates (steps 2 and 3)."""
     # Step 2: Build service graph
-<<<<<<< HEAD
     logger.info("Building service graph...")
-    graph = build_service_graph(logs=logs, metrics=metrics, traces=traces, configs=configs)
+    graph = build_service_graph(
+        logs=logs, metrics=metrics, traces=traces, configs=configs, thresholds=thresholds
+    )
     logger.info(f"  Graph: {len(graph.services)} services, {len(graph.dependencies)} dependencies, {len(graph.incidents)} incidents")
 
     # Step 3: Run rule-based analysis
     logger.info("Applying RCA rules...")
-    candidates = apply_rules(graph)
-    logger.info(f"  Identified {len(candidates)} root cause candidates")
-=======
-    print("Building service graph...")
-    graph = build_service_graph(logs=logs, metrics=metrics, traces=traces, configs=configs, thresholds=thresholds)
-    print(f"  Graph: {len(graph.services)} services, {len(graph.dependencies)} dependencies, {len(graph.incidents)} incidents")
-
-    # Step 3: Run rule-based analysis
-    print("Applying RCA rules...")
     candidates = apply_rules(graph, thresholds=thresholds)
-    print(f"  Identified {len(candidates)} root cause candidates")
->>>>>>> b2361b9 (feat: add configurable detection thresholds for anomaly detection)
+    logger.info(f"  Identified {len(candidates)} root cause candidates")
+    return graph, candidates
 
-    # Step 4: Generate summary using LLM
-    logger.info("Generating RCA summary...")
-    summary = llm.summarize_rca(graph, candidates, primary_symptom)
 
-    # Step 5: Build incident timeline
+def _timeline(graph: ServiceGraph) -> List[Dict[str, Any]]:
+    """Build the serialized incident timeline (step 5)."""
     queries = GraphQueries(graph)
     timeline_incidents = queries.get_incident_timeline()
-    timeline = [
+    return [
         {
-            "timestamp": i.timestamp.isoformat(),
+            "timestamp": i.timestamp_iso(),
             "service": i.service,
             "type": i.incident_type.value,
             "description": i.description,
@@ -180,8 +311,19 @@ def run_rca(
         for i in timeline_incidents
     ]
 
-    # Step 6: Compile metadata
-    metadata = {
+
+def _metadata(
+    time_from: datetime,
+    time_to: datetime,
+    logs: List[LogEvent],
+    metrics: List[MetricPoint],
+    traces: List[Span],
+    configs: List[ConfigChange],
+    graph: ServiceGraph,
+    candidates: List[RootCauseCandidate],
+) -> Dict[str, Any]:
+    """Compile the run metadata (step 6)."""
+    return {
         "window_start": time_from.isoformat(),
         "window_end": time_to.isoformat(),
         "num_logs": len(logs),
@@ -194,15 +336,6 @@ def run_rca(
         "num_candidates": len(candidates),
     }
 
-    return RCARunResult(
-        primary_symptom=primary_symptom,
-        root_cause_candidates=candidates,
-        service_graph=graph,
-        summary=summary,
-        timeline=timeline,
-        metadata=metadata,
-    )
-
 
 def run_rca_from_files(
     logs_path: str,
@@ -212,6 +345,7 @@ def run_rca_from_files(
     primary_symptom: str = "Unknown incident",
     window_minutes: int = 60,
     thresholds: Optional[ThresholdConfig] = None,
+    concurrent_load: bool = False,
 ) -> RCARunResult:
     """
     Convenience function to run RCA from file paths.
@@ -226,39 +360,137 @@ def run_rca_from_files(
         primary_symptom: Description of the symptom
         window_minutes: Size of the analysis window in minutes
         thresholds: Optional threshold configuration for anomaly detection
+        concurrent_load: Read the data sources in parallel threads (see run_rca())
 
     Returns:
         RCARunResult
     """
+    sources = DataSourcesConfig(
+        logs_dir=logs_path,
+        metrics_dir=metrics_path,
+        traces_dir=traces_path,
+        configs_dir=configs_path,
+    )
+
     # Load all data without time filtering to determine the time range
-    all_logs = load_logs(logs_path) if logs_path else []
-    all_metrics = load_metrics(metrics_path) if metrics_path else []
-    all_traces = load_traces(traces_path) if traces_path else []
-    all_configs = load_configs(configs_path) if configs_path else []
-
-    # Determine time window from data
-    timestamps = []
-    timestamps.extend([log.timestamp for log in all_logs])
-    timestamps.extend([metric.timestamp for metric in all_metrics])
-    timestamps.extend([span.timestamp for span in all_traces])
-    timestamps.extend([config.timestamp for config in all_configs])
-
-    if not timestamps:
-        raise ValueError("No data found in provided files")
+    loaded = _load_sources(sources, concurrent=concurrent_load)
+    time_from, time_to = _infer_window(loaded, window_minutes)
 
-    time_from = min(timestamps)
-    time_to = max(timestamps)
+    # Run RCA
+    return run_rca(
+        (time_from, time_to), primary_symptom, sources,
+        thresholds=thresholds, concurrent_load=concurrent_load,
+    )
 
-    # Optionally constrain to window_minutes
-    if (time_to - time_from).total_seconds() / 60 > window_minutes:
-        time_to = time_from + timedelta(minutes=window_minutes)
 
-    # Run RCA
+async def arun_rca_from_files(
+    logs_path: str,
+    metrics_path: Optional[str] = None,
+    traces_path: Optional[str] = None,
+    configs_path: Optional[str] = None,
+    primary_symptom: str = "Unknown incident",
+    window_minutes: int = 60,
+    thresholds: Optional[ThresholdConfig] = None,
+) -> RCARunResult:
+    """
+    Async variant of run_rca_from_files().
+
+    The files are loaded concurrently and only once; the analysis window is
+    applied to the loaded events in memory instead of re-reading the files.
+
+    Args:
+        logs_path: Path to logs file/directory
+        metrics_path: Path to metrics file/directory
+        traces_path: Path to traces file/directory
+        configs_path: Path to configs file/directory
+        primary_symptom: Description of the symptom
+        window_minutes: Size of the analysis window in minutes
+        thresholds: Optional threshold configuration for anomaly detection
+
+    Returns:
+        RCARunResult
+    """
     sources = DataSourcesConfig(
         logs_dir=logs_path,
         metrics_dir=metrics_path,
         traces_dir=traces_path,
         configs_dir=configs_path,
     )
+    loaded = await _aload_sources(sources)
+    time_from, time_to = _infer_window(loaded, window_minutes)
+    logs, metrics, traces, configs = (
+        [e for e in events if time_from <= e.timestamp <= time_to] for events in loaded
+    )
+
+    return _analyze(
+        time_from, time_to, primary_symptom,
+        logs, metrics, traces, configs,
+        thresholds=thresholds,
+    )
+
+
+_SOURCES = (
+    (load_logs, "logs_dir", "log events"),
+    (load_metrics, "metrics_dir", "metric points"),
+    (load_traces, "traces_dir", "trace spans"),
+    (load_configs, "configs_dir", "config changes"),
+)
+
+
+def _load_sources(
+    data_sources: DataSourcesConfig,
+    time_from: Optional[datetime] = None,
+    time_to: Optional[datetime] = None,
+    concurrent: bool = False,
+) -> Tuple[List[LogEvent], List[MetricPoint], List[Span], List[ConfigChange]]:
+    """Load every configured data source, each in its own worker thread if ``concurrent``."""
+    paths = [getattr(data_sources, attr) for _, attr, _ in _SOURCES]
+    jobs = [(loader, path) for (loader, _, _), path in zip(_SOURCES, paths) if path]
+
+    if not concurrent or len(jobs) < 2:
+        results = [loader(path, time_from, time_to) for loader, path in jobs]
+    else:
+        # File reads overlap; the threads share the GIL while parsing
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(loader, path, time_from, time_to) for loader, path in jobs]
+            results = [future.result() for future in futures]
+
+    remaining = iter(results)
+    loaded = tuple(next(remaining) if path else [] for path in paths)
+    for (_, _, what), path, events in zip(_SOURCES, paths, loaded):
+        if path:
+            logger.info(f"  Loaded {len(events)} {what}")
+    return loaded
+
+
+async def _aload_sources(
+    data_sources: DataSourcesConfig,
+    time_from: Optional[datetime] = None,
+    time_to: Optional[datetime] = None,
+) -> Tuple[List[LogEvent], List[MetricPoint], List[Span], List[ConfigChange]]:
+    """Run _load_sources() concurrently in a worker thread, off the event loop."""
+    return await asyncio.to_thread(_load_sources, data_sources, time_from, time_to, True)
+
+
+def _infer_window(
+    event_lists: Sequence[Sequence[Any]], window_minutes: int
+) -> Tuple[datetime, datetime]:
+    """Derive the analysis window from the loaded events."""
+    # Each list is reduced on its own rather than copied into one combined list
+    bounds = []
+    for events in event_lists:
+        if events:
+            timestamps = [event.timestamp for event in events]
+            bounds.append((min(timestamps), max(timestamps)))
+
+    if not bounds:
+        raise ValueError("No data found in provided files")
+
+    time_from = min(low for low, _ in bounds)
+    time_to = max(high for _, high in bounds)
+
+    # Optionally constrain to window_minutes
+    if (time_to - time_from).total_seconds() / 60 > window_minutes:
+        time_to = time_from + timedelta(minutes=window_minutes)
 
-    return run_rca((time_from, time_to), primary_symptom, sources, thresholds=thresholds)
+    return time_from, time_to
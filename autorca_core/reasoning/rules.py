@@ -4,8 +4,15 @@ Rule-based RCA heuristics.
 Simple, deterministic rules for identifying root causes without requiring an LLM.
 """
 
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass
+import heapq
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from functools import cached_property
+from operator import attrgetter
+from typing import Any, List, Dict, Set, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import timedelta
 
 from autorca_core.model.graph import ServiceGraph, IncidentNode, IncidentType
@@ -13,7 +20,7 @@ from autorca_core.graph_engine.queries import GraphQueries, CausalChain
 from autorca_core.config import ThresholdConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class RootCauseCandidate:
     """
     A potential root cause identified by rules or LLM.
@@ -45,7 +52,92 @@ class RootCauseCandidate:
         }
 
 
-def apply_rules(graph: ServiceGraph, thresholds: Optional[ThresholdConfig] = None) -> List[RootCauseCandidate]:
+# Incident types the rules test membership in, once per incident
+_CHANGE_TYPES = frozenset({IncidentType.DEPLOYMENT, IncidentType.CONFIG_CHANGE})
+_SYMPTOM_TYPES = frozenset({IncidentType.ERROR_SPIKE, IncidentType.LATENCY_SPIKE})
+
+
+class _RuleContext:
+    """
+    Everything the rules of one apply_rules() call read from the graph.
+
+    The incidents and the dependencies are each walked once, collecting the
+    inputs of every rule at the same time, so the rules themselves only emit
+    candidates and do no graph lookups. The causal chains are searched on
+    first use.
+    """
+
+    def __init__(self, graph: ServiceGraph, queries: GraphQueries):
+        self.graph = graph
+        self.queries = queries
+
+        # Per service, in the order services first appear among the incidents
+        self.first_incident: Dict[str, IncidentNode] = {}
+        self.first_symptom: Dict[str, IncidentNode] = {}
+        self.change_incidents: Dict[str, List[IncidentNode]] = {}
+        self.other_incidents: Dict[str, List[IncidentNode]] = {}
+        self.resource_exhaustion: List[IncidentNode] = []
+        for incident in graph.incidents:
+            service, incident_type = incident.service, incident.incident_type
+            if service not in self.first_incident:
+                self.first_incident[service] = incident
+            if incident_type in _CHANGE_TYPES:
+                self.change_incidents.setdefault(service, []).append(incident)
+                continue
+            self.other_incidents.setdefault(service, []).append(incident)
+            if incident_type in _SYMPTOM_TYPES:
+                if service not in self.first_symptom:
+                    self.first_symptom[service] = incident
+            elif incident_type == IncidentType.RESOURCE_EXHAUSTION:
+                self.resource_exhaustion.append(incident)
+        self.incident_services: Set[str] = set(self.first_incident)
+
+        self.dependents_count: Counter = Counter()
+        self.failing_dependencies: Set[str] = set()  # services calling a service with incidents
+        for dep in graph.dependencies:
+            self.dependents_count[dep.to_service] += 1
+            if dep.to_service in self.incident_services:
+                self.failing_dependencies.add(dep.from_service)
+
+    @property
+    def services_with_recent_changes(self) -> List[str]:
+        return [service for service in self.first_incident if service in self.change_incidents]
+
+    @cached_property
+    def causal_chains(self) -> List[CausalChain]:
+        return self.queries.find_causal_chains(max_length=4, top_k=3)
+
+
+# Candidates of recent apply_rules() calls: id(graph) -> (weak reference to the
+# graph, fingerprint, candidates), least recently used first. The weak reference
+# tells a live graph from a new one that happens to reuse a collected one's id.
+_RESULTS_MAXSIZE = 16
+_results: "OrderedDict[int, Tuple[weakref.ref, Tuple[Any, ...], List[RootCauseCandidate]]]" = (
+    OrderedDict()
+)
+_results_lock = threading.Lock()
+
+_BY_CONFIDENCE = attrgetter('confidence')
+
+
+def _copy(candidates: List[RootCauseCandidate]) -> List[RootCauseCandidate]:
+    """Copy cached candidates (and their lists), so callers cannot edit the cache."""
+    return [
+        replace(c, evidence=list(c.evidence), remediation=list(c.remediation))
+        for c in candidates
+    ]
+
+
+def _fingerprint(graph: ServiceGraph, thresholds: ThresholdConfig) -> Tuple[Any, ...]:
+    # The lengths also catch incidents or edges added without the add_* methods
+    return (graph.version, len(graph.incidents), len(graph.dependencies), thresholds)
+
+
+def apply_rules(
+    graph: ServiceGraph,
+    thresholds: Optional[ThresholdConfig] = None,
+    top_k: Optional[int] = None,
+) -> List[RootCauseCandidate]:
     """
     Apply rule-based heuristics to identify root cause candidates.
 
@@ -56,75 +148,105 @@ def apply_rules(graph: ServiceGraph, thresholds: Optional[ThresholdConfig] = Non
     4. Services with resource exhaustion are strong candidates
     5. Causal chains identify propagation patterns
 
+    Results are cached per graph until it changes (see ServiceGraph.version),
+    so repeated calls on the same graph and thresholds skip the rules. Each
+    call returns its own copies of the candidates.
+
     Args:
         graph: ServiceGraph with incidents and dependencies
         thresholds: Optional threshold configuration for correlation windows
+        top_k: Only return the K most confident candidates (the first K of
+            the full result, selected without sorting every candidate)
 
     Returns:
         List of RootCauseCandidate objects, sorted by confidence (highest first)
     """
     if thresholds is None:
         thresholds = ThresholdConfig()
+    if top_k is not None and top_k <= 0:
+        return []
+
+    fingerprint = _fingerprint(graph, thresholds)
+    with _results_lock:
+        entry = _results.get(id(graph))
+        if entry is not None and entry[0]() is graph and entry[1] == fingerprint:
+            _results.move_to_end(id(graph))
+            return _copy(entry[2][:top_k])
+
+    candidates = _evaluate_rules(graph, thresholds)
+    if top_k is not None:
+        # Only a fully sorted result is cached; stable like sort(), so ties keep rule order
+        return heapq.nlargest(top_k, candidates, key=_BY_CONFIDENCE)
+
+    # Sort by confidence (highest first)
+    candidates.sort(key=_BY_CONFIDENCE, reverse=True)
 
+    with _results_lock:
+        _results[id(graph)] = (weakref.ref(graph), fingerprint, candidates)
+        _results.move_to_end(id(graph))
+        while len(_results) > _RESULTS_MAXSIZE:
+            _results.popitem(last=False)
+    return _copy(candidates)
+
+
+def _evaluate_rules(graph: ServiceGraph, thresholds: ThresholdConfig) -> List[RootCauseCandidate]:
+    """Run every rule on ``graph``, returning the candidates in rule order (unsorted)."""
     candidates: List[RootCauseCandidate] = []
     queries = GraphQueries(graph)
+    context = _RuleContext(graph, queries)
 
     # Rule 1: Recent deployments/config changes
-    candidates.extend(_rule_recent_changes(graph, queries, thresholds))
+    candidates.extend(_rule_recent_changes(graph, queries, thresholds, context=context))
 
     # Rule 2: Resource exhaustion
-    candidates.extend(_rule_resource_exhaustion(graph, queries))
+    candidates.extend(_rule_resource_exhaustion(
+        graph, queries, incidents=context.resource_exhaustion,
+    ))
 
     # Rule 3: Leaf service errors (no downstream dependencies with errors)
-    candidates.extend(_rule_leaf_errors(graph, queries))
+    candidates.extend(_rule_leaf_errors(graph, queries, context=context))
 
     # Rule 4: Error spikes in foundational services (e.g., databases)
-    candidates.extend(_rule_foundational_services(graph, queries))
+    candidates.extend(_rule_foundational_services(graph, queries, context=context))
 
     # Rule 5: Causal chain analysis
-    candidates.extend(_rule_causal_chains(graph, queries))
-
-    # Sort by confidence (highest first)
-    candidates.sort(key=lambda c: c.confidence, reverse=True)
+    candidates.extend(_rule_causal_chains(graph, queries, chains=context.causal_chains))
 
     return candidates
 
 
-def _rule_recent_changes(graph: ServiceGraph, queries: GraphQueries, thresholds: ThresholdConfig) -> List[RootCauseCandidate]:
+def _rule_recent_changes(
+    graph: ServiceGraph,
+    queries: GraphQueries,
+    thresholds: ThresholdConfig,
+    *,
+    context: _RuleContext,
+) -> List[RootCauseCandidate]:
     """
     Rule: Services with recent deployments or config changes are strong root cause candidates.
     """
     candidates = []
-    services_with_changes = queries.get_services_with_recent_changes()
-
-    for service in services_with_changes:
-        # Get all incidents for this service
-        incidents = graph.get_incidents_for_service(service)
-
-        # Find deployment/config change incidents
-        change_incidents = [
-            i for i in incidents
-            if i.incident_type in (IncidentType.DEPLOYMENT, IncidentType.CONFIG_CHANGE)
-        ]
 
-        if not change_incidents:
-            continue
-
-        # Get other (non-change) incidents
-        other_incidents = [
-            i for i in incidents
-            if i.incident_type not in (IncidentType.DEPLOYMENT, IncidentType.CONFIG_CHANGE)
-        ]
-
-        # Check if other incidents occurred shortly after the change using configurable threshold
+    for service in context.services_with_recent_changes:
+        # Deployment/config change incidents, and the other (non-change) incidents
+        change_incidents = context.change_incidents[service]
+        other_incidents = context.other_incidents.get(service, [])
+
+        # Check if other incidents occurred shortly after the change using configurable threshold.
+        # Positions of the other incidents in timestamp order, so each change's window is
+        # found by bisection instead of a scan; evidence keeps the incidents' original order.
+        times = [i.timestamp for i in other_incidents]
+        by_time = sorted(range(len(times)), key=times.__getitem__)
+        times.sort()
+        window = timedelta(seconds=thresholds.change_correlation_seconds)
         for change in change_incidents:
-            nearby_incidents = [
-                i for i in other_incidents
-                if abs((i.timestamp - change.timestamp).total_seconds()) < thresholds.change_correlation_seconds
-            ]
+            # Strictly inside (change - window, change + window)
+            lo = bisect_right(times, change.timestamp - window)
+            hi = bisect_left(times, change.timestamp + window, lo)
+            nearby_incidents = [other_incidents[k] for k in heapq.nsmallest(3, by_time[lo:hi])]
 
             if nearby_incidents:
-                evidence = [change.description] + [i.description for i in nearby_incidents[:3]]
+                evidence = [change.description] + [i.description for i in nearby_incidents]
                 candidates.append(RootCauseCandidate(
                     service=service,
                     incident_type=change.incident_type,
@@ -142,89 +264,82 @@ def _rule_recent_changes(graph: ServiceGraph, queries: GraphQueries, thresholds:
     return candidates
 
 
-def _rule_resource_exhaustion(graph: ServiceGraph, queries: GraphQueries) -> List[RootCauseCandidate]:
+def _rule_resource_exhaustion(
+    graph: ServiceGraph, queries: GraphQueries, *, incidents: List[IncidentNode]
+) -> List[RootCauseCandidate]:
     """
     Rule: Services with resource exhaustion (CPU, memory, connections) are strong candidates.
     """
     candidates = []
 
-    for incident in graph.incidents:
-        if incident.incident_type == IncidentType.RESOURCE_EXHAUSTION:
-            candidates.append(RootCauseCandidate(
-                service=incident.service,
-                incident_type=incident.incident_type,
-                confidence=0.85,
-                explanation=f"Resource exhaustion in {incident.service}: {incident.description}",
-                evidence=incident.evidence,
-                remediation=[
-                    f"Scale up {incident.service} resources (CPU, memory, connections)",
-                    "Check for resource leaks or inefficient queries",
-                    "Review recent traffic patterns and scaling policies",
-                ],
-            ))
+    for incident in incidents:
+        candidates.append(RootCauseCandidate(
+            service=incident.service,
+            incident_type=incident.incident_type,
+            confidence=0.85,
+            explanation=f"Resource exhaustion in {incident.service}: {incident.description}",
+            evidence=incident.evidence,
+            remediation=[
+                f"Scale up {incident.service} resources (CPU, memory, connections)",
+                "Check for resource leaks or inefficient queries",
+                "Review recent traffic patterns and scaling policies",
+            ],
+        ))
 
     return candidates
 
 
-def _rule_leaf_errors(graph: ServiceGraph, queries: GraphQueries) -> List[RootCauseCandidate]:
+def _rule_leaf_errors(
+    graph: ServiceGraph, queries: GraphQueries, *, context: _RuleContext
+) -> List[RootCauseCandidate]:
     """
     Rule: Services with errors that don't depend on other failing services are likely root causes.
     """
     candidates = []
-    incident_services = {i.service for i in graph.incidents}
-
-    for service in incident_services:
-        # Get dependencies for this service
-        deps = graph.get_dependencies_for_service(service)
 
-        # Check if any dependencies have incidents
-        has_failing_dependencies = any(dep.to_service in incident_services for dep in deps)
+    for service in context.incident_services:
+        # Skip services with a dependency that has incidents
+        if service in context.failing_dependencies:
+            continue
 
-        if not has_failing_dependencies:
-            # This is a leaf service with errors - strong root cause candidate
-            service_incidents = graph.get_incidents_for_service(service)
-            error_incidents = [
-                i for i in service_incidents
-                if i.incident_type in (IncidentType.ERROR_SPIKE, IncidentType.LATENCY_SPIKE)
-            ]
+        # This is a leaf service with errors - strong root cause candidate
+        # Use the first/most severe error incident
+        incident = context.first_symptom.get(service)
 
-            if error_incidents:
-                incident = error_incidents[0]  # Use the first/most severe
-                candidates.append(RootCauseCandidate(
-                    service=service,
-                    incident_type=incident.incident_type,
-                    confidence=0.75,
-                    explanation=f"{service} has errors with no failing dependencies",
-                    evidence=incident.evidence,
-                    remediation=[
-                        f"Investigate internal errors in {service}",
-                        "Check application logs for exceptions and stack traces",
-                        "Review recent code changes or deployments",
-                    ],
-                ))
+        if incident is not None:
+            candidates.append(RootCauseCandidate(
+                service=service,
+                incident_type=incident.incident_type,
+                confidence=0.75,
+                explanation=f"{service} has errors with no failing dependencies",
+                evidence=incident.evidence,
+                remediation=[
+                    f"Investigate internal errors in {service}",
+                    "Check application logs for exceptions and stack traces",
+                    "Review recent code changes or deployments",
+                ],
+            ))
 
     return candidates
 
 
-def _rule_foundational_services(graph: ServiceGraph, queries: GraphQueries) -> List[RootCauseCandidate]:
+def _rule_foundational_services(
+    graph: ServiceGraph, queries: GraphQueries, *, context: _RuleContext
+) -> List[RootCauseCandidate]:
     """
     Rule: Errors in foundational services (databases, caches) that many services depend on
     are likely root causes.
     """
     candidates = []
 
-    # Find services with many upstream dependencies (many services depend on them)
-    dependency_counts: Dict[str, int] = {}
-    for dep in graph.dependencies:
-        dependency_counts[dep.to_service] = dependency_counts.get(dep.to_service, 0) + 1
-
-    # Services with 2+ dependents are considered foundational
-    foundational_services = {service for service, count in dependency_counts.items() if count >= 2}
+    # Services with 2+ dependents (upstream callers) are considered foundational
+    foundational_services = {
+        service for service, count in context.dependents_count.items() if count >= 2
+    }
 
     for service in foundational_services:
-        incidents = graph.get_incidents_for_service(service)
-        if incidents:
-            incident = incidents[0]  # Use the first/most severe
+        incident = context.first_incident.get(service)
+        if incident is not None:  # Use the first/most severe
             candidates.append(RootCauseCandidate(
                 service=service,
                 incident_type=incident.incident_type,
@@ -241,15 +356,16 @@ def _rule_foundational_services(graph: ServiceGraph, queries: GraphQueries) -> L
     return candidates
 
 
-def _rule_causal_chains(graph: ServiceGraph, queries: GraphQueries) -> List[RootCauseCandidate]:
+def _rule_causal_chains(
+    graph: ServiceGraph, queries: GraphQueries, *, chains: List[CausalChain]
+) -> List[RootCauseCandidate]:
     """
     Rule: Analyze causal chains to identify the root (earliest) service in the chain.
+
+    ``chains`` are the top 3 most confident chains of up to 4 services.
     """
     candidates = []
-    chains = queries.find_causal_chains(max_length=4)
-
-    # Take the top 3 most confident chains
-    for chain in chains[:3]:
+    for chain in chains:
         if chain.score < 0.5:  # Skip low-confidence chains
             continue
 
@@ -5,10 +5,14 @@ Provides path validation, size limits, and sanitization to prevent security issu
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 
+# Redacted from error messages; resolved once, as it cannot change mid-run
+_HOME = os.path.expanduser("~")
+
 
 @dataclass
 class IngestionLimits:
@@ -72,13 +76,17 @@ class LineLengthError(ValidationError):
     pass
 
 
-def validate_path(source_path: Path, file_path: Path) -> bool:
+def validate_path(
+    source_path: Path, file_path: Path, source_resolved: Optional[Path] = None
+) -> bool:
     """
     Ensure file_path is within source_path to prevent path traversal attacks.
 
     Args:
         source_path: The expected root directory
         file_path: The file path to validate
+        source_resolved: ``source_path.resolve()``, when validating many files
+            under one root (saves resolving the root again for each of them)
 
     Returns:
         True if path is safe, False otherwise
@@ -88,7 +96,8 @@ def validate_path(source_path: Path, file_path: Path) -> bool:
     """
     try:
         # Resolve both paths to absolute paths
-        source_resolved = source_path.resolve()
+        if source_resolved is None:
+            source_resolved = source_path.resolve()
         file_resolved = file_path.resolve()
 
         # Check if file_path is within source_path
@@ -121,6 +130,54 @@ def check_file_size(file_path: Path, limits: IngestionLimits) -> None:
         raise ValidationError(f"Error checking file size: {e}")
 
 
+def prepare_file(
+    source_path: Path,
+    file_path: Path,
+    limits: IngestionLimits,
+    source_resolved: Optional[Path] = None,
+) -> Path:
+    """
+    Validate a file found under a source directory before it is loaded.
+
+    Combines validate_path() and check_file_size(): the file is resolved once
+    and the size is read with a single stat of the resolved path, instead of
+    resolving it and then stat-ing it again through any symlinks.
+
+    Args:
+        source_path: The expected root directory
+        file_path: The file to validate
+        limits: Ingestion limits configuration
+        source_resolved: ``source_path.resolve()``, as for validate_path()
+
+    Returns:
+        The resolved file path
+
+    Raises:
+        PathTraversalError: If the file resolves to outside the source directory
+        FileSizeError: If the file exceeds the size limit
+        ValidationError: If the file cannot be stat-ed
+    """
+    if source_resolved is None:
+        source_resolved = source_path.resolve()
+    file_resolved = file_path.resolve()
+    try:
+        file_resolved.relative_to(source_resolved)
+    except ValueError:
+        raise PathTraversalError(
+            f"Path traversal detected: {file_path} is outside {source_path}"
+        )
+
+    try:
+        size_mb = os.stat(file_resolved).st_size / (1024 * 1024)
+    except OSError as e:
+        raise ValidationError(f"Error checking file size: {e}")
+    if size_mb > limits.max_file_size_mb:
+        raise FileSizeError(
+            f"File size {size_mb:.1f}MB exceeds limit of {limits.max_file_size_mb}MB"
+        )
+    return file_resolved
+
+
 def check_line_length(line: str, limits: IngestionLimits) -> None:
     """
     Check if line length is within limits.
@@ -153,16 +210,30 @@ def sanitize_error_message(error: Exception, file_path: Optional[Path] = None) -
 
     # Redact absolute paths
     if file_path:
-        message = message.replace(str(file_path.resolve()), f"<file:{file_path.name}>")
+        resolved = _resolved(file_path)
+        if resolved in message:
+            message = message.replace(resolved, f"<file:{file_path.name}>")
 
     # Redact home directory paths
-    home = os.path.expanduser("~")
-    if home in message:
-        message = message.replace(home, "~")
+    if _HOME in message:
+        message = message.replace(_HOME, "~")
 
     return message
 
 
+def _resolved(path: Path) -> str:
+    """``str(path.resolve())``, resolved once per absolute path (it costs a realpath syscall)."""
+    if not path.is_absolute():
+        # Anchored to the current directory first, so a cached entry never outlives a chdir
+        path = Path(os.getcwd(), path)
+    return _resolved_absolute(path)
+
+
+@lru_cache(maxsize=1024)
+def _resolved_absolute(path: Path) -> str:
+    return str(path.resolve())
+
+
 def check_total_events(current_count: int, limits: IngestionLimits) -> None:
     """
     Check if total event count is within limits.
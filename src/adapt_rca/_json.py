@@ -0,0 +1,50 @@
+"""
+JSON backend: orjson when installed, the standard library otherwise.
+
+Both backends read and write the same data: input lines are decoded as
+UTF-8 and output is indented, UTF-8 encoded JSON with non-ASCII text
+written as is. orjson's decode error subclasses json.JSONDecodeError, so
+callers catch JSONDecodeError either way.
+"""
+
+import json
+from typing import Any, Callable, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class Backend(NamedTuple):
+    """One JSON implementation and how files are opened for it."""
+
+    name: str
+    loads: Callable[[Any], Any]
+    dumps_indented: Callable[[Any], bytes]
+    # orjson parses bytes lines directly, so files are read without decoding
+    # them to text first; the stdlib parser is faster on str lines
+    read_mode: str
+    read_encoding: Optional[str]
+
+
+def _stdlib_dumps_indented(obj: Any) -> bytes:
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+BACKENDS = [Backend("json", json.loads, _stdlib_dumps_indented, "r", "utf-8")]
+if orjson is not None:
+    BACKENDS.append(
+        Backend(
+            "orjson",
+            orjson.loads,
+            lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2),
+            "rb",
+            None,
+        )
+    )
+
+# The fastest backend available; the rest are kept for tests
+backend = BACKENDS[-1]
@@ -1,24 +1,42 @@
 import argparse
-import json
-from pathlib import Path
+import sys
+from itertools import islice
+from typing import Dict, Iterable, Iterator
 
 from .config import RCAConfig
 from .ingestion.file_loader import load_jsonl
-from .parsing.log_parser import normalize_event
+from .parsing.log_parser import normalize_events_batch
 from .reasoning.heuristics import simple_grouping
 from .reasoning.agent import analyze_incident
+from .reporting.exporters import export_json
 from .reporting.formatter import format_human_readable
 
+def _capped(records: Iterable[Dict], limit: int) -> Iterator[Dict]:
+    """Yield the first ``limit`` records, warning on stderr if the input had more."""
+    records = iter(records)
+    yield from islice(records, limit)
+    for _ in records:
+        print(
+            f"warning: only the first {limit} events were analyzed "
+            f"(ADAPT_RCA_MAX_EVENTS); the rest of the input was ignored",
+            file=sys.stderr,
+        )
+        break
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="ADAPT-RCA CLI")
     parser.add_argument("--input", required=True, help="Path to JSONL log file")
     parser.add_argument("--output", help="Path to write JSON result")
     args = parser.parse_args()
 
-    config = RCAConfig()  # future use
+    config = RCAConfig()
 
-    raw_events = list(load_jsonl(args.input))
-    events = [normalize_event(e) for e in raw_events]
+    # One pass from the file into columns; no intermediate list of records.
+    # With ADAPT_RCA_MAX_EVENTS set, reading stops after that many records.
+    records = load_jsonl(args.input)
+    if config.max_events is not None:
+        records = _capped(records, config.max_events)
+    events = normalize_events_batch(records)
 
     incident_groups = simple_grouping(events)
     # For now, treat all events as one incident
@@ -27,8 +45,7 @@ def main() -> None:
     print(format_human_readable(result))
 
     if args.output:
-        out_path = Path(args.output)
-        out_path.write_text(json.dumps(result, indent=2))
+        export_json(result, args.output)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,18 @@
 import os
 from dataclasses import dataclass
+from typing import Optional
+
+def _env_limit(name: str) -> Optional[int]:
+    """Read an optional count limit from the environment; unset, empty or <= 0 means none."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return None
+    limit = int(value)
+    return limit if limit > 0 else None
 
 @dataclass
 class RCAConfig:
     llm_provider: str = os.getenv("ADAPT_RCA_LLM_PROVIDER", "none")
     llm_model: str = os.getenv("ADAPT_RCA_LLM_MODEL", "")
-    max_events: int = int(os.getenv("ADAPT_RCA_MAX_EVENTS", "5000"))
+    max_events: Optional[int] = _env_limit("ADAPT_RCA_MAX_EVENTS")
     time_window_minutes: int = int(os.getenv("ADAPT_RCA_TIME_WINDOW", "15"))
@@ -1,3 +1,5 @@
+from array import array
+from itertools import accumulate
 from typing import List, Dict, Tuple
 
 class CausalGraph:
@@ -8,15 +10,25 @@ class CausalGraph:
     - Build nodes from services/components
     - Add edges based on temporal relationships and dependencies
     - Annotate edges with evidence (log lines, metrics, time deltas)
+
+    Nodes and edges are staged as dicts while the graph is built; finalize()
+    (called on demand by successors()) indexes the edges in CSR form for
+    traversals.
     """
 
     def __init__(self):
         self.nodes = []
         self.edges = []
+        self.node_ids: Dict[str, int] = {}
+        self.node_names: List[str] = []
+        self.indptr = array("i", [0])
+        self.indices = array("i")
+        self._finalized = True
 
     def add_node(self, node_id: str, metadata: Dict = None):
         """Add a node (service/component) to the graph."""
         self.nodes.append({"id": node_id, "metadata": metadata or {}})
+        self._finalized = False
 
     def add_edge(self, from_node: str, to_node: str, evidence: List[str] = None):
         """Add a directed edge with optional evidence."""
@@ -25,6 +37,50 @@ class CausalGraph:
             "to": to_node,
             "evidence": evidence or []
         })
+        self._finalized = False
+
+    def finalize(self) -> None:
+        """
+        Index the edges in CSR (compressed sparse row) form.
+
+        Nodes get integer ids in the order they were added (then nodes only
+        named by edges, in edge order). The successors of node ``u`` are
+        ``indices[indptr[u]:indptr[u + 1]]``, in the order their edges were added.
+        """
+        ids: Dict[str, int] = {}
+        for node in self.nodes:
+            ids.setdefault(node["id"], len(ids))
+        for edge in self.edges:
+            ids.setdefault(edge["from"], len(ids))
+            ids.setdefault(edge["to"], len(ids))
+
+        # Out-degree of each node, prefix-summed into row offsets
+        degrees = [0] * (len(ids) + 1)
+        for edge in self.edges:
+            degrees[ids[edge["from"]] + 1] += 1
+        indptr = array("i", accumulate(degrees))
+
+        # Scatter each edge's target into the next free slot of its source's row
+        indices = array("i", [0]) * len(self.edges)
+        fill = indptr[:-1]
+        for edge in self.edges:
+            row = ids[edge["from"]]
+            indices[fill[row]] = ids[edge["to"]]
+            fill[row] += 1
+
+        self.node_ids, self.node_names = ids, list(ids)
+        self.indptr, self.indices = indptr, indices
+        self._finalized = True
+
+    def successors(self, node_id: str) -> List[str]:
+        """Nodes that ``node_id`` has an edge to, in the order the edges were added."""
+        if not self._finalized:
+            self.finalize()
+        row = self.node_ids.get(node_id)
+        if row is None:
+            return []
+        names = self.node_names
+        return [names[n] for n in self.indices[self.indptr[row]:self.indptr[row + 1]]]
 
     def to_dict(self) -> Dict:
         """Export graph as a dictionary."""
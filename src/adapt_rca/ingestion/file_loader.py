@@ -1,16 +1,18 @@
 from pathlib import Path
 from typing import Iterable, Dict
-import json
+
+from .. import _json
+
 
 def load_jsonl(path: str | Path) -> Iterable[Dict]:
     path = Path(path)
-    with path.open() as f:
+    backend = _json.backend
+    with path.open(backend.read_mode, encoding=backend.read_encoding) as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
+                yield backend.loads(line)
+            except _json.JSONDecodeError:
                 # Could add logging here
                 continue
@@ -1,4 +1,9 @@
-from typing import Dict
+import re
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Level named in the message text, for records without a level field
+_LEVEL_RE = re.compile(r'\b(CRITICAL|ERROR|WARN|INFO|DEBUG)\b')
 
 def normalize_event(raw: Dict) -> Dict:
     """
@@ -8,7 +13,96 @@ def normalize_event(raw: Dict) -> Dict:
     return {
         "timestamp": raw.get("timestamp"),
         "service": raw.get("service") or raw.get("component"),
-        "level": raw.get("level") or raw.get("severity"),
+        "level": _level(raw),
         "message": raw.get("message"),
         "raw": raw,
     }
+
+
+def _level(raw: Dict) -> Optional[Any]:
+    """The record's level/severity field, else the first level word in its message."""
+    level = raw.get("level") or raw.get("severity")
+    if level is None:
+        message = raw.get("message")
+        if isinstance(message, str):
+            match = _LEVEL_RE.search(message)
+            if match:
+                level = match.group(1)
+    return level
+
+
+class EventBatch:
+    """
+    Normalized events stored column by column instead of one dict per event.
+
+    Services and levels are interned: each event stores a small integer code
+    (an index into ``services`` / ``levels``, or -1 when missing), so a batch
+    needs a few pointers and two ints per event rather than a five-key dict,
+    and per-service questions are answered from the code column alone.
+    Iterating a batch yields the same dicts normalize_event() returns.
+    """
+
+    def __init__(self):
+        self.timestamps: List[Any] = []
+        self.service_codes = array("i")
+        self.level_codes = array("i")
+        self.messages: List[Any] = []
+        self.raw: List[Dict] = []
+        self.services: List[Any] = []
+        self.levels: List[Any] = []
+        self._service_index: Dict[Any, int] = {}
+        self._level_index: Dict[Any, int] = {}
+
+    def append(self, raw: Dict) -> None:
+        """Normalize one raw record into the batch."""
+        service = raw.get("service") or raw.get("component")
+        level = _level(raw)
+        self.timestamps.append(raw.get("timestamp"))
+        self.service_codes.append(self._code(service, self._service_index, self.services))
+        self.level_codes.append(self._code(level, self._level_index, self.levels))
+        self.messages.append(raw.get("message"))
+        self.raw.append(raw)
+
+    @staticmethod
+    def _code(value: Any, index: Dict[Any, int], names: List[Any]) -> int:
+        if value is None:
+            return -1
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(names)
+            names.append(value)
+        return code
+
+    def distinct_services(self) -> List[Any]:
+        """Services present in the batch, sorted."""
+        return sorted(self.services[code] for code in set(self.service_codes) if code >= 0)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return map(self.event, range(len(self.raw)))
+
+    def event(self, row: int) -> Dict:
+        """Row ``row`` as a normalize_event() dict."""
+        return {
+            "timestamp": self.timestamps[row],
+            "service": self._name(self.services, self.service_codes[row]),
+            "level": self._name(self.levels, self.level_codes[row]),
+            "message": self.messages[row],
+            "raw": self.raw[row],
+        }
+
+    @staticmethod
+    def _name(names: List[Any], code: int) -> Optional[Any]:
+        return names[code] if code >= 0 else None
+
+
+def normalize_events_batch(raw_events: Iterable[Dict]) -> EventBatch:
+    """
+    Normalizes raw log records into one EventBatch, in a single pass.
+    """
+    batch = EventBatch()
+    for raw in raw_events:
+        batch.append(raw)
+    return batch
@@ -1,13 +1,20 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 
-def analyze_incident(events: List[Dict]) -> Dict:
+from ..parsing.log_parser import EventBatch
+
+def analyze_incident(events: Union[List[Dict], EventBatch]) -> Dict:
     """
     Placeholder for the agentic reasoning logic.
 
     For now, returns a static structure so the CLI can run end-to-end.
     Later, plug in an LLM here.
     """
-    services = sorted({e.get("service") for e in events if e.get("service")})
+    if isinstance(events, EventBatch):
+        # Distinct services straight from the interned code column
+        services = [s for s in events.distinct_services() if s]
+    else:
+        # One lookup per event; missing/empty services are dropped from the set after
+        services = sorted(filter(None, {e.get("service") for e in events}))
     return {
         "incident_summary": "Prototype analysis: {} events across services: {}".format(
             len(events), ", ".join(services)
@@ -1,9 +1,14 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 
-def simple_grouping(events: List[Dict]) -> List[List[Dict]]:
+from ..parsing.log_parser import EventBatch
+
+Events = Union[List[Dict], EventBatch]
+
+def simple_grouping(events: Events) -> List[Events]:
     """
     Very basic grouping: put all events into a single incident candidate.
     Later, this can be replaced with time-window + service-based grouping.
+    Accepts a list of event dicts or an EventBatch.
     """
     if not events:
         return []
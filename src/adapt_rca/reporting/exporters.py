@@ -1,12 +1,13 @@
 from typing import Dict
-import json
+
+from .. import _json
 
 def export_json(result: Dict, output_path: str) -> None:
     """
-    Export analysis results to JSON format.
+    Export analysis results to JSON format (UTF-8, indented by 2 spaces).
     """
-    with open(output_path, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(_json.backend.dumps_indented(result))
 
 def export_markdown(result: Dict, output_path: str) -> None:
     """
@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+
+from adapt_rca import _json
+
+
+@pytest.fixture(params=_json.BACKENDS, ids=lambda backend: backend.name)
+def json_backend(request, monkeypatch):
+    """Run the test on each adapt_rca JSON backend available here."""
+    monkeypatch.setattr(_json, "backend", request.param)
+    return request.param
@@ -0,0 +1,223 @@
+"""
+Tests for the RCA result cache.
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+from autorca_core.cache import DiskResponseCache, ExactMatchCache, SemanticCache, run_cache_key
+from autorca_core.cache.semantic import DEFAULT_THRESHOLD
+from autorca_core.model.graph import Dependency, IncidentNode, IncidentType, ServiceGraph
+from autorca_core.reasoning.llm import CachedLLM, DummyLLM
+from autorca_core.reasoning.loop import DataSourcesConfig, arun_rca
+from autorca_core.reasoning.rules import RootCauseCandidate
+
+
+def test_exact_cache_roundtrip_and_clear(tmp_path):
+    """Stored values come back unchanged until the cache is cleared."""
+    with ExactMatchCache(tmp_path / "runs.db") as cache:
+        cache.set("k", {"summary": "db saturated", "candidates": [1, 2]})
+        assert cache.get("k") == {"summary": "db saturated", "candidates": [1, 2]}
+        assert cache.get("missing") is None
+        assert cache.clear() == 1
+        assert cache.get("k") is None
+
+
+def test_response_cache_keys_on_the_whole_request(tmp_path):
+    """Responses come back only for the identical request, and the modes are honoured."""
+    request = {
+        "model": "claude/x", "max_tokens": 10, "messages": [{"role": "user", "content": "a"}],
+    }
+    cache = DiskResponseCache(tmp_path)
+    cache.set(request, "answer")
+    assert cache.get(dict(request)) == "answer"
+    assert cache.get({**request, "max_tokens": 20}) is None
+
+    DiskResponseCache(tmp_path, mode="read").set({**request, "max_tokens": 20}, "new")
+    assert cache.get({**request, "max_tokens": 20}) is None
+    assert DiskResponseCache(tmp_path, mode="write").get(request) is None
+    assert cache.clear() == 1
+    assert cache.get(request) is None
+
+
+def test_run_cache_key_tracks_inputs(tmp_path):
+    """The key changes with the symptom, the settings and the input files."""
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    log_file = logs / "app.jsonl"
+    log_file.write_text('{"message": "boom"}\n')
+
+    key = run_cache_key("API 500s", [str(logs), None], window_minutes=10)
+    assert key == run_cache_key("API 500s", [str(logs), None], window_minutes=10)
+    assert key != run_cache_key("API 503s", [str(logs), None], window_minutes=10)
+    assert key != run_cache_key("API 500s", [str(logs), None], window_minutes=30)
+
+    stat = log_file.stat()
+    os.utime(log_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert key != run_cache_key("API 500s", [str(logs), None], window_minutes=10)
+
+
+def _bag_of_words(text):
+    vocab = ["api", "500", "errors", "checkout", "http", "latency"]
+    words = text.lower().replace("s ", " ").split()
+    return [float(sum(w.startswith(v) for w in words)) for v in vocab]
+
+
+def test_semantic_cache_matches_similar_symptom_on_same_data(tmp_path):
+    """A reworded symptom hits only when the data key matches exactly."""
+    with SemanticCache(tmp_path / "semantic.db", threshold=0.8, embed=_bag_of_words) as cache:
+        cache.set("API 500 errors", "data-1", "cached result")
+
+        assert cache.get("api 500 errors", "data-1") == "cached result"
+        assert cache.get("API 500 errors", "data-2") is None
+        assert cache.get("checkout latency", "data-1") is None
+
+
+def test_semantic_cache_ignores_invalid_threshold_env(tmp_path, monkeypatch):
+    """A non-numeric or out-of-range threshold falls back to the default."""
+    for value in ("0.9x", "1.5", "nan"):
+        monkeypatch.setenv("AUTORCA_SEMANTIC_THRESHOLD", value)
+        with SemanticCache(tmp_path / "semantic.db", embed=_bag_of_words) as cache:
+            assert cache.threshold == DEFAULT_THRESHOLD
+
+    monkeypatch.setenv("AUTORCA_SEMANTIC_THRESHOLD", "0.75")
+    with SemanticCache(tmp_path / "semantic.db", embed=_bag_of_words) as cache:
+        assert cache.threshold == 0.75
+
+
+def test_cached_llm_reuses_summaries_for_same_candidates():
+    """A repeated symptom, candidate set and graph is summarized once; a change misses."""
+    llm = CachedLLM(DummyLLM(), maxsize=1)
+    graph = ServiceGraph()
+    candidates = [RootCauseCandidate(
+        service="db",
+        incident_type=IncidentType.RESOURCE_EXHAUSTION,
+        confidence=0.9,
+        explanation="connection pool exhausted",
+        evidence=["pool at 100%"],
+        remediation=["raise pool size"],
+    )]
+
+    first = llm.summarize_rca(graph, candidates, "API 500s")
+    assert llm.summarize_rca(graph, candidates, "API 500s") == first
+    assert llm.cache_info()["hits"] == 1
+
+    llm.summarize_rca(graph, candidates, "API 503s")
+    assert llm.cache_info() == {"hits": 1, "misses": 2, "entries": 1, "maxsize": 1}
+
+    # The graph the prompt would show is part of the key
+    graph.add_dependency(Dependency("api", "db"))
+    llm.summarize_rca(graph, candidates, "API 503s")
+    assert llm.cache_info()["misses"] == 3
+
+
+def test_cached_llm_keys_summaries_on_the_budgeted_context():
+    """Graphs that differ only past the unbudgeted cut-off miss when a budget shows it."""
+    class BudgetedLLM(DummyLLM):
+        token_budget = 10_000
+
+    def graph(last_service):
+        start = datetime(2025, 11, 10, 10, 0, 0)
+        graph = ServiceGraph()
+        for i, service in enumerate(["api"] * 15 + [last_service]):
+            graph.add_incident(
+                IncidentNode(service, IncidentType.ERROR_SPIKE, start + timedelta(minutes=i))
+            )
+        return graph
+
+    llm = CachedLLM(BudgetedLLM())
+    llm.summarize_rca(graph("db"), [], "API 500s")
+    llm.summarize_rca(graph("cache"), [], "API 500s")
+    assert llm.cache_info()["hits"] == 0
+
+    # Without a budget neither prompt shows the 16th incident, so the key is shared
+    unbudgeted = CachedLLM(DummyLLM())
+    unbudgeted.summarize_rca(graph("db"), [], "API 500s")
+    unbudgeted.summarize_rca(graph("cache"), [], "API 500s")
+    assert unbudgeted.cache_info()["hits"] == 1
+
+
+def test_arun_rca_summaries_go_through_the_cache():
+    """arun_rca() awaits CachedLLM.asummarize_rca(), which caches the async answer."""
+    class AsyncLLM(DummyLLM):
+        calls = 0
+
+        async def asummarize_rca(self, graph, candidates, primary_symptom):
+            AsyncLLM.calls += 1
+            return self.summarize_rca(graph, candidates, primary_symptom)
+
+    llm = CachedLLM(AsyncLLM())
+    window = (datetime(2025, 11, 10, 10, 0, 0), datetime(2025, 11, 10, 10, 5, 0))
+    first = asyncio.run(arun_rca(window, "API 500s", DataSourcesConfig(), llm=llm))
+    second = asyncio.run(arun_rca(window, "API 500s", DataSourcesConfig(), llm=llm))
+
+    assert second.summary == first.summary
+    assert AsyncLLM.calls == 1
+    assert llm.cache_info()["hits"] == 1
+
+
+def test_cached_llm_does_not_cache_failed_remediation():
+    """A remediation the wrapped LLM fell back to is retried; batches reuse cached steps."""
+    class FlakyLLM(DummyLLM):
+        fallback_remediations = 0
+        fail = True
+        calls = 0
+
+        def enhance_remediation(self, candidate, context):
+            FlakyLLM.calls += 1
+            if self.fail:
+                self.fallback_remediations += 1
+                return candidate.remediation
+            return [f"enhanced: {step}" for step in candidate.remediation]
+
+    candidates = [
+        RootCauseCandidate(
+            service=service,
+            incident_type=IncidentType.RESOURCE_EXHAUSTION,
+            confidence=0.9,
+            explanation="connection pool exhausted",
+            evidence=[],
+            remediation=["raise pool size"],
+        )
+        for service in ("db", "cache")
+    ]
+    wrapped = FlakyLLM()
+    llm = CachedLLM(wrapped)
+
+    assert llm.enhance_remediation(candidates[0], {}) == ["raise pool size"]
+    assert llm.cache_info()["entries"] == 0
+
+    wrapped.fail = False
+    assert llm.enhance_remediation(candidates[0], {}) == ["enhanced: raise pool size"]
+    assert llm.enhance_many(candidates, {}) == [["enhanced: raise pool size"]] * 2
+    assert llm.enhance_remediation_batch(candidates, {}) == [["enhanced: raise pool size"]] * 2
+    assert FlakyLLM.calls == 3
+    assert llm.cache_info()["hits"] == 3
+
+
+def test_mcp_loads_keep_one_entry_per_source(tmp_path, monkeypatch):
+    """A changed file or new options replace a source's entry; clear_load_cache() drops all."""
+    from autorca_core.mcp import server
+
+    monkeypatch.setattr(server, "_loaded", type(server._loaded)())
+    log_file = tmp_path / "app.log"
+    log_file.write_text("one\n")
+    calls = []
+
+    def loader(path, **options):
+        calls.append(options)
+        return open(path).read().split()
+
+    assert server._load_cached(loader, str(log_file)) == ["one"]
+    assert server._load_cached(loader, str(log_file)) == ["one"]
+    assert server._load_cached(loader, str(log_file), service_filter="api") == ["one"]
+    assert len(calls) == 2 and len(server._loaded) == 1
+
+    log_file.write_text("one two\n")
+    stat = log_file.stat()
+    os.utime(log_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert server._load_cached(loader, str(log_file)) == ["one", "two"]
+    assert len(server._loaded) == 1
+
+    assert server.clear_load_cache() == 1
+    assert server._loaded == {}
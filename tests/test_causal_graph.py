@@ -0,0 +1,58 @@
+"""
+Tests for the adapt_rca causal graph.
+"""
+from adapt_rca.graph.causal_graph import CausalGraph
+
+
+def test_successors_follow_edge_order():
+    """Each node's successors come back in the order their edges were added."""
+    graph = CausalGraph()
+    for node in ["api", "db", "cache"]:
+        graph.add_node(node)
+    graph.add_edge("api", "db")
+    graph.add_edge("db", "cache")
+    graph.add_edge("api", "cache")
+    graph.add_edge("api", "db")
+
+    assert graph.successors("api") == ["db", "cache", "db"]
+    assert graph.successors("db") == ["cache"]
+    assert graph.successors("cache") == []
+    assert list(graph.indptr) == [0, 3, 4, 4]
+
+
+def test_edge_only_nodes_are_indexed_after_declared_nodes():
+    """Nodes first named by an edge get ids after the added nodes, in edge order."""
+    graph = CausalGraph()
+    graph.add_node("api")
+    graph.add_edge("queue", "worker")
+    graph.add_edge("api", "queue")
+    graph.finalize()
+
+    assert graph.node_names == ["api", "queue", "worker"]
+    assert graph.node_ids == {"api": 0, "queue": 1, "worker": 2}
+    assert graph.successors("queue") == ["worker"]
+    assert graph.successors("worker") == []
+
+
+def test_unknown_nodes_and_empty_graphs_have_no_successors():
+    """A node the graph has never seen, or an empty graph, gives an empty list."""
+    empty = CausalGraph()
+    assert empty.successors("api") == []
+    empty.finalize()
+    assert list(empty.indptr) == [0] and list(empty.indices) == []
+
+    graph = CausalGraph()
+    graph.add_edge("api", "db")
+    assert graph.successors("missing") == []
+
+
+def test_adding_an_edge_after_finalize_reindexes():
+    """successors() re-finalizes once the graph has changed since the last index."""
+    graph = CausalGraph()
+    graph.add_edge("api", "db")
+    assert graph.successors("api") == ["db"]
+
+    graph.add_edge("api", "cache")
+    graph.add_node("worker")
+    assert graph.successors("api") == ["db", "cache"]
+    assert graph.node_names == ["worker", "api", "db", "cache"]
@@ -0,0 +1,48 @@
+"""
+Tests for the adapt_rca command line.
+"""
+import json
+
+from adapt_rca import cli
+from adapt_rca.config import RCAConfig, _env_limit
+
+
+def _run(monkeypatch, tmp_path, max_events):
+    path = tmp_path / "logs.jsonl"
+    path.write_text("".join(
+        json.dumps({"timestamp": f"2025-11-16T10:00:0{i}Z", "service": f"svc-{i}",
+                    "level": "ERROR", "message": "boom"}) + "\n"
+        for i in range(3)
+    ))
+    output = tmp_path / "result.json"
+    monkeypatch.setattr(cli, "RCAConfig", lambda: RCAConfig(max_events=max_events))
+    monkeypatch.setattr("sys.argv", ["adapt-rca", "--input", str(path), "--output", str(output)])
+    cli.main()
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def test_cli_reads_the_whole_input_without_a_cap(monkeypatch, tmp_path, capsys):
+    """With no max_events every event is analyzed and nothing is warned about."""
+    result = _run(monkeypatch, tmp_path, None)
+    assert result["incident_summary"].endswith("3 events across services: svc-0, svc-1, svc-2")
+    assert capsys.readouterr().err == ""
+
+
+def test_cli_warns_when_max_events_truncates(monkeypatch, tmp_path, capsys):
+    """A cap below the input size keeps the first events and says so on stderr."""
+    result = _run(monkeypatch, tmp_path, 2)
+    assert result["incident_summary"].endswith("2 events across services: svc-0, svc-1")
+    assert "only the first 2 events" in capsys.readouterr().err
+
+    _run(monkeypatch, tmp_path, 3)
+    assert capsys.readouterr().err == ""
+
+
+def test_max_events_env_limit(monkeypatch):
+    """Unset, empty and non-positive values mean no limit."""
+    for value, expected in [(None, None), ("", None), ("-1", None), ("0", None), ("250", 250)]:
+        if value is None:
+            monkeypatch.delenv("ADAPT_RCA_MAX_EVENTS", raising=False)
+        else:
+            monkeypatch.setenv("ADAPT_RCA_MAX_EVENTS", value)
+        assert _env_limit("ADAPT_RCA_MAX_EVENTS") == expected
@@ -0,0 +1,23 @@
+"""
+Tests for the adapt_rca result exporters.
+"""
+import json
+
+from adapt_rca.reporting.exporters import export_json
+
+
+def test_export_json_round_trips_utf8(tmp_path, json_backend):
+    """The result is written as indented UTF-8 JSON that loads back unchanged."""
+    result = {
+        "incident_summary": "café service: délai dépassé",
+        "probable_root_causes": ["Prototype root cause – plug in LLM or heuristics here."],
+        "recommended_actions": [],
+    }
+    path = tmp_path / "result.json"
+
+    export_json(result, str(path))
+    data = path.read_bytes()
+    assert json.loads(data.decode("utf-8")) == result
+    # Written raw rather than as \u escapes, indented by two spaces
+    assert "délai dépassé".encode("utf-8") in data and b"\\u" not in data
+    assert data.startswith(b'{\n  "incident_summary": ')
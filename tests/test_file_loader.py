@@ -0,0 +1,36 @@
+"""
+Tests for the adapt_rca JSONL loader.
+"""
+import json
+
+from adapt_rca.ingestion.file_loader import load_jsonl
+
+
+def test_load_jsonl_skips_blank_and_malformed_lines(tmp_path, json_backend):
+    """Blank and unparsable lines are dropped; the rest load in file order."""
+    path = tmp_path / "logs.jsonl"
+    path.write_bytes(
+        b'{"service": "api", "message": "timeout"}\n'
+        b"\n"
+        b"   \n"
+        b"{not json\n"
+        b'{"service": "db", "message": "slow"\n'
+        b'{"service": "db", "message": "slow"}  \r\n'
+    )
+
+    assert list(load_jsonl(path)) == [
+        {"service": "api", "message": "timeout"},
+        {"service": "db", "message": "slow"},
+    ]
+
+
+def test_load_jsonl_decodes_utf8(tmp_path, json_backend):
+    """Non-ASCII text, raw or escaped, round-trips through the loader."""
+    records = [{"service": "café", "message": "délai dépassé ☕"}, {"message": "タイムアウト"}]
+    path = tmp_path / "logs.jsonl"
+    path.write_text(
+        json.dumps(records[0], ensure_ascii=False) + "\n" + json.dumps(records[1]) + "\n",
+        encoding="utf-8",
+    )
+
+    assert list(load_jsonl(path)) == records
@@ -0,0 +1,237 @@
+"""
+Tests for graph engine module.
+"""
+import json
+from datetime import datetime, timedelta
+
+from autorca_core.model.events import LogEvent, MetricPoint, Severity
+from autorca_core.model.metric_series import MetricSeries
+from autorca_core.model.graph import Dependency, IncidentNode, IncidentType, ServiceGraph
+from autorca_core.graph_engine.builder import GraphBuilder, build_service_graph
+from autorca_core.graph_engine.queries import GraphQueries
+
+
+def _error(service: str, timestamp: datetime, message: str = "boom") -> LogEvent:
+    return LogEvent(timestamp=timestamp, service=service, message=message, level=Severity.ERROR)
+
+
+def test_error_spike_found_inside_long_error_tail():
+    """A burst of errors is a spike even if other errors are spread over hours."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    logs = [_error("api", start - timedelta(hours=2), "early")]
+    logs += [_error("api", start + timedelta(seconds=10 * i), f"burst {i}") for i in range(4)]
+    logs.append(_error("api", start + timedelta(hours=3), "late"))
+
+    graph = build_service_graph(logs=logs)
+
+    spikes = [i for i in graph.incidents if i.incident_type == IncidentType.ERROR_SPIKE]
+    assert len(spikes) == 1
+    assert spikes[0].timestamp == start
+    assert spikes[0].description == "4 errors in 30s"
+    assert spikes[0].evidence[0] == "Error: burst 0"
+
+
+def test_sparse_errors_are_not_a_spike():
+    """Errors spaced wider than the window never form a spike."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    logs = [_error("api", start + timedelta(minutes=10 * i)) for i in range(5)]
+
+    graph = build_service_graph(logs=logs)
+
+    assert graph.incidents == []
+
+
+def test_log_columns_match_row_based_detection():
+    """Columnar log input produces the same incidents as LogEvent input."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    logs = [_error("db", start + timedelta(seconds=i), f"err {i}") for i in range(3)]
+    logs.append(LogEvent(timestamp=start, service="web", message="ok", level=Severity.INFO))
+
+    builder = GraphBuilder()
+    builder.add_log_columns({
+        "service": [log.service for log in logs],
+        "timestamp": [log.timestamp for log in logs],
+        "level": [log.level.value.lower() for log in logs],
+        "message": [log.message for log in logs],
+    })
+    columnar = builder.build()
+    rows = build_service_graph(logs=logs)
+
+    assert set(columnar.services) == set(rows.services) == {"db", "web"}
+    assert [(i.service, i.description, i.evidence) for i in columnar.incidents] == [
+        (i.service, i.description, i.evidence) for i in rows.incidents
+    ]
+
+
+def test_metric_series_matches_point_based_detection():
+    """A MetricSeries produces the same incidents as the MetricPoints it holds."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    points = [
+        MetricPoint(timestamp=start + timedelta(seconds=i), service=service,
+                    metric_name=name, value=value, unit="ms")
+        for i, (service, name, value) in enumerate([
+            ("db", "cpu_percent", 95.0), ("api", "latency_p95", 1500.0),
+            ("db", "cpu_percent", 97.0), ("api", "latency_p95", 1800.0),
+            ("db", "cpu_percent", 99.0), ("api", "latency_p95", 2100.0),
+            ("api", "requests", 5.0), ("api", "latency_p95", 2500.0),
+        ])
+    ]
+
+    series = MetricSeries.from_points(points)
+    builder = GraphBuilder()
+    builder.add_metric_series(series)
+    columnar = builder.build()
+    rows = build_service_graph(metrics=points)
+
+    assert [p.value for p in series] == [p.value for p in points]
+    assert list(columnar.services) == list(rows.services) == ["db", "api"]
+    assert [(i.service, i.timestamp, i.evidence) for i in columnar.incidents] == [
+        (i.service, i.timestamp, i.evidence) for i in rows.incidents
+    ]
+    assert len(rows.incidents) == 2
+
+
+def test_log_stream_matches_batch_detection():
+    """Online detection over an ordered stream finds the same spikes as add_logs()."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    logs = [_error("api", start - timedelta(hours=1), "early")]
+    logs += [_error("api", start + timedelta(seconds=20 * i), f"api {i}") for i in range(7)]
+    logs += [_error("db", start + timedelta(seconds=i), f"db {i}") for i in range(3)]
+    logs.append(_error("api", start + timedelta(hours=1), "late"))
+    logs.sort(key=lambda log: log.timestamp)
+
+    builder = GraphBuilder()
+    builder.add_log_stream(iter(logs))
+    streamed = builder.build()
+    batch = build_service_graph(logs=logs)
+
+    def key(incident):
+        return (incident.service, incident.timestamp, incident.description, incident.evidence)
+
+    assert sorted(map(key, streamed.incidents)) == sorted(map(key, batch.incidents))
+    assert len(streamed.incidents) == 2
+
+
+def test_parallel_detection_matches_serial():
+    """Worker-process detection builds the same graph as the serial path."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    logs = [_error("db", start + timedelta(seconds=i), f"err {i}") for i in range(4)]
+    logs.append(LogEvent(timestamp=start, service="web", message="ok", level=Severity.INFO))
+
+    serial = build_service_graph(logs=logs)
+    parallel = build_service_graph(logs=logs, max_workers=2)
+
+    assert serial.to_dict() == parallel.to_dict()
+
+
+def test_top_k_causal_chains_match_full_enumeration():
+    """Pruned top-K search returns the same chains, in order, as ranking all of them."""
+    graph = ServiceGraph()
+    services = [f"svc-{i}" for i in range(7)]
+    for i, caller in enumerate(services):
+        for callee in services[i + 1:i + 4]:
+            graph.add_dependency(Dependency(caller, callee))
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    for i, service in enumerate(services):
+        graph.add_incident(IncidentNode(
+            service, IncidentType.ERROR_SPIKE, start - timedelta(seconds=i), 0.3 + 0.1 * i
+        ))
+
+    queries = GraphQueries(graph)
+    full = [(c.services, c.score) for c in queries.find_causal_chains(max_length=4)]
+    for top_k in (1, 3, 10):
+        top = queries.find_causal_chains(max_length=4, top_k=top_k)
+        assert [(c.services, c.score) for c in top] == full[:top_k]
+
+
+def test_causal_chains_reach_services_past_64_incidents():
+    """The visited bitmask is an unbounded int, so any number of incident services works."""
+    graph = ServiceGraph()
+    services = [f"svc-{i:02d}" for i in range(70)]
+    graph.add_dependency(Dependency(services[68], services[69]))
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    for i, service in enumerate(services):
+        graph.add_incident(IncidentNode(service, IncidentType.ERROR_SPIKE, start, 0.5))
+
+    chains = GraphQueries(graph).find_causal_chains(max_length=3)
+    assert [c.services for c in chains] == [["svc-69", "svc-68"]]
+
+
+def test_per_service_getters_use_the_indexes():
+    """Edges and incidents are found per service, duplicates are indexed once."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    graph = ServiceGraph(dependencies={Dependency("web", "api")})
+    graph.add_dependency(Dependency("api", "db"))
+    graph.add_dependency(Dependency("api", "db"))
+    graph.add_dependency(Dependency("api", "cache"))
+    graph.add_incident(IncidentNode("db", IncidentType.ERROR_SPIKE, start, 0.8))
+
+    assert [d.to_service for d in graph.get_dependencies_for_service("api")] == ["db", "cache"]
+    assert [d.from_service for d in graph.get_upstream_dependencies("api")] == ["web"]
+    assert [i.severity for i in graph.get_incidents_for_service("db")] == [0.8]
+    assert graph.get_incidents_for_service("api") == []
+
+
+def test_dependencies_behave_as_a_set():
+    """graph.dependencies yields Dependency objects and add()/discard() keep the indexes."""
+    graph = ServiceGraph(dependencies=[Dependency("web", "api")])
+    version = graph.version
+    graph.dependencies.add(Dependency("api", "db"))
+    graph.dependencies.add(Dependency("api", "db", weight=5.0))
+
+    assert [(d.from_service, d.to_service) for d in graph.dependencies] == [
+        ("web", "api"), ("api", "db"),
+    ]
+    assert Dependency("api", "db") in graph.dependencies
+    assert graph.dependencies == {Dependency("web", "api"), Dependency("api", "db")}
+    assert [d.to_service for d in graph.get_dependencies_for_service("api")] == ["db"]
+    assert graph.version > version
+
+    graph.dependencies.discard(Dependency("api", "db"))
+    assert len(graph.dependencies) == 1
+    assert graph.get_dependencies_for_service("api") == []
+    assert graph.get_upstream_dependencies("db") == []
+
+
+def test_severity_ranking_tracks_added_incidents():
+    """Totals are summed per service as incidents arrive; top_services() agrees."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    graph = ServiceGraph()
+    for service, severity in [("api", 0.4), ("db", 0.9), ("api", 0.6), ("cache", 0.2)]:
+        graph.add_incident(IncidentNode(service, IncidentType.ERROR_SPIKE, start, severity))
+
+    assert graph.get_services_sorted_by_incident_severity() == ["api", "db", "cache"]
+    assert graph.top_services(2) == ["api", "db"]
+
+
+def test_graph_json_matches_to_dict():
+    """to_json_bytes() encodes exactly the structure to_dict() returns."""
+    graph = ServiceGraph()
+    graph.add_dependency(Dependency("api", "db"))
+    graph.add_incident(IncidentNode(
+        "db", IncidentType.ERROR_SPIKE, datetime(2025, 11, 10, 10, 0, 0), 0.8, 'pool "main"\n'
+    ))
+
+    assert json.loads(graph.to_json_bytes()) == graph.to_dict()
+    assert json.loads(graph.to_json_bytes(indent=True)) == graph.to_dict()
+
+
+def test_queries_follow_graph_changes():
+    """Cached query results are reused until the graph changes, then recomputed."""
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    graph = ServiceGraph()
+    graph.add_dependency(Dependency("api", "db"))
+    graph.add_incident(IncidentNode("db", IncidentType.ERROR_SPIKE, start, 0.8))
+    queries = GraphQueries(graph)
+
+    assert queries.find_causal_chains() == []
+    assert queries.get_services_with_recent_changes() == []
+
+    graph.add_incident(IncidentNode("api", IncidentType.ERROR_SPIKE, start + timedelta(seconds=5)))
+    graph.add_incident(IncidentNode("api", IncidentType.DEPLOYMENT, start))
+    assert [c.services for c in queries.find_causal_chains()] == [["db", "api"]]
+    # Callers get their own chains; editing one leaves the cache intact
+    queries.find_causal_chains()[0].services.append("frontend")
+    assert [c.services for c in queries.find_causal_chains()] == [["db", "api"]]
+    assert queries.get_services_with_recent_changes() == ["api"]
+    assert queries.find_hotspot_services(1) == [("api", 1.0)]
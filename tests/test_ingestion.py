@@ -0,0 +1,181 @@
+"""
+Tests for the ingestion layer.
+"""
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from autorca_core.ingestion import load_configs, load_logs, load_metrics, load_traces
+from autorca_core.validation import IngestionLimits, PathTraversalError, sanitize_error_message
+
+
+def test_directory_sources_are_walked_recursively(tmp_path):
+    """Every supported file under a directory is loaded, including nested ones."""
+    logs = tmp_path / "logs"
+    (logs / "pod-b").mkdir(parents=True)
+    (logs / "a.jsonl").write_text(
+        '{"timestamp": "2025-11-10T10:00:00Z", "service": "api", "level": "ERROR", '
+        '"message": "a"}\n'
+    )
+    (logs / "pod-b" / "b.log").write_text("2025-11-10T10:00:01Z WARN db slow query\n")
+    (logs / "notes.md").write_text("not a log\n")
+
+    events = load_logs(str(logs))
+    assert [(e.service, e.message) for e in events] == [("api", "a"), ("db", "slow query")]
+
+    configs = tmp_path / "configs"
+    (configs / "nested").mkdir(parents=True)
+    (configs / "deploys.jsonl").write_text(
+        '{"timestamp": "2025-11-10T09:58:00Z", "service": "api", "type": "deploy"}\n'
+        '{"timestamp": "2025-11-10T10:02:00Z", "service": "api", "type": "config"}\n'
+    )
+    (configs / "nested" / "scale.yaml").write_text(
+        "timestamp: '2025-11-10T09:59:00Z'\nservice: db\nchange_type: scale\n"
+    )
+
+    changes = load_configs(str(configs))
+    assert [(c.service, c.change_type) for c in changes] == [
+        ("api", "deployment"),
+        ("db", "scaling"),
+        ("api", "config"),
+    ]
+
+
+def test_directory_files_are_checked_for_size_and_containment(tmp_path):
+    """Oversize files are skipped; a symlink leading outside the source is rejected."""
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / "big.log").write_text("2025-11-10T10:00:01Z WARN db slow query\n" * 50)
+    (logs / "small.log").write_text("2025-11-10T10:00:02Z ERROR api timeout\n")
+
+    events = load_logs(str(logs), limits=IngestionLimits(max_file_size_mb=0.001))
+    assert [e.service for e in events] == ["api"]
+
+    (tmp_path / "outside.log").write_text("2025-11-10T10:00:03Z ERROR db down\n")
+    os.symlink(tmp_path / "outside.log", logs / "link.log")
+    with pytest.raises(PathTraversalError):
+        load_logs(str(logs))
+
+
+def test_json_log_fields_use_preferred_present_key(tmp_path):
+    """Alternative key names are honoured, and an empty message is kept as is."""
+    log_file = tmp_path / "app.jsonl"
+    log_file.write_text(
+        '{"time": "2025-11-10T10:00:00Z", "service_name": "api", "msg": "timeout"}\n'
+        '{"timestamp": "2025-11-10T10:00:01Z", "service": "api", "message": "", "msg": "x"}\n'
+    )
+
+    first, second = load_logs(str(log_file))
+    assert (first.service, first.message) == ("api", "timeout")
+    assert second.message == ""
+
+
+def test_parallel_directory_load_matches_serial(tmp_path):
+    """Loading files in worker processes gives the same events in the same order."""
+    for shard in range(3):
+        (tmp_path / f"pod-{shard}.log").write_text("".join(
+            f"2025-11-10T10:00:{second:02d}Z ERROR svc-{shard} failure {second}\n"
+            for second in range(0, 60, 7)
+        ))
+
+    serial = load_logs(str(tmp_path))
+    parallel = load_logs(str(tmp_path), max_workers=2)
+    assert [(e.timestamp, e.service, e.message) for e in parallel] == [
+        (e.timestamp, e.service, e.message) for e in serial
+    ]
+
+
+def test_json_config_format_is_detected_from_content(tmp_path):
+    """Arrays, JSON Lines and single pretty-printed objects all load."""
+    (tmp_path / "array.json").write_text(
+        '  [{"timestamp": "2025-11-10T10:00:00Z", "service": "a", "type": "deploy"}]'
+    )
+    (tmp_path / "lines.jsonl").write_text(
+        '{"timestamp": "2025-11-10T10:01:00Z", "service": "b"}\n'
+        'not json\n'
+        '{"timestamp": "2025-11-10T10:02:00Z", "service": "c"}\n'
+    )
+    (tmp_path / "object.json").write_text(
+        '{\n  "timestamp": "2025-11-10T10:03:00Z",\n  "service": "d"\n}\n'
+    )
+
+    changes = load_configs(str(tmp_path))
+    assert [c.service for c in changes] == ["a", "b", "c", "d"]
+
+
+def test_raw_records_are_kept_only_on_request(tmp_path):
+    """raw_data is None by default and holds the decoded record with keep_raw."""
+    log_file = tmp_path / "app.jsonl"
+    log_file.write_text(
+        '{"timestamp": "2025-11-10T10:00:00Z", "service": "api", "message": "a", "pod": "p1"}\n'
+        "2025-11-10T10:00:01Z WARN db slow query\n"
+    )
+
+    events = load_logs(str(log_file))
+    assert [e.raw_data for e in events] == [None, None]
+    assert [dict(e.get_raw_data()) for e in events] == [{}, {}]
+    structured, text = load_logs(str(log_file), keep_raw=True)
+    assert structured.raw_data["pod"] == "p1"
+    assert text.raw_data == {"raw_line": "2025-11-10T10:00:01Z WARN db slow query"}
+
+
+def test_metric_rows_with_equal_tags_share_one_dict(tmp_path):
+    """Equal tag sets within a file are stored once; their values are unchanged."""
+    metrics_file = tmp_path / "metrics.jsonl"
+    metrics_file.write_text("".join(
+        f'{{"timestamp": "2025-11-10T10:00:0{i}Z", "service": "api", "metric_name": "cpu", '
+        f'"value": {i}, "tags": {{"host": "h{i % 2}"}}}}\n'
+        for i in range(4)
+    ))
+
+    points = load_metrics(str(metrics_file))
+    assert [p.tags for p in points] == [{"host": f"h{i % 2}"} for i in range(4)]
+    assert points[0].tags is points[2].tags
+
+
+def test_csv_metrics_columns_are_resolved_from_the_header(tmp_path):
+    """Alternative column names, missing optional columns and tag columns work."""
+    csv_file = tmp_path / "metrics.csv"
+    csv_file.write_text(
+        "time,metric,value,host\n"
+        "2025-11-10T10:00:00Z,cpu,3,h1\n"
+        "\n"
+        "2025-11-10T10:00:01Z,mem,4,h2\n"
+    )
+
+    points = load_metrics(str(csv_file))
+    assert [(p.service, p.metric_name, p.value, p.unit, p.tags) for p in points] == [
+        ("unknown", "cpu", 3.0, None, {"host": "h1"}),
+        ("unknown", "mem", 4.0, None, {"host": "h2"}),
+    ]
+
+
+def test_numeric_span_times_are_scaled_by_magnitude(tmp_path):
+    """Epoch timestamps in s/ms/us/ns and durations in ms/us/ns are normalized alike."""
+    trace_file = tmp_path / "spans.jsonl"
+    trace_file.write_text(
+        '{"span_id": "s", "startTime": 1762768800, "duration": 250}\n'
+        '{"span_id": "ms", "startTime": 1762768800000, "duration": 250}\n'
+        '{"span_id": "us", "startTime": 1762768800000000, "duration": 250000}\n'
+        '{"span_id": "ns", "startTime": 1762768800000000000, "duration": 250000000}\n'
+    )
+
+    spans = load_traces(str(trace_file))
+    start = datetime.fromtimestamp(1762768800)
+    assert [(s.span_id, s.timestamp, s.duration_ms) for s in spans] == [
+        ("s", start, 250.0),
+        ("ms", start, 250.0),
+        ("us", start, 250.0),
+        ("ns", start, 250.0),
+    ]
+
+
+def test_error_paths_are_redacted_relative_to_the_current_directory(tmp_path, monkeypatch):
+    """A relative path resolves against the working directory of each call."""
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / name)
+        error = OSError(f"cannot read {tmp_path / name / 'app.log'}")
+        assert sanitize_error_message(error, Path("app.log")) == "cannot read <file:app.log>"
@@ -0,0 +1,409 @@
+"""
+Tests for LLM prompt building and response parsing.
+"""
+import asyncio
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from autorca_core.cache import DiskResponseCache
+from autorca_core.model.graph import Dependency, IncidentNode, IncidentType, ServiceGraph
+from autorca_core.reasoning import llm
+from autorca_core.reasoning.llm import (
+    AnthropicLLM, AsyncAnthropicLLM, CachedLLM, DummyLLM,
+    _build_rca_context, _build_candidates_prompt, _parse_steps, _retry_delay,
+)
+from autorca_core.reasoning.rules import RootCauseCandidate
+
+
+class APIConnectionError(Exception):
+    """Stand-in for anthropic.APIConnectionError."""
+
+
+class APIStatusError(Exception):
+    """Stand-in for anthropic.APIStatusError, with a status and response headers."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+_FAKE_ANTHROPIC = SimpleNamespace(
+    APIStatusError=APIStatusError, APIConnectionError=APIConnectionError
+)
+
+
+def _usage():
+    return SimpleNamespace(input_tokens=10, output_tokens=5)
+
+
+def _response(text):
+    return SimpleNamespace(usage=_usage(), content=[SimpleNamespace(text=text)])
+
+
+class FakeStream:
+    """A messages.stream() context yielding scripted chunks, raising any exception among them."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @property
+    def text_stream(self):
+        for item in self.items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def get_final_message(self):
+        return SimpleNamespace(usage=_usage())
+
+
+class FakeClient:
+    """
+    A client whose calls work through a script of answers and errors.
+
+    messages.create() takes a text or an exception from the script;
+    messages.stream() takes a list of chunks (and exceptions) or an exception.
+    """
+
+    def __init__(self, *outcomes):
+        self.messages = self
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def _next(self, request):
+        self.requests.append(request)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def create(self, **request):
+        return _response(self._next(request))
+
+    def stream(self, **request):
+        return FakeStream(self._next(request))
+
+
+class FakeAsyncClient(FakeClient):
+    """FakeClient with an awaitable messages.create(), as on AsyncAnthropic."""
+
+    async def create(self, **request):
+        return FakeClient.create(self, **request)
+
+
+# Kept before the sleeps fixture replaces it, for fakes that need to yield to the loop
+_yield_to_loop = asyncio.sleep
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Fake the anthropic module and record backoff waits instead of sleeping."""
+    waits = []
+
+    async def asleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(llm, "_anthropic", lambda: _FAKE_ANTHROPIC)
+    monkeypatch.setattr(llm.time, "sleep", waits.append)
+    monkeypatch.setattr(llm.asyncio, "sleep", asleep)
+    return waits
+
+
+def _graph(seed: int) -> ServiceGraph:
+    rng = random.Random(seed)
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    dependencies = [Dependency(f"svc-{i}", f"svc-{i + 1}") for i in range(12)]
+    incidents = [
+        IncidentNode(f"svc-{i % 4}", IncidentType.ERROR_SPIKE, start + timedelta(minutes=i // 2))
+        for i in range(20)
+    ]
+    for items in (dependencies, incidents):
+        rng.shuffle(items)
+
+    graph = ServiceGraph(dependencies=dependencies)
+    for incident in incidents:
+        graph.add_incident(incident)
+    return graph
+
+
+def _prompt(seed: int) -> str:
+    candidates = [
+        RootCauseCandidate(f"svc-{i}", IncidentType.ERROR_SPIKE, 0.5 + i % 3 / 10,
+                           "errors  ", ["boom\r\n"], ["restart"])
+        for i in range(6)
+    ]
+    random.Random(seed).shuffle(candidates)
+    return _build_rca_context(_graph(seed)) + _build_candidates_prompt(candidates, "API 500s")
+
+
+def test_rca_prompt_is_canonical():
+    """Shuffled inputs give the same prompt, without trailing spaces or CRs."""
+    prompt = _prompt(0)
+    assert all(_prompt(seed) == prompt for seed in range(1, 5))
+    assert "\r" not in prompt
+    assert all(line == line.rstrip() for line in prompt.split("\n"))
+
+
+def test_cached_prefix_is_shared_across_symptoms():
+    """Reruns on the same graph with another symptom send the same cacheable prefix."""
+    client = FakeClient("first", "second")
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+    graph = _graph(0)
+    anthropic_llm.summarize_rca(graph, _CANDIDATES, "API 500s")
+    anthropic_llm.summarize_rca(graph, _CANDIDATES, "Checkout timeouts")
+
+    prefixes, prompts = zip(*(request["messages"][0]["content"] for request in client.requests))
+    assert prefixes[0] == prefixes[1] and "cache_control" in prefixes[0]
+    assert prompts[1]["text"].startswith("**Primary Symptom:** Checkout timeouts")
+
+
+def test_rca_context_fills_token_budget_by_priority():
+    """A budgeted context stays within budget and keeps the most severe incidents first."""
+    graph = _graph(0)
+    graph.incidents[0].severity = 0.9
+    small = _build_rca_context(graph, token_budget=150)
+    large = _build_rca_context(graph, token_budget=10_000)
+
+    assert len(small) // 4 <= 150
+    assert "(severity: 0.90)" in small
+    assert small.count("\n- ") < large.count("\n- ") == 12 + 20
+
+
+def test_list_items_are_parsed_without_markers():
+    """Numbered and bulleted lines are kept; prose, bold headings and empty items are not."""
+    text = "Steps:\n1. Roll back\n  2) Scale up  \n- 5xx alerts\n* Verify\n**Then**\n3.\n"
+    assert _parse_steps(text) == ["Roll back", "Scale up", "5xx alerts", "Verify"]
+
+
+def test_batched_remediation_answers_are_parsed_by_id():
+    """Answers map to candidates by id; empty, unknown and missing ids are left out."""
+    response = (
+        "Here you go:\n<answers>\n"
+        '<answer id="2">\n1. Roll back the deploy\n2. Verify error rate\n</answer>\n'
+        '<answer id="1">\nNo steps here\n</answer>\n'
+        '<answer id="9">\n1. Out of range\n</answer>\n'
+        "</answers>"
+    )
+    assert AnthropicLLM._parse_remediation_batch(response, 3) == {
+        1: ["Roll back the deploy", "Verify error rate"],
+    }
+
+
+def test_retry_delay_retries_only_transient_errors(sleeps):
+    """Connection errors and retryable statuses back off; Retry-After wins; 30s is the cap."""
+    assert _retry_delay(APIStatusError(400), 0) is None
+    assert _retry_delay(APIStatusError(401), 0) is None
+    assert _retry_delay(ValueError("bad"), 0) is None
+
+    assert 1 <= _retry_delay(APIStatusError(529), 0) < 2
+    assert 4 <= _retry_delay(APIConnectionError(), 2) < 5
+    assert _retry_delay(APIStatusError(429, {"retry-after": "7"}), 0) == 7.0
+    # A Retry-After date is not parsed; the usual backoff applies
+    assert 4 <= _retry_delay(APIStatusError(503, {"retry-after": "Wed, 21 Oct"}), 2) < 5
+
+    assert _retry_delay(APIStatusError(429, {"retry-after": "120"}), 0) == 30.0
+    assert _retry_delay(APIConnectionError(), 10) == 30.0
+
+
+def test_errors_are_classified_without_the_sdk(sleeps, monkeypatch):
+    """An injected client fails over to RuntimeError even when anthropic is not installed."""
+    def missing():
+        raise ImportError("No module named 'anthropic'")
+
+    monkeypatch.setattr(llm, "_anthropic", missing)
+    client = FakeClient(APIConnectionError(), APIStatusError(401))
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    with pytest.raises(RuntimeError, match="non-retryable"):
+        anthropic_llm._call_claude_with_retry("question")
+    assert len(client.requests) == 2 and len(sleeps) == 1
+
+
+def test_transient_errors_are_retried_until_a_response(sleeps):
+    """Retryable failures wait and try again; the server's Retry-After sets the wait."""
+    client = FakeClient(APIStatusError(429, {"retry-after": "7"}), APIConnectionError(), "ok")
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    assert anthropic_llm._call_claude_with_retry("question") == "ok"
+    assert len(client.requests) == 3
+    assert sleeps[0] == 7.0 and 2 <= sleeps[1] < 3
+    assert anthropic_llm.total_tokens_used == 15
+
+
+def test_non_retryable_errors_raise_at_once(sleeps):
+    """A rejected request is not repeated or waited on."""
+    client = FakeClient(APIStatusError(401), "unused")
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    with pytest.raises(RuntimeError, match="non-retryable"):
+        anthropic_llm._call_claude_with_retry("question")
+    assert len(client.requests) == 1
+    assert sleeps == []
+
+
+def test_retries_stop_after_max_retries(sleeps):
+    """Every attempt failing raises, without waiting after the last one."""
+    client = FakeClient(*[APIStatusError(529)] * 3)
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    with pytest.raises(RuntimeError, match="after 3 attempts"):
+        anthropic_llm._call_claude_with_retry("question")
+    assert len(client.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_stream_failing_before_the_first_chunk_is_retried(sleeps):
+    """Nothing has reached the caller yet, so the stream starts over."""
+    client = FakeClient([APIConnectionError()], APIStatusError(503), ["## Sum", "mary"])
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    assert list(anthropic_llm._stream_claude_with_retry("question")) == ["## Sum", "mary"]
+    assert len(client.requests) == 3 and len(sleeps) == 2
+    assert anthropic_llm.total_tokens_used == 15
+
+
+def test_stream_failing_part_way_raises_and_caches_nothing(sleeps, tmp_path):
+    """A retry would repeat text already yielded, so the stream stops and is not cached."""
+    client = FakeClient(["## Sum", APIConnectionError()], ["unused"])
+    anthropic_llm = AnthropicLLM(
+        api_key="test", client=client, response_cache=DiskResponseCache(tmp_path)
+    )
+
+    received = []
+    with pytest.raises(RuntimeError, match="part way"):
+        for text in anthropic_llm._stream_claude_with_retry("question"):
+            received.append(text)
+    assert received == ["## Sum"]
+    assert len(client.requests) == 1 and sleeps == []
+    assert anthropic_llm.response_cache.get(anthropic_llm._request_params("question")) is None
+
+
+_CANDIDATES = [RootCauseCandidate(
+    "db", IncidentType.RESOURCE_EXHAUSTION, 0.9, "pool exhausted", ["pool at 100%"], ["raise pool"]
+)]
+
+
+def _templated_summary():
+    return DummyLLM().summarize_rca(ServiceGraph(), _CANDIDATES, "API 500s")
+
+
+def test_failed_summaries_fall_back_and_are_counted(sleeps):
+    """Each summary method returns DummyLLM's summary when the API fails, and counts it."""
+    anthropic_llm = AsyncAnthropicLLM(
+        api_key="test",
+        client=FakeClient(APIStatusError(401), APIStatusError(401)),
+        async_client=FakeAsyncClient(APIStatusError(401)),
+    )
+    graph = ServiceGraph()
+
+    assert anthropic_llm.summarize_rca(graph, _CANDIDATES, "API 500s") == _templated_summary()
+    assert list(anthropic_llm.summarize_rca_stream(graph, _CANDIDATES, "API 500s")) == [
+        _templated_summary()
+    ]
+    summary = asyncio.run(anthropic_llm.asummarize_rca(graph, _CANDIDATES, "API 500s"))
+    assert summary == _templated_summary()
+    assert anthropic_llm.get_usage_stats()["fallback_summaries"] == 3
+
+
+def test_strict_summaries_raise_instead_of_falling_back(sleeps):
+    """With strict=True the API error reaches the caller from every summary method."""
+    anthropic_llm = AsyncAnthropicLLM(
+        api_key="test",
+        strict=True,
+        client=FakeClient(APIStatusError(401), APIStatusError(401)),
+        async_client=FakeAsyncClient(APIStatusError(401)),
+    )
+    graph = ServiceGraph()
+
+    with pytest.raises(RuntimeError, match="non-retryable"):
+        anthropic_llm.summarize_rca(graph, _CANDIDATES, "API 500s")
+    with pytest.raises(RuntimeError, match="non-retryable"):
+        list(anthropic_llm.summarize_rca_stream(graph, _CANDIDATES, "API 500s"))
+    with pytest.raises(RuntimeError, match="non-retryable"):
+        asyncio.run(anthropic_llm.asummarize_rca(graph, _CANDIDATES, "API 500s"))
+    assert anthropic_llm.fallback_summaries == 0
+
+
+def test_summary_stream_does_not_fall_back_once_started(sleeps):
+    """A stream that fails after its first chunk raises rather than appending a template."""
+    client = FakeClient(["## Sum", APIConnectionError()])
+    anthropic_llm = AnthropicLLM(api_key="test", client=client)
+
+    with pytest.raises(RuntimeError, match="part way"):
+        list(anthropic_llm.summarize_rca_stream(ServiceGraph(), _CANDIDATES, "API 500s"))
+    assert anthropic_llm.fallback_summaries == 0
+
+
+def test_cached_llm_does_not_store_fallback_summaries(sleeps):
+    """A fallback is returned but not cached, so the next request asks the API again."""
+    client = FakeClient(APIStatusError(401), ["## Summary"])
+    async_client = FakeAsyncClient(APIStatusError(401), "## Async summary")
+    cached = CachedLLM(AsyncAnthropicLLM(api_key="test", client=client, async_client=async_client))
+    graph = ServiceGraph()
+
+    assert cached.summarize_rca(graph, _CANDIDATES, "API 500s") == _templated_summary()
+    assert cached.cache_info()["entries"] == 0
+    assert cached.summarize_rca(graph, _CANDIDATES, "API 500s") == "## Summary"
+    assert cached.summarize_rca(graph, _CANDIDATES, "API 500s") == "## Summary"
+    assert len(client.requests) == 2
+
+    cached.clear()
+    for expected in (_templated_summary(), "## Async summary", "## Async summary"):
+        assert asyncio.run(cached.asummarize_rca(graph, _CANDIDATES, "API 500s")) == expected
+    assert len(async_client.requests) == 2
+    assert cached.cache_info()["entries"] == 1
+
+
+def test_async_batch_enhances_unanswered_candidates_concurrently(sleeps):
+    """Candidates the batch leaves out are enhanced one by one, within max_concurrency."""
+    services = ["api", "cache", "db", "queue"]
+
+    class BatchClient:
+        """Answers the batched prompt for candidate 2 only, after one 503 for the db."""
+
+        def __init__(self):
+            self.messages = self
+            self.prompts = []
+            self.in_flight = self.peak = 0
+
+        async def create(self, **request):
+            prompt = request["messages"][0]["content"]
+            self.prompts.append(prompt)
+            if "<answers>" in prompt:
+                return _response('<answers>\n<answer id="2">\n1. Warm cache\n</answer>\n</answers>')
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await _yield_to_loop(0)
+                service = next(s for s in services if f"Root Cause: {s} " in prompt)
+                if service == "db" and self.prompts.count(prompt) == 1:
+                    raise APIStatusError(503)
+                return _response(f"1. Fix {service}")
+            finally:
+                self.in_flight -= 1
+
+    client = BatchClient()
+    anthropic_llm = AsyncAnthropicLLM(
+        api_key="test", max_concurrency=2, client=FakeClient(), async_client=client
+    )
+    candidates = [
+        RootCauseCandidate(s, IncidentType.ERROR_SPIKE, 0.5, "errors", ["5xx"], ["restart"])
+        for s in services
+    ]
+
+    steps = asyncio.run(anthropic_llm.aenhance_remediation_batch(candidates))
+    assert steps == [["Fix api"], ["Warm cache"], ["Fix db"], ["Fix queue"]]
+    # One batched call, three single ones and the db's retry, two at a time at most
+    assert len(client.prompts) == 5
+    assert client.peak == 2
+    assert len(sleeps) == 1 and 1 <= sleeps[0] < 2
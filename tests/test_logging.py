@@ -0,0 +1,27 @@
+"""
+Tests for logging configuration.
+"""
+import json
+import logging
+
+from autorca_core.logging import JSONFormatter, get_logger
+
+
+def test_structured_log_lines_are_valid_json():
+    """Quotes, backslashes and newlines in messages are escaped, not interpolated."""
+    record = logging.LogRecord(
+        "autorca_core.test", logging.WARNING, __file__, 1,
+        'bad "value" in %s\nnext line', ("C:\\logs",), None, func="loader",
+    )
+
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry["level"] == "WARNING"
+    assert entry["function"] == "loader"
+    assert entry["message"] == 'bad "value" in C:\\logs\nnext line'
+
+
+def test_module_loggers_are_not_prefixed_twice():
+    """Module names inside the package are used as is; other names are nested."""
+    assert get_logger("autorca_core.ingestion.logs").name == "autorca_core.ingestion.logs"
+    assert get_logger("ingestion").name == "autorca_core.ingestion"
+    assert get_logger().name == "autorca_core"
@@ -2,7 +2,8 @@
 Tests for parsing module.
 """
 import pytest
-from adapt_rca.parsing.log_parser import normalize_event
+from adapt_rca.parsing.log_parser import normalize_event, normalize_events_batch
+from adapt_rca.reasoning.agent import analyze_incident
 
 
 def test_normalize_event_basic():
@@ -63,3 +64,28 @@ def test_normalize_event_missing_fields():
     assert normalized["service"] is None
     assert normalized["level"] is None
     assert normalized["message"] == "Incomplete log"
+
+
+def test_normalize_event_level_from_message():
+    """Without a level field, a level word in the message is used."""
+    assert normalize_event({"message": "db ERROR: pool exhausted"})["level"] == "ERROR"
+    assert normalize_event({"level": "INFO", "message": "WARN later"})["level"] == "INFO"
+    assert normalize_event({"message": "ERRORS are not levels"})["level"] is None
+
+
+def test_event_batch_matches_normalize_event():
+    """A batch yields the same events as normalize_event() and the same analysis."""
+    raws = [
+        {"timestamp": "2025-11-16T10:00:00Z", "service": "api", "level": "ERROR", "message": "a"},
+        {"component": "db", "severity": "WARN", "message": "b"},
+        {"message": "c"},
+        {"service": "api", "level": "ERROR", "message": "d"},
+        {"service": "db", "message": "pool: ERROR timeout"},
+    ]
+
+    batch = normalize_events_batch(raws)
+
+    assert len(batch) == 5
+    assert list(batch) == [normalize_event(raw) for raw in raws]
+    assert batch.distinct_services() == ["api", "db"]
+    assert analyze_incident(batch) == analyze_incident(list(batch))
@@ -91,3 +91,43 @@ def test_rca_basic_functionality():
 
     # Should have at least one candidate due to error spike
     assert len(candidates) >= 1
+
+
+def test_recent_change_evidence_is_limited_to_the_window():
+    """Only incidents strictly within the correlation window back a change, in added order."""
+    from datetime import timedelta
+    from autorca_core.model.graph import IncidentNode, IncidentType, ServiceGraph
+    from autorca_core.reasoning.rules import apply_rules
+
+    deploy = datetime(2025, 11, 10, 10, 0, 0)
+    graph = ServiceGraph()
+    graph.add_incident(IncidentNode("api", IncidentType.DEPLOYMENT, deploy, description="deploy"))
+    for offset, name in [(300, "late"), (600, "edge"), (-60, "early"), (-601, "old"), (5, "soon")]:
+        graph.add_incident(IncidentNode(
+            "api", IncidentType.ERROR_SPIKE, deploy + timedelta(seconds=offset), description=name
+        ))
+
+    change = next(c for c in apply_rules(graph) if c.incident_type == IncidentType.DEPLOYMENT)
+    assert change.evidence == ["deploy", "late", "early", "soon"]
+
+
+def test_rule_results_are_reused_until_the_graph_changes():
+    """A repeat call returns a copy of the cached candidates; adding an incident recomputes."""
+    from autorca_core.model.graph import IncidentNode, IncidentType, ServiceGraph
+    from autorca_core.reasoning.rules import apply_rules
+
+    start = datetime(2025, 11, 10, 10, 0, 0)
+    graph = ServiceGraph()
+    graph.add_incident(IncidentNode("db", IncidentType.RESOURCE_EXHAUSTION, start, 0.9))
+
+    first = apply_rules(graph)
+    second = apply_rules(graph)
+    assert second == first and second[0] is not first[0]
+
+    # Editing a returned candidate leaves the cached result alone
+    second[0].confidence = 0.0
+    second[0].evidence.append("edited")
+    assert apply_rules(graph) == first
+
+    graph.add_incident(IncidentNode("api", IncidentType.RESOURCE_EXHAUSTION, start, 0.9))
+    assert [c.service for c in apply_rules(graph)] == ["db", "api"]